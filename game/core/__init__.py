@@ -4,5 +4,8 @@ Core game systems
 from .settings import *
 from .utils import *
 from .timer import Timer, Stopwatch
+from .log import get_log
 from .state import GameState, StateStack
-from .transition import FadeTransition
+
+# The transition is only needed once the first state change happens
+__getattr__ = lazy_exports(__name__, {'FadeTransition': '.transition'})
@@ -0,0 +1,138 @@
+"""
+Background file writer: keeps save I/O off the frame path
+"""
+import atexit
+import os
+import threading
+import time
+from game.core.log import get_log
+from game.core.telemetry import telemetry
+
+_log = get_log('io')
+
+
+class BackgroundWriter:
+    """Worker thread that performs file writes queued by the game loop
+
+    - replace(path, serialize): atomically replace a whole file. A replace
+      supersedes anything still queued for the same path, so bursts of
+      saves are coalesced into one write.
+    - append(path, data): append bytes to a file.
+    Operations run in submission order. `serialize` is called on the worker
+    thread and must return bytes.
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay  # Seconds to wait for more requests before writing
+        self._cond = threading.Condition()
+        self._ops = []  # (path, kind, payload) in submission order
+        self._busy = False
+        self._thread = None
+
+    def _start(self):
+        """Start the worker thread on first use"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='background-writer', daemon=True)
+            self._thread.start()
+
+    def replace(self, path, serialize):
+        """Queue an atomic rewrite of `path`"""
+        with self._cond:
+            self._ops = [op for op in self._ops if op[0] != path]
+            self._ops.append((path, 'replace', serialize))
+            self._start()
+            self._cond.notify_all()
+
+    def append(self, path, data):
+        """Queue bytes to append to `path`"""
+        with self._cond:
+            self._ops.append((path, 'append', data))
+            self._start()
+            self._cond.notify_all()
+
+    def cancel(self, path):
+        """Drop any queued writes for `path`"""
+        with self._cond:
+            self._ops = [op for op in self._ops if op[0] != path]
+
+    def pending(self, path=None):
+        """True if writes are queued (for `path`, or at all)"""
+        with self._cond:
+            if path is None:
+                return bool(self._ops or self._busy)
+            return any(op[0] == path for op in self._ops)
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far is on disk; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._ops:
+                self._start()
+            self._cond.notify_all()
+            while self._ops or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            with self._cond:
+                while not self._ops:
+                    self._cond.wait()
+            if self.delay > 0:
+                time.sleep(self.delay)  # Let bursts of requests coalesce
+
+            with self._cond:
+                ops, self._ops = self._ops, []
+                self._busy = True
+
+            try:
+                for path, kind, payload in ops:
+                    started = time.perf_counter()
+                    if kind == 'replace':
+                        self._write_replace(path, payload)
+                        telemetry.timing('save_io', time.perf_counter() - started)
+                    else:
+                        self._write_append(path, payload)
+                        telemetry.timing('append_io', time.perf_counter() - started)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    @staticmethod
+    def _write_replace(path, serialize):
+        """Write to a temp file next to `path`, then rename over it"""
+        tmp_path = f"{path}.tmp"
+        try:
+            data = serialize()
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            _log.error("Background write of %s failed: %s", path, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _write_append(path, data):
+        """Append bytes to `path`"""
+        try:
+            with open(path, 'ab') as f:
+                f.write(data)
+        except Exception as e:
+            _log.error("Background append to %s failed: %s", path, e)
+
+
+# Shared writer for the whole game
+writer = BackgroundWriter(delay=0.1)
+
+# Don't lose queued writes if the game exits without an explicit flush
+atexit.register(writer.flush, 5.0)
@@ -0,0 +1,76 @@
+"""
+Garbage collector policy for gameplay
+
+Python's cyclic GC otherwise runs whenever allocations cross its thresholds,
+which mid-level means at arbitrary frames. During a level:
+- everything alive right after the level is built is frozen (gc.freeze), so
+  collections don't keep re-scanning the tile map, sprites and entities;
+- generation thresholds are raised (settings.GC_GAMEPLAY_THRESHOLDS);
+- full collections happen at safe points instead: transitions, pause and
+  (young generations only) checkpoints.
+Leaving gameplay unfreezes and puts the default thresholds back.
+Pause times are measured by the gc.callbacks hook in game.core.hitch.
+"""
+import gc
+import time
+from game.core import settings
+from game.core.log import get_log
+from game.core.hitch import hitches
+
+_log = get_log('gc')
+
+
+class GcPolicy:
+    """Switches the collector between menu and gameplay behaviour"""
+
+    def __init__(self):
+        self.enabled = False
+        self.default_thresholds = gc.get_threshold()
+        self.level = None  # Level whose objects are frozen
+        self.safe_points = 0
+        self.last_safe_point = None  # (reason, seconds)
+
+    def start(self):
+        self.enabled = True
+        hitches.gc.install()  # Pause instrumentation, shown in the profiler overlay
+
+    def enter_gameplay(self, level):
+        """LevelState.enter: freeze the freshly built level and raise thresholds"""
+        if not self.enabled:
+            return
+        if level is not self.level:
+            # New level: let the old one go, then freeze what's alive now
+            gc.unfreeze()
+            self._collect('level load')
+            gc.freeze()
+            self.level = level
+            _log.debug("Froze %d objects for level %s", gc.get_freeze_count(), getattr(level, 'level_id', '?'))
+        gc.set_threshold(*settings.GC_GAMEPLAY_THRESHOLDS)
+
+    def leave_gameplay(self):
+        """Menus: unfreeze, default thresholds and a full collection"""
+        if not self.enabled:
+            return
+        gc.set_threshold(*self.default_thresholds)
+        if self.level is not None:
+            self.level = None
+            gc.unfreeze()
+        self._collect('menu')
+
+    def safe_point(self, reason, generation=2):
+        """Collect now, while a frame hitch wouldn't be noticed"""
+        if self.enabled:
+            self._collect(reason, generation)
+
+    def _collect(self, reason, generation=2):
+        start = time.perf_counter()
+        gc.collect(generation)
+        seconds = time.perf_counter() - start
+        self.safe_points += 1
+        self.last_safe_point = (reason, seconds)
+        if _log.on_debug:
+            _log.debug("Collected generation %d at %s in %.2f ms", generation, reason, seconds * 1000)
+
+
+# Shared policy for the whole game
+gc_policy = GcPolicy()
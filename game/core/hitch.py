@@ -0,0 +1,184 @@
+"""
+Hitch detector: diagnostic snapshots of frames that blew the frame budget
+
+The main loop brackets every frame with begin_frame()/end_frame(); code in
+between calls mark('name') when a subsystem is done, which records the time
+since the previous mark. The last settings.HITCH_HISTORY frames are kept.
+When a frame takes longer than settings.HITCH_BUDGET, a record with that
+history, the state stack, entity counts, GC activity and the latest log
+events is appended to settings.HITCH_FILE (on the background writer).
+Frames that start or end with a state whose watch_hitches is False on top
+(the loading screen) are kept in the history but never snapshotted.
+"""
+import gc
+import json
+import time
+from collections import deque
+from game.core import settings
+from game.core import log
+from game.core.background_io import writer
+
+_log = log.get_log('hitch')
+
+
+class GcPauses:
+    """gc.callbacks hook: collections and pause time, per frame and in total"""
+
+    def __init__(self):
+        self.frame_time = 0.0
+        self.frame_collections = [0, 0, 0]
+        self.total_time = 0.0
+        self.total_collections = [0, 0, 0]
+        self.max_pause = 0.0
+        self.last_pause = 0.0
+        self._start = None
+
+    def install(self):
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def uninstall(self):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase, info):
+        if phase == 'start':
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            pause = time.perf_counter() - self._start
+            self._start = None
+            generation = info['generation']
+            self.frame_time += pause
+            self.frame_collections[generation] += 1
+            self.total_time += pause
+            self.total_collections[generation] += 1
+            self.last_pause = pause
+            if pause > self.max_pause:
+                self.max_pause = pause
+
+    def take_frame(self):
+        """(pause seconds, collections per generation) since the last call"""
+        frame = (self.frame_time, tuple(self.frame_collections))
+        self.frame_time = 0.0
+        self.frame_collections = [0, 0, 0]
+        return frame
+
+
+class HitchDetector:
+    """Per-frame section timings plus snapshots of the frames over budget"""
+
+    def __init__(self):
+        self.enabled = False
+        self.stack = None
+        self.budget = settings.HITCH_BUDGET
+        self.path = settings.HITCH_FILE
+        self.frames = deque(maxlen=settings.HITCH_HISTORY)  # (seconds, sections, gc seconds, gc collections)
+        self.sections = []  # (name, seconds) so far this frame
+        self.gc = GcPauses()
+        self.hitches = 0
+        self.records = 0
+        self._last_mark = None  # Stays None while disabled, so mark() is a no-op
+        self._frame_end = None
+        self._last_record = None
+        self._watched = False  # Whether the top state watched hitches when the frame began
+
+    def start(self, stack, budget=None):
+        """Begin watching frames of this state stack"""
+        self.stack = stack
+        if budget:
+            self.budget = budget
+        self.gc.install()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        self._last_mark = None
+        self.gc.uninstall()
+
+    def begin_frame(self):
+        """Right after the clock tick; the wait since the last frame counts as 'tick'"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.sections = [('tick', now - self._frame_end)] if self._frame_end is not None else []
+        self._last_mark = now
+        self._watched = self._watching()
+
+    def _watching(self):
+        state = self.stack.current_state() if self.stack else None
+        return state is None or state.watch_hitches
+
+    def mark(self, name):
+        """A subsystem just finished: record the time since the previous mark"""
+        if self._last_mark is None:
+            return
+        now = time.perf_counter()
+        self.sections.append((name, now - self._last_mark))
+        self._last_mark = now
+
+    def end_frame(self):
+        """After the flip: keep the frame and snapshot it if it went over budget"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        previous_end, self._frame_end = self._frame_end, now
+        gc_time, gc_collections = self.gc.take_frame()
+        if previous_end is None:
+            return  # Nothing to measure the first frame against
+        seconds = now - previous_end
+        self.frames.append((seconds, self.sections, gc_time, gc_collections))
+        if seconds > self.budget and self._watched and self._watching():
+            self.hitches += 1
+            self._snapshot(seconds, now)
+
+    def _snapshot(self, seconds, now):
+        if self.records >= settings.HITCH_MAX_RECORDS:
+            return
+        if self._last_record is not None and now - self._last_record < settings.HITCH_COOLDOWN:
+            return
+        self._last_record = now
+        self.records += 1
+
+        frames = [self._frame_record(frame) for frame in self.frames]
+        slowest = max(self.sections, key=lambda section: section[1])[0] if self.sections else '?'
+        stack = self.stack
+        states = stack.states if stack else []
+        record = {
+            'time': round(time.time(), 3),
+            'frame_ms': round(seconds * 1000, 3),
+            'budget_ms': round(self.budget * 1000, 3),
+            'slowest': slowest,
+            'states': [type(state).__name__ for state in states],
+            'transition': bool(stack and stack.transition),
+            'diagnostics': {type(state).__name__: state.diagnostics() for state in states},
+            'gc': {
+                'counts': gc.get_count(),
+                'thresholds': gc.get_threshold(),
+                'frozen': gc.get_freeze_count(),
+                'collections': self.gc.total_collections,
+                'pause_ms': round(self.gc.total_time * 1000, 3),
+                'max_pause_ms': round(self.gc.max_pause * 1000, 3)
+            },
+            'frames': frames,
+            'log': log.recent(settings.HITCH_LOG_EVENTS)
+        }
+        writer.append(self.path, (json.dumps(record, separators=(',', ':')) + '\n').encode())
+        _log.info("Hitch: %.0f ms frame (slowest section: %s), snapshot %d written to %s",
+                  seconds * 1000, slowest, self.records, self.path)
+
+    @staticmethod
+    def _frame_record(frame):
+        seconds, sections, gc_time, gc_collections = frame
+        timings = {}
+        for name, duration in sections:
+            timings[name] = timings.get(name, 0.0) + duration
+        record = {'ms': round(seconds * 1000, 3), 'sections': {name: round(duration * 1000, 3)
+                                                               for name, duration in timings.items()}}
+        if gc_time:
+            record['gc_ms'] = round(gc_time * 1000, 3)
+            record['gc'] = gc_collections
+        return record
+
+
+# Shared detector for the whole game
+hitches = HitchDetector()
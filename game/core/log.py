@@ -0,0 +1,152 @@
+"""
+Debug logging: per-category levels and an in-memory trace ring
+
+    _log = get_log('camera')
+    if _log.on_debug:  # One attribute read when the category is quiet
+        _log.debug("Shake offset %.2f", offset)
+
+Every enabled event goes into a fixed-size ring (formatted only when it is
+dumped); events at or above the echo level are also printed. The ring is
+written out on demand (dump(), F9 in game) and when the game crashes.
+Levels per category come from settings.LOG_LEVELS or --log=camera:debug,...
+"""
+import sys
+import time
+import threading
+from collections import deque
+from game.core import settings
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: 'debug', INFO: 'info', WARNING: 'warning', ERROR: 'error', OFF: 'off'}
+_LEVELS_BY_NAME = {name: level for level, name in LEVEL_NAMES.items()}
+
+_start_time = time.perf_counter()
+_ring = deque(maxlen=settings.LOG_RING_SIZE)  # (seconds, category, level, message, args)
+_channels = {}
+_levels = {category: _LEVELS_BY_NAME[name] for category, name in settings.LOG_LEVELS.items() if category != '*'}
+_default_level = _LEVELS_BY_NAME[settings.LOG_LEVELS.get('*', 'info')]
+_echo_level = _LEVELS_BY_NAME[settings.LOG_ECHO_LEVEL]
+
+
+class Channel:
+    """Log for one category; on_<level> flags say whether that level is recorded"""
+
+    def __init__(self, name, level):
+        self.name = name
+        self.set_level(level)
+
+    def set_level(self, level):
+        self.level = level
+        self.on_debug = level <= DEBUG
+        self.on_info = level <= INFO
+        self.on_warning = level <= WARNING
+        self.on_error = level <= ERROR
+
+    def _record(self, level, message, args):
+        _ring.append((time.perf_counter() - _start_time, self.name, level, message, args))
+        if level >= _echo_level:
+            print(_format(self.name, level, message, args))
+
+    def debug(self, message, *args):
+        if self.on_debug:
+            self._record(DEBUG, message, args)
+
+    def info(self, message, *args):
+        if self.on_info:
+            self._record(INFO, message, args)
+
+    def warning(self, message, *args):
+        if self.on_warning:
+            self._record(WARNING, message, args)
+
+    def error(self, message, *args):
+        if self.on_error:
+            self._record(ERROR, message, args)
+
+
+def _format(category, level, message, args):
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            message = f"{message} {args!r}"
+    return f"[{LEVEL_NAMES[level]}] {category}: {message}"
+
+
+def get_log(category):
+    """The channel for a category (created at the configured level)"""
+    channel = _channels.get(category)
+    if channel is None:
+        channel = _channels[category] = Channel(category, _levels.get(category, _default_level))
+    return channel
+
+
+def set_level(category, level):
+    """Change a category's level ('*' for categories without one of their own)"""
+    global _default_level
+    if isinstance(level, str):
+        level = _LEVELS_BY_NAME[level.lower()]
+    if category == '*':
+        _default_level = level
+        for name, channel in _channels.items():
+            if name not in _levels:
+                channel.set_level(level)
+    else:
+        _levels[category] = level
+        get_log(category).set_level(level)
+
+
+def configure(spec):
+    """Apply a level spec like 'camera:debug,level:debug,*:warning' (--log=...)"""
+    for part in spec.split(','):
+        if part.strip():
+            category, _, level = part.partition(':')
+            set_level(category.strip(), level.strip() or 'debug')
+
+
+def recent(count=None):
+    """The last `count` ring entries as formatted lines (oldest first)"""
+    entries = list(_ring)
+    if count is not None:
+        entries = entries[-count:]
+    return [f"{seconds:9.3f} {_format(category, level, message, args)}"
+            for seconds, category, level, message, args in entries]
+
+
+def dump(path=None, reason=None):
+    """Write the ring to a file (settings.LOG_DUMP_FILE by default); returns the path"""
+    path = path or settings.LOG_DUMP_FILE
+    with open(path, 'w') as f:
+        if reason:
+            f.write(f"{reason}\n\n")
+        f.write('\n'.join(recent()) + '\n')
+    return path
+
+
+def install_crash_dump():
+    """Dump the ring when an uncaught exception ends the game or a worker thread"""
+    previous_hook = sys.excepthook
+    previous_thread_hook = threading.excepthook
+
+    def crash_hook(exc_type, exc, tb):
+        try:
+            dump(reason=f"Crash: {exc_type.__name__}: {exc}")
+        except OSError:
+            pass
+        previous_hook(exc_type, exc, tb)
+
+    def thread_crash_hook(hook_args):
+        try:
+            dump(reason=f"Crash in thread {hook_args.thread.name if hook_args.thread else '?'}: "
+                        f"{hook_args.exc_type.__name__}: {hook_args.exc_value}")
+        except OSError:
+            pass
+        previous_thread_hook(hook_args)
+
+    sys.excepthook = crash_hook
+    threading.excepthook = thread_crash_hook
@@ -0,0 +1,227 @@
+"""Append-only history of every level attempt"""
+import json
+import os
+import threading
+from datetime import datetime
+from game.core.background_io import writer
+
+
+class RunHistory:
+    """Records every attempt in a JSONL log with a small index file
+
+    Log line (one per attempt):
+    {"level": 2, "outcome": "win", "time": 83.4, "deaths": 3,
+     "splits": [12.1, 40.7], "coins": 14, "at": "2025-01-01T12:00:00"}
+
+    The index keeps per-level summaries (attempts, wins, best time, best run,
+    best split per checkpoint) and the byte offsets of the latest records, so
+    "best splits for level 2" or "last 50 attempts" never read the whole log.
+    Appends and index rewrites go through the background writer. When the log
+    grows past COMPACT_AFTER records it is rewritten with only the latest
+    KEEP_RECENT records plus each level's best run.
+    """
+
+    LOG_FILE = "run_history.jsonl"
+    INDEX_FILE = "run_history_index.json"
+
+    RECENT_LIMIT = 100  # Records whose offsets the index keeps
+    COMPACT_AFTER = 1000
+    KEEP_RECENT = 100
+
+    _index = None
+    _recent = None  # Latest records (loaded lazily from the log tail)
+    _lock = threading.RLock()
+
+    @staticmethod
+    def _empty_index():
+        return {
+            'version': 1,
+            'count': 0,
+            'size': 0,
+            'offsets': [],
+            'levels': {}
+        }
+
+    @staticmethod
+    def _load_index():
+        """Internal: Get the index, rebuilding it from the log if it's missing or stale"""
+        if RunHistory._index is not None:
+            return RunHistory._index
+
+        index = None
+        try:
+            with open(RunHistory.INDEX_FILE, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        log_size = os.path.getsize(RunHistory.LOG_FILE) if os.path.exists(RunHistory.LOG_FILE) else 0
+        if not index or index.get('version') != 1 or index.get('size') != log_size:
+            index = RunHistory._rebuild_index()
+            writer.replace(RunHistory.INDEX_FILE, RunHistory._serialize_index)
+
+        RunHistory._index = index
+        return index
+
+    @staticmethod
+    def _rebuild_index():
+        """Internal: Scan the whole log once (only after a crash or manual edit)"""
+        index = RunHistory._empty_index()
+        if not os.path.exists(RunHistory.LOG_FILE):
+            return index
+
+        offset = 0
+        with open(RunHistory.LOG_FILE, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if record:
+                    RunHistory._index_record(index, record, offset)
+                offset += len(line)
+        index['size'] = offset
+        return index
+
+    @staticmethod
+    def _index_record(index, record, offset):
+        """Internal: Fold one record into the index"""
+        index['count'] += 1
+        index['offsets'].append(offset)
+        del index['offsets'][:-RunHistory.RECENT_LIMIT]
+
+        level_key = str(record['level'])
+        summary = index['levels'].setdefault(level_key, {
+            'attempts': 0,
+            'wins': 0,
+            'deaths': 0,
+            'best_time': None,
+            'best_run': None,
+            'best_splits': []
+        })
+        summary['attempts'] += 1
+        summary['deaths'] += record.get('deaths', 0)
+
+        # Best time reached at each checkpoint, over every attempt
+        best_splits = summary['best_splits']
+        for i, split in enumerate(record.get('splits', [])):
+            if i >= len(best_splits):
+                best_splits.append(split)
+            elif split < best_splits[i]:
+                best_splits[i] = split
+
+        if record.get('outcome') == 'win':
+            summary['wins'] += 1
+            if summary['best_time'] is None or record['time'] < summary['best_time']:
+                summary['best_time'] = record['time']
+                summary['best_run'] = record
+
+    @staticmethod
+    def _serialize_index():
+        """Internal: Encode the index (runs on the writer thread)"""
+        with RunHistory._lock:
+            return json.dumps(RunHistory._index).encode('utf-8')
+
+    @staticmethod
+    def _read_recent():
+        """Internal: Load the records the index has offsets for"""
+        index = RunHistory._load_index()
+        if writer.pending(RunHistory.LOG_FILE):
+            writer.flush()
+
+        records = []
+        if index['offsets'] and os.path.exists(RunHistory.LOG_FILE):
+            with open(RunHistory.LOG_FILE, 'rb') as f:
+                f.seek(index['offsets'][0])
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        pass
+        return records
+
+    @staticmethod
+    def record(level_id, outcome, time, deaths=0, splits=None, coins=0):
+        """Record one attempt ('win' or 'quit')"""
+        record = {
+            'level': level_id,
+            'outcome': outcome,
+            'time': round(time, 3),
+            'deaths': deaths,
+            'splits': [round(split, 3) for split in (splits or [])],
+            'coins': coins,
+            'at': datetime.now().isoformat(timespec='seconds')
+        }
+        line = (json.dumps(record) + '\n').encode('utf-8')
+
+        with RunHistory._lock:
+            index = RunHistory._load_index()
+            if RunHistory._recent is None:
+                RunHistory._recent = RunHistory._read_recent()
+
+            RunHistory._index_record(index, record, index['size'])
+            index['size'] += len(line)
+            RunHistory._recent.append(record)
+            del RunHistory._recent[:-RunHistory.RECENT_LIMIT]
+
+            if index['count'] > RunHistory.COMPACT_AFTER:
+                RunHistory._compact()
+            else:
+                writer.append(RunHistory.LOG_FILE, line)
+            writer.replace(RunHistory.INDEX_FILE, RunHistory._serialize_index)
+        return record
+
+    @staticmethod
+    def _compact():
+        """Internal: Rewrite the log with the latest records plus every level's best run"""
+        index = RunHistory._index
+        recent = RunHistory._recent[-RunHistory.KEEP_RECENT:]
+        best_runs = [summary['best_run'] for summary in index['levels'].values()
+                     if summary['best_run'] is not None and summary['best_run'] not in recent]
+
+        # Per-level summaries survive compaction; only the record list shrinks
+        lines = [(json.dumps(record) + '\n').encode('utf-8') for record in best_runs + recent]
+        offsets = []
+        offset = 0
+        for line in lines:
+            offsets.append(offset)
+            offset += len(line)
+        index['count'] = len(lines)
+        index['size'] = offset
+        index['offsets'] = offsets[-RunHistory.RECENT_LIMIT:]
+        RunHistory._recent = (best_runs + recent)[-RunHistory.RECENT_LIMIT:]
+
+        content = b''.join(lines)
+        writer.replace(RunHistory.LOG_FILE, lambda: content)
+
+    @staticmethod
+    def recent(limit=50, level_id=None):
+        """Latest attempts, newest first (optionally only for one level)"""
+        with RunHistory._lock:
+            if RunHistory._recent is None:
+                RunHistory._recent = RunHistory._read_recent()
+            records = RunHistory._recent
+            if level_id is not None:
+                records = [record for record in records if record['level'] == level_id]
+            return list(reversed(records[-limit:]))
+
+    @staticmethod
+    def get_level_summary(level_id):
+        """Attempts, wins, deaths, best time/run and best splits for a level"""
+        with RunHistory._lock:
+            summary = RunHistory._load_index()['levels'].get(str(level_id))
+            if summary is None:
+                return {
+                    'attempts': 0,
+                    'wins': 0,
+                    'deaths': 0,
+                    'best_time': None,
+                    'best_run': None,
+                    'best_splits': []
+                }
+            return summary
+
+    @staticmethod
+    def best_splits(level_id):
+        """Best time reached at each checkpoint of a level"""
+        return list(RunHistory.get_level_summary(level_id)['best_splits'])
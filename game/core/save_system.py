@@ -1,7 +1,12 @@
 """Save/Load system for game progress tracking"""
 import json
 import os
+import threading
 from datetime import datetime
+from game.core.background_io import writer
+from game.core.log import get_log
+
+_log = get_log('save')
 
 
 class SaveSystem:
@@ -32,120 +37,148 @@ class SaveSystem:
     
     SAVE_FILE = "save_game.json"
     
+    # Process-wide cache: the file is read once, then every query is served
+    # from memory and writes are coalesced on the background writer thread
+    _cache = None
+    _cache_path = None
+    _lock = threading.RLock()
+    
+    @staticmethod
+    def _default_data():
+        return {
+            'unlocked_levels': [1],
+            'current_level': None,
+            'levels': {}
+        }
+    
     @staticmethod
     def _load_data():
-        """Internal: Load raw save data"""
-        if not os.path.exists(SaveSystem.SAVE_FILE):
-            return {
-                'unlocked_levels': [1],
-                'current_level': None,
-                'levels': {}
-            }
+        """Internal: Get the cached save data (loaded from disk on first use)"""
+        if SaveSystem._cache is not None and SaveSystem._cache_path == SaveSystem.SAVE_FILE:
+            return SaveSystem._cache
         
-        try:
-            with open(SaveSystem.SAVE_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Failed to load save: {e}")
-            return {
-                'unlocked_levels': [1],
-                'current_level': None,
-                'levels': {}
-            }
+        with SaveSystem._lock:
+            # Another thread (state prepare) may have loaded it while we waited
+            if SaveSystem._cache is not None and SaveSystem._cache_path == SaveSystem.SAVE_FILE:
+                return SaveSystem._cache
+            SaveSystem._cache_path = SaveSystem.SAVE_FILE
+            if not os.path.exists(SaveSystem.SAVE_FILE):
+                SaveSystem._cache = SaveSystem._default_data()
+                return SaveSystem._cache
+            
+            try:
+                with open(SaveSystem.SAVE_FILE, 'r') as f:
+                    SaveSystem._cache = json.load(f)
+            except Exception as e:
+                _log.error("Failed to load save: %s", e)
+                SaveSystem._cache = SaveSystem._default_data()
+            return SaveSystem._cache
     
     @staticmethod
     def _save_data(data):
-        """Internal: Save raw data"""
-        try:
-            with open(SaveSystem.SAVE_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Failed to save: {e}")
-            return False
+        """Internal: Update the cache and queue a write to disk"""
+        with SaveSystem._lock:
+            SaveSystem._cache = data
+            SaveSystem._cache_path = SaveSystem.SAVE_FILE
+        writer.replace(SaveSystem.SAVE_FILE, SaveSystem._serialize)
+        return True
+    
+    @staticmethod
+    def _serialize():
+        """Internal: Encode the cache (runs on the writer thread)"""
+        with SaveSystem._lock:
+            return json.dumps(SaveSystem._cache, indent=2).encode('utf-8')
+    
+    @staticmethod
+    def flush(timeout=None):
+        """Block until queued saves are on disk (call on exit)"""
+        return writer.flush(timeout)
     
     @staticmethod
     def save_game(player_data, level_data, game_time, coins_collected, enemies_defeated, boss_data=None, entities_data=None):
         """Save current game state for resuming later"""
-        try:
-            data = SaveSystem._load_data()
+        with SaveSystem._lock:
+            try:
+                data = SaveSystem._load_data()
             
-            # Store the game state for resuming
-            data['game_state'] = {
-                'player': player_data,
-                'level': level_data,
-                'game_time': game_time,
-                'coins_collected': coins_collected,
-                'enemies_defeated': enemies_defeated,
-                'boss': boss_data,
-                'entities': entities_data,
-                'timestamp': datetime.now().isoformat()
-            }
+                # Store the game state for resuming
+                data['game_state'] = {
+                    'player': player_data,
+                    'level': level_data,
+                    'game_time': game_time,
+                    'coins_collected': coins_collected,
+                    'enemies_defeated': enemies_defeated,
+                    'boss': boss_data,
+                    'entities': entities_data,
+                    'timestamp': datetime.now().isoformat()
+                }
             
-            return SaveSystem._save_data(data)
-        except Exception as e:
-            print(f"Failed to save game state: {e}")
-            return False
+                return SaveSystem._save_data(data)
+            except Exception as e:
+                _log.error("Failed to save game state: %s", e)
+                return False
     
     @staticmethod
     def start_level(level_id):
         """Mark a level as currently being played and increment attempts"""
-        data = SaveSystem._load_data()
-        data['current_level'] = level_id
+        with SaveSystem._lock:
+            data = SaveSystem._load_data()
+            data['current_level'] = level_id
         
-        # Initialize level data if doesn't exist
-        level_key = str(level_id)
-        if level_key not in data['levels']:
-            data['levels'][level_key] = {
-                'completed': False,
-                'attempts': 0,
-                'best_time': None,
-                'best_coins': 0,
-                'best_enemies_defeated': 0
-            }
+            # Initialize level data if doesn't exist
+            level_key = str(level_id)
+            if level_key not in data['levels']:
+                data['levels'][level_key] = {
+                    'completed': False,
+                    'attempts': 0,
+                    'best_time': None,
+                    'best_coins': 0,
+                    'best_enemies_defeated': 0
+                }
         
-        # Increment attempts
-        data['levels'][level_key]['attempts'] += 1
+            # Increment attempts
+            data['levels'][level_key]['attempts'] += 1
         
-        SaveSystem._save_data(data)
+            SaveSystem._save_data(data)
     
     @staticmethod
     def complete_level(level_id, time, coins, enemies_defeated):
         """Save level completion stats and unlock next level"""
-        data = SaveSystem._load_data()
-        level_key = str(level_id)
+        with SaveSystem._lock:
+            data = SaveSystem._load_data()
+            level_key = str(level_id)
         
-        # Initialize if doesn't exist
-        if level_key not in data['levels']:
-            data['levels'][level_key] = {
-                'completed': False,
-                'attempts': 0,
-                'best_time': None,
-                'best_coins': 0,
-                'best_enemies_defeated': 0
-            }
+            # Initialize if doesn't exist
+            if level_key not in data['levels']:
+                data['levels'][level_key] = {
+                    'completed': False,
+                    'attempts': 0,
+                    'best_time': None,
+                    'best_coins': 0,
+                    'best_enemies_defeated': 0
+                }
         
-        level_data = data['levels'][level_key]
-        level_data['completed'] = True
-        level_data['attempts'] = 0  # Reset attempts on completion
+            level_data = data['levels'][level_key]
+            level_data['completed'] = True
+            level_data['attempts'] = 0  # Reset attempts on completion
         
-        # Update bests
-        if level_data['best_time'] is None or time < level_data['best_time']:
-            level_data['best_time'] = time
-        if coins > level_data['best_coins']:
-            level_data['best_coins'] = coins
-        if enemies_defeated > level_data['best_enemies_defeated']:
-            level_data['best_enemies_defeated'] = enemies_defeated
+            # Update bests
+            if level_data['best_time'] is None or time < level_data['best_time']:
+                level_data['best_time'] = time
+            if coins > level_data['best_coins']:
+                level_data['best_coins'] = coins
+            if enemies_defeated > level_data['best_enemies_defeated']:
+                level_data['best_enemies_defeated'] = enemies_defeated
         
-        # Unlock next level
-        next_level = level_id + 1
-        if next_level not in data['unlocked_levels']:
-            data['unlocked_levels'].append(next_level)
+            # Unlock next level
+            next_level = level_id + 1
+            if next_level not in data['unlocked_levels']:
+                data['unlocked_levels'].append(next_level)
         
-        # Clear current level
-        data['current_level'] = None
+            # Clear current level
+            data['current_level'] = None
         
-        SaveSystem._save_data(data)
+            SaveSystem._save_data(data)
     
     @staticmethod
     def get_level_stats(level_id):
@@ -185,17 +218,22 @@ class SaveSystem:
     @staticmethod
     def has_save():
         """Check if any save data exists"""
-        return os.path.exists(SaveSystem.SAVE_FILE)
+        return writer.pending(SaveSystem.SAVE_FILE) or os.path.exists(SaveSystem.SAVE_FILE)
     
     @staticmethod
     def delete_save():
         """Delete all save data"""
         try:
+            writer.cancel(SaveSystem.SAVE_FILE)
+            writer.flush()  # Let a write already in progress finish first
+            with SaveSystem._lock:
+                SaveSystem._cache = SaveSystem._default_data()
+                SaveSystem._cache_path = SaveSystem.SAVE_FILE
             if os.path.exists(SaveSystem.SAVE_FILE):
                 os.remove(SaveSystem.SAVE_FILE)
             return True
         except Exception as e:
-            print(f"Failed to delete save: {e}")
+            _log.error("Failed to delete save: %s", e)
             return False
     
     @staticmethod
@@ -8,6 +8,9 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 TITLE = "Gravity Courier"
+RENDER_SCALE = 1.0  # Background and tiles render at this fraction of the screen size, then get scaled up (0.5-1.0; --render-scale=N)
+DISPLAY_SCALED = False  # Resizable window scaled by SDL (pygame.SCALED), F11 for fullscreen (or --scaled)
+FULLSCREEN_KEY = pygame.K_F11  # With a scaled display
 
 # Tile system
 TILE_SIZE = 32  # px
@@ -49,6 +52,12 @@ CAMERA_SHAKE_INTENSITY = 18.0  # pixels (increased for visibility)
 CAMERA_SHAKE_DURATION = 0.35  # seconds
 CAMERA_SHAKE_FREQUENCY = 18.0  # Hz
 
+# Simulation activity (distance from camera centre, px)
+ACTIVE_RADIUS = 1280  # Entities within this radius update every frame
+SLEEP_RADIUS = 2048  # Beyond this radius entities sleep until the camera approaches
+LOD_TICK_INTERVAL = 4  # Frames between updates for entities between the two radii (1 = off)
+ACTIVITY_BUCKET_SIZE = 256  # px per spatial bucket
+
 # Background
 BACKGROUND_PARALLAX_SPEEDS = [0.2, 0.5, 0.8]  # Back, middle, front layer speeds
 BACKGROUND_SCROLL_ENABLED = True
@@ -69,6 +78,37 @@ TIME_LIMIT_3_STAR = 120.0  # seconds for 3-star completion
 # UI
 UI_FONT_SIZE = 24
 UI_TITLE_SIZE = 48
+TRANSITION_PREPARE_TIMEOUT = 2.0  # Max seconds a fade keeps drawing at black for the next state, then it blocks on it
+
+# Debug logging (see game.core.log)
+LOG_LEVELS = {'*': 'info'}  # category -> 'debug'/'info'/'warning'/'error'/'off'; '*' for the rest
+LOG_ECHO_LEVEL = 'info'  # Events at or above this are also printed
+LOG_RING_SIZE = 2000  # Recent events kept in memory for dumps
+LOG_DUMP_FILE = "trace_dump.txt"  # Written on F9 and on crash
+LOG_DUMP_KEY = pygame.K_F9
+
+# Telemetry (see game.core.telemetry)
+HITCH_BUDGET = 2.0 / FPS  # Frames longer than this (seconds) count as hitches
+TELEMETRY_ENABLED = False  # Or run with --telemetry
+TELEMETRY_FILE = "telemetry.jsonl"
+TELEMETRY_INTERVAL = 10.0  # Seconds per JSONL record
+TELEMETRY_PORT = None  # Localhost port for live metrics (or --telemetry-port=N)
+
+# Garbage collector (see game.core.gc_policy)
+GC_POLICY = True  # Off with --no-gc-policy
+GC_GAMEPLAY_THRESHOLDS = (5000, 20, 100)  # gc.set_threshold during levels (Python's default is 700, 10, 10)
+PROFILER_OVERLAY_KEY = pygame.K_F3  # Frame timings and GC pauses
+
+# Hitch snapshots (see game.core.hitch)
+HITCH_SNAPSHOTS = True  # Off with --no-hitch-snapshots; --hitch-budget=MS overrides HITCH_BUDGET
+HITCH_FILE = "hitches.jsonl"
+HITCH_HISTORY = 120  # Frames of section timings kept for a snapshot
+HITCH_COOLDOWN = 2.0  # Seconds between snapshots
+HITCH_MAX_RECORDS = 50  # Per session
+HITCH_LOG_EVENTS = 50  # Latest log events included
+
+# Memory (see game.tools.memory_report)
+LEVEL_MEMORY_BUDGET = 1024 * 1024  # Bytes a level may allocate on its first load (--memory-report)
 
 # Minimap
 MINIMAP_WIDTH = 220  # px
@@ -1,16 +1,47 @@
 """
 Game state management system
 """
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 import pygame
+from game.core import settings
+from game.core.log import get_log
+from game.core.telemetry import telemetry
+from game.core.gc_policy import gc_policy
+
+_log = get_log('state')
+
+_prepare_executor = None  # Worker for GameState.prepare (created on first transition)
+
+
+def _get_prepare_executor():
+    global _prepare_executor
+    if _prepare_executor is None:
+        _prepare_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='state-prepare')
+    return _prepare_executor
+
 
 class GameState:
     """Base class for all game states"""
     
+    watch_hitches = True  # False for states whose frames are slow by design (see game.core.hitch)
+    
     def __init__(self, stack):
         self.stack = stack
         self.screen = stack.screen
         self.persistent_data = stack.persistent_data
     
+    @classmethod
+    def prepare(cls, stack, *args, **kwargs):
+        """Warm up slow loading for a state that is about to be created
+
+        Runs on a worker thread during the fade out before a transition, with
+        the same arguments the state will be constructed with. Only do
+        thread-safe I/O and decoding here (fill caches the constructor uses);
+        the state itself is still created on the main thread.
+        """
+        pass
+    
     def enter(self, previous_state=None):
         """Called when entering this state"""
         pass
@@ -27,6 +58,10 @@ class GameState:
         """Render state"""
         pass
     
+    def diagnostics(self):
+        """Counts worth seeing in a hitch snapshot (entities, bullets, ...)"""
+        return {}
+    
     def handle_event(self, event):
         """Handle individual pygame event"""
         # Handle mute toggle with 'M' key
@@ -45,6 +80,18 @@ class StateStack:
         self.persistent_data = {}
         self.transition = None
         self.pending_state_change = None
+        self.pending_prepare = None  # Future of the pending state's prepare()
+        self.stall_start = None
+        self.transition_start = None
+        
+        # Time transitions spent held at black waiting for prepare()
+        self.metrics = {
+            'transitions': 0,
+            'stalls': 0,
+            'stall_time': 0.0,
+            'max_stall': 0.0,
+            'last_stall': 0.0
+        }
     
     def push(self, state_class, *args, **kwargs):
         """Push a new state onto the stack"""
@@ -59,11 +106,20 @@ class StateStack:
         self.states.append(new_state)
         return new_state
     
-    def push_with_transition(self, state_class, *args, **kwargs):
-        """Push a new state with fade transition"""
+    def _start_transition(self, action, state_class, args, kwargs):
+        """Begin a fade; the next state starts preparing in the background"""
         from game.core.transition import FadeTransition
         self.transition = FadeTransition(duration=0.3)
-        self.pending_state_change = ('push', state_class, args, kwargs)
+        self.transition_start = time.perf_counter()
+        self.pending_state_change = (action, state_class, args, kwargs)
+        self.pending_prepare = None
+        self.stall_start = None
+        if state_class is not None:
+            self.pending_prepare = _get_prepare_executor().submit(state_class.prepare, self, *args, **kwargs)
+    
+    def push_with_transition(self, state_class, *args, **kwargs):
+        """Push a new state with fade transition"""
+        self._start_transition('push', state_class, args, kwargs)
     
     def pop(self):
         """Remove current state and return to previous"""
@@ -82,9 +138,7 @@ class StateStack:
     
     def pop_with_transition(self):
         """Remove current state with fade transition"""
-        from game.core.transition import FadeTransition
-        self.transition = FadeTransition(duration=0.3)
-        self.pending_state_change = ('pop', None, None, None)
+        self._start_transition('pop', None, None, None)
     
     def replace(self, state_class, *args, **kwargs):
         """Replace current state with a new one"""
@@ -94,15 +148,11 @@ class StateStack:
     
     def replace_with_transition(self, state_class, *args, **kwargs):
         """Replace current state with transition"""
-        from game.core.transition import FadeTransition
-        self.transition = FadeTransition(duration=0.3)
-        self.pending_state_change = ('replace', state_class, args, kwargs)
+        self._start_transition('replace', state_class, args, kwargs)
     
     def clear_and_push_with_transition(self, state_class, *args, **kwargs):
         """Clear all states and push new state with transition"""
-        from game.core.transition import FadeTransition
-        self.transition = FadeTransition(duration=0.3)
-        self.pending_state_change = ('clear_and_push', state_class, args, kwargs)
+        self._start_transition('clear_and_push', state_class, args, kwargs)
     
     def clear(self):
         """Remove all states"""
@@ -113,12 +163,15 @@ class StateStack:
         """Update the current state"""
         # Update transition if active
         if self.transition:
+            # Hold the black midpoint until the next state is prepared
+            self.transition.hold = self.pending_state_change is not None and not self._prepare_ready()
             self.transition.update(dt)
             
             # Execute pending state change at halfway point (fully black)
             if self.transition.is_halfway() and self.pending_state_change:
                 action, state_class, args, kwargs = self.pending_state_change
                 self.pending_state_change = None
+                self._finish_prepare(state_class)
                 
                 if action == 'push':
                     self.push(state_class, *args, **kwargs)
@@ -131,15 +184,58 @@ class StateStack:
                 elif action == 'clear_and_push':
                     self.clear()
                     self.push(state_class, *args, **kwargs)
+                gc_policy.safe_point('transition')  # Still black
             
             # Clear transition when complete
             if self.transition.is_complete():
                 self.transition = None
+                telemetry.timing('transition', time.perf_counter() - self.transition_start)
         
         # Update current state only if no transition is blocking
         if self.states and not self.transition:
             self.states[-1].update(dt, events)
     
+    def _prepare_ready(self):
+        """True once the pending state's prepare() is done (or has taken too long to keep drawing for)"""
+        future = self.pending_prepare
+        if future is None or future.done():
+            return True
+        if not self.transition.is_black():
+            return False
+        
+        # Screen is black and we're waiting on the worker
+        now = time.perf_counter()
+        if self.stall_start is None:
+            self.stall_start = now
+        if now - self.stall_start >= settings.TRANSITION_PREPARE_TIMEOUT:
+            _log.warning("Preparing the next state took over %.1f s, waiting for it", settings.TRANSITION_PREPARE_TIMEOUT)
+            return True
+        return False
+    
+    def _finish_prepare(self, state_class):
+        """Wait out a prepare() that timed out, record the stall (if any) and surface prepare() errors"""
+        future, self.pending_prepare = self.pending_prepare, None
+        if future is not None and not future.done():
+            # The constructor would repeat the same loading next to the worker
+            # (the caches it fills aren't locked), so let the worker finish it
+            wait([future])
+        stall = time.perf_counter() - self.stall_start if self.stall_start is not None else 0.0
+        self.stall_start = None
+        
+        metrics = self.metrics
+        metrics['transitions'] += 1
+        metrics['last_stall'] = stall
+        if stall > 0:
+            metrics['stalls'] += 1
+            metrics['stall_time'] += stall
+            metrics['max_stall'] = max(metrics['max_stall'], stall)
+            telemetry.timing('transition_stall', stall)
+            _log.info("Transition to %s stalled %.0f ms waiting for prepare", state_class.__name__, stall * 1000)
+        
+        if future is not None and future.exception() is not None:
+            # The constructor will load everything itself
+            _log.warning("Could not prepare %s: %s", state_class.__name__, future.exception())
+    
     def draw(self, screen):
         """Draw the current state"""
         if self.states:
@@ -0,0 +1,233 @@
+"""
+Session telemetry: frame time histograms and named durations
+
+Off unless the game runs with --telemetry (or settings.TELEMETRY_ENABLED).
+The main loop reports every frame with frame(); subsystems report one-off
+durations with timing() (level loads, transitions, save I/O). Every
+settings.TELEMETRY_INTERVAL seconds the finished interval is handed to a
+worker thread that appends it to settings.TELEMETRY_FILE as one JSON line.
+With --telemetry-port=N the session totals are also served as
+Prometheus-style text on http://127.0.0.1:N/metrics.
+"""
+import bisect
+import json
+import os
+import queue
+import threading
+import time
+from game.core import settings
+from game.core.log import get_log
+
+_log = get_log('telemetry')
+
+# Histogram bucket upper bounds in milliseconds (one more bucket for anything above)
+BUCKETS_MS = (1, 2, 4, 8, 12, 16.7, 20, 25, 33.3, 50, 100, 250, 1000)
+
+
+class Histogram:
+    """Counts per bucket plus count, sum and max (all in milliseconds)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms):
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def to_record(self):
+        return {'n': self.count, 'sum': round(self.total, 3), 'max': round(self.max, 3), 'b': self.counts}
+
+
+class _Interval:
+    """Everything recorded since the last flush"""
+
+    def __init__(self, start):
+        self.start = start
+        self.frame = Histogram()
+        self.update = Histogram()
+        self.draw = Histogram()
+        self.hitches = 0
+        self.timings = {}  # name -> Histogram
+
+    def observe_frame(self, frame_ms, update_ms, draw_ms, hitch):
+        self.frame.observe(frame_ms)
+        self.update.observe(update_ms)
+        self.draw.observe(draw_ms)
+        if hitch:
+            self.hitches += 1
+
+    def observe_timing(self, name, ms):
+        histogram = self.timings.get(name)
+        if histogram is None:
+            histogram = self.timings[name] = Histogram()
+        histogram.observe(ms)
+
+
+class Telemetry:
+    """Per-session frame metrics (see module docstring)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.session = os.urandom(6).hex()
+        self.path = None
+        self.hitch_ms = settings.HITCH_BUDGET * 1000
+        self._lock = threading.Lock()  # timing() may come from worker threads
+        self._interval = None
+        self._totals = None
+        self._queue = None
+        self._thread = None
+        self._server = None
+
+    def start(self, path=None, port=None, hitch_budget=None):
+        """Begin recording; port (if any) serves the totals on localhost, hitch_budget (seconds) overrides HITCH_BUDGET"""
+        if self.enabled:
+            return
+        if hitch_budget:
+            self.hitch_ms = hitch_budget * 1000
+        import platform
+        import socket
+        now = time.perf_counter()
+        self.path = path or settings.TELEMETRY_FILE
+        self._interval = _Interval(now)
+        self._totals = _Interval(now)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='telemetry', daemon=True)
+        self._thread.start()
+        self._queue.put({
+            'type': 'session', 'session': self.session, 'time': time.time(),
+            'host': socket.gethostname(), 'platform': platform.platform(), 'python': platform.python_version(),
+            'cpus': os.cpu_count(), 'fps_target': settings.FPS, 'hitch_ms': round(self.hitch_ms, 3),
+            'buckets_ms': BUCKETS_MS
+        })
+        if port:
+            self._start_server(port)
+        self.enabled = True
+
+    def stop(self):
+        """Flush the last interval plus session totals and stop the worker"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        now = time.perf_counter()
+        with self._lock:
+            self._queue.put(('interval', self._interval, now))
+            self._queue.put(('totals', self._totals, now))
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+        if self._server:
+            self._server.shutdown()
+            self._server = None
+
+    def frame(self, frame_seconds, update_seconds, draw_seconds):
+        """Main loop, once per frame"""
+        if not self.enabled:
+            return
+        frame_ms = frame_seconds * 1000
+        hitch = frame_ms > self.hitch_ms
+        update_ms, draw_ms = update_seconds * 1000, draw_seconds * 1000
+        self._interval.observe_frame(frame_ms, update_ms, draw_ms, hitch)
+        with self._lock:  # prometheus_text() reads the totals from the server thread
+            self._totals.observe_frame(frame_ms, update_ms, draw_ms, hitch)
+
+        now = time.perf_counter()
+        if now - self._interval.start >= settings.TELEMETRY_INTERVAL:
+            with self._lock:
+                finished, self._interval = self._interval, _Interval(now)
+            self._queue.put(('interval', finished, now))  # Serialized on the worker
+
+    def timing(self, name, seconds):
+        """Record a one-off duration ('level_load', 'transition', 'save_io', ...)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._interval.observe_timing(name, seconds * 1000)
+            self._totals.observe_timing(name, seconds * 1000)
+
+    def _run(self):
+        """Worker: serialize finished intervals and append them to the file"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if isinstance(item, tuple):  # A finished interval (no longer written to)
+                kind, interval, end = item
+                item = {
+                    'type': kind, 'session': self.session, 'time': round(time.time(), 3),
+                    'seconds': round(end - interval.start, 3), 'hitches': interval.hitches,
+                    'frame': interval.frame.to_record(), 'update': interval.update.to_record(),
+                    'draw': interval.draw.to_record(),
+                    'timings': {name: h.to_record() for name, h in interval.timings.items()}
+                }
+            try:
+                with open(self.path, 'a') as f:
+                    f.write(json.dumps(item, separators=(',', ':')) + '\n')
+            except OSError as e:
+                _log.error("Could not write telemetry to %s: %s", self.path, e)
+
+    def prometheus_text(self):
+        """Session totals in the Prometheus text exposition format"""
+        totals = self._totals
+        lines = []
+
+        def histogram(name, label, snapshot):
+            counts, total, count = snapshot
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS_MS + ('+Inf',), counts):
+                cumulative += bucket
+                lines.append(f'{name}_bucket{{{label}le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{{label.rstrip(",")}}} {total:.3f}')
+            lines.append(f'{name}_count{{{label.rstrip(",")}}} {count}')
+
+        # Copy under the lock so each histogram's buckets, sum and count agree
+        with self._lock:
+            parts = [(part, (list(h.counts), h.total, h.count))
+                     for part, h in (('frame', totals.frame), ('update', totals.update), ('draw', totals.draw))]
+            hitches = totals.hitches
+            timings = [(name, (list(h.counts), h.total, h.count)) for name, h in totals.timings.items()]
+
+        session = f'session="{self.session}",'
+        lines.append('# TYPE courier_frame_ms histogram')
+        for part, snapshot in parts:
+            histogram('courier_frame_ms', f'{session}part="{part}",', snapshot)
+        lines.append('# TYPE courier_hitches_total counter')
+        lines.append(f'courier_hitches_total{{{session.rstrip(",")}}} {hitches}')
+        lines.append('# TYPE courier_timing_ms histogram')
+        for name, snapshot in timings:
+            histogram('courier_timing_ms', f'{session}name="{name}",', snapshot)
+        return '\n'.join(lines) + '\n'
+
+    def _start_server(self, port):
+        """Serve prometheus_text() on 127.0.0.1 only"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = owner.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # No per-request terminal output
+
+        try:
+            self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        except OSError as e:
+            _log.warning("Telemetry endpoint on port %d unavailable: %s", port, e)
+            return
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='telemetry-http', daemon=True).start()
+        _log.info("Telemetry at http://127.0.0.1:%d/metrics", port)
+
+
+# Shared instance for the whole game
+telemetry = Telemetry()
@@ -13,6 +13,7 @@ class FadeTransition:
         self.elapsed = 0
         self.fade_out = True  # Start with fade out
         self.complete = False
+        self.hold = False  # Stay black at the midpoint while True (next state still loading)
         self.surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
         self.surface.fill((0, 0, 0))
     
@@ -22,6 +23,9 @@ class FadeTransition:
         
         # Check if we should switch from fade out to fade in
         if self.fade_out and self.elapsed >= self.duration:
+            if self.hold:
+                self.elapsed = self.duration  # Fully black until released
+                return
             self.fade_out = False
             self.elapsed = 0
         elif not self.fade_out and self.elapsed >= self.duration:
@@ -48,6 +52,10 @@ class FadeTransition:
         """Check if transition is complete"""
         return self.complete
     
+    def is_black(self):
+        """Check if the fade out has finished (screen fully black)"""
+        return self.fade_out and self.elapsed >= self.duration
+    
     def is_halfway(self):
         """Check if we're at the halfway point (fully black)"""
         return not self.fade_out and self.elapsed == 0
@@ -1,6 +1,8 @@
 """
 Utility functions for game operations
 """
+import importlib
+import sys
 import pygame
 import math
 
@@ -65,3 +67,44 @@ def sign(value):
     elif value < 0:
         return -1
     return 0
+
+
+_fonts = {}  # size -> default pygame font
+
+
+def get_font(size):
+    """Default font at `size`, created once and shared (needs pygame.font.init)"""
+    font = _fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
+
+
+def bake_sprite(width, height, draw, pad=2):
+    """Render a shape once: draw(surface, x, y) paints it with its box at (x, y)
+
+    `pad` is the room left around the box for parts that stick out (outlines,
+    spikes). Returns (surface, (dx, dy)) cropped to the painted pixels;
+    blitting the surface at the box position + (dx, dy) gives the same pixels
+    as drawing the shape there directly.
+    """
+    canvas = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+    draw(canvas, pad, pad)
+    bounds = canvas.get_bounding_rect()
+    sprite = canvas.subsurface(bounds).copy()
+    if pygame.display.get_surface():
+        sprite = sprite.convert_alpha()
+    return sprite, (bounds.x - pad, bounds.y - pad)
+
+
+def lazy_exports(package, exports):
+    """Module __getattr__ for `package` that imports exports (name -> submodule) on first use"""
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)  # Later lookups skip __getattr__
+        return value
+    return __getattr__
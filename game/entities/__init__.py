@@ -1,4 +1,11 @@
 """
-Game entities
+Game entities (entity modules are imported on first access)
 """
-from .player import Player
+from game.core.utils import lazy_exports
+
+_EXPORTS = {
+    'Player': '.player',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
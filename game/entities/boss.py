@@ -2,8 +2,8 @@
 Boss: Gyro-Core with pattern phases
 """
 import pygame
-from game.core import settings, Timer
-from game.entities.spikes import AnimatedSpike
+from game.core import settings, Timer, get_font
+from game.entities.spikes import SpikePool
 import math
 import random
 
@@ -34,7 +34,7 @@ class GyroBoss:
         self.beam_speed = 120  # degrees/second
         
         # Spike attack system
-        self.animated_spikes = []  # List of active animated spikes
+        self.spike_pool = SpikePool()  # Active animated spikes
         self.spike_attack_timer = 0
         self.spike_attack_cooldown = 3.0  # Spawn spike wave every 3 seconds
         self.arena_bounds = None  # Will be set by level
@@ -74,16 +74,12 @@ class GyroBoss:
                 y = self.arena_bounds['ceiling_y']
                 orientation = 'down'
             
-            spike = AnimatedSpike(x, y, orientation=orientation, telegraph_time=1.0, grow_time=0.5, active_time=1.0, retract_time=0.5)
-            self.animated_spikes.append(spike)
+            self.spike_pool.spawn(x, y, orientation=orientation, telegraph_time=1.0, grow_time=0.5, active_time=1.0, retract_time=0.5)
     
     def update(self, dt):
         """Update boss logic"""
         # Always update spikes even when boss is dead
-        for spike in self.animated_spikes[:]:
-            spike.update(dt)
-            if spike.is_done():
-                self.animated_spikes.remove(spike)
+        self.spike_pool.update(dt)
         
         if not self.alive:
             return
@@ -139,11 +135,7 @@ class GyroBoss:
 
     def retract_all_spikes(self):
         """Make all active spikes retract when boss dies"""
-        for spike in self.animated_spikes:
-            if not spike.is_done():
-                # Set spike to retracting state and reset timer
-                spike.state = 'retracting'
-                spike.timer = 0
+        self.spike_pool.retract_all()
     
     def check_hit_player(self, player_rect, player_invuln, player_gravity_dir):
         """Check if hazards hit player"""
@@ -151,9 +143,8 @@ class GyroBoss:
             return False
         
         # Check animated spikes
-        for spike in self.animated_spikes:
-            if spike.check_collision(player_rect, player_gravity_dir):
-                return True
+        if self.spike_pool.check_collision(player_rect):
+            return True
         
         # Check laser beams during hazard phase
         if self.phase != 'hazard':
@@ -247,8 +238,7 @@ class GyroBoss:
                 pygame.draw.line(screen, settings.COLOR_RED, (x1, y1), (x2, y2), 3)
         
         # Draw animated spikes
-        for spike in self.animated_spikes:
-            spike.draw(screen, camera)
+        self.spike_pool.draw(screen, camera)
     
     def draw_hp_bar(self, screen):
         """Draw boss HP bar at top of screen"""
@@ -280,7 +270,7 @@ class GyroBoss:
             pygame.draw.rect(screen, color, fill_rect)
         
         # Boss name
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         name_text = font.render("GYRO-CORE", True, settings.COLOR_WHITE)
         name_rect = name_text.get_rect(centerx=settings.SCREEN_WIDTH // 2, bottom=bar_y - 5)
         screen.blit(name_text, name_rect)
@@ -8,12 +8,16 @@ from game.core import settings
 class BreakableBlock:
     """Block that breaks when hit, may contain items"""
     
+    __slots__ = ('rect', 'contents', 'broken', 'break_animation_timer', 'particle_offsets', 'on_break', 'entity_id')
+    
     def __init__(self, x, y, contents=None):
         self.rect = pygame.Rect(x, y, settings.TILE_SIZE, settings.TILE_SIZE)
         self.contents = contents  # 'coin', 'powerup', or None
         self.broken = False
         self.break_animation_timer = 0
         self.particle_offsets = []  # For break animation
+        self.on_break = None  # Callback(block, contents) set by level
+        self.entity_id = None  # Set by the level (index for checkpoint flags)
     
     def hit(self, side):
         """Break the block"""
@@ -37,6 +41,21 @@ class BreakableBlock:
         """Check if block is solid"""
         return not self.broken
     
+    def get_collision_rect(self):
+        """Solid area for CollisionSystem (only asked while is_solid())"""
+        return self.rect
+    
+    def on_contact(self, mover):
+        """A mover ran into the block during its collision pass"""
+        if abs(mover.vel_y) > 50:  # Moving with some velocity
+            item = self.hit('any')
+            if self.on_break:
+                self.on_break(self, item)
+    
+    def is_live(self):
+        """Intact, or still playing the break animation (see EntityManager)"""
+        return not self.broken or self.break_animation_timer > 0
+    
     def draw(self, screen, camera):
         """Draw block"""
         if self.broken and self.break_animation_timer <= 0:
@@ -8,6 +8,8 @@ from game.core import settings
 class Bullet:
     """Player projectile"""
     
+    __slots__ = ('rect', 'direction', 'speed', 'alive', 'sprite_frames', 'current_frame', 'animation_timer', 'frame_duration')
+    
     def __init__(self, x, y, direction, sprite_frames):
         """
         Args:
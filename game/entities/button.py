@@ -67,38 +67,46 @@ class Button:
         if self.activation_cooldown > 0:
             self.activation_cooldown -= dt
     
-    def draw(self, screen, camera):
-        """Draw the button"""
-        draw_rect = self.rect.copy()
-        draw_rect.x -= camera.x
-        draw_rect.y -= camera.y
-        
-        # Apply press animation
-        if self.press_timer > 0:
-            draw_rect.y += self.press_depth
-        
+    # Pre-rendered button per look, shared by all buttons (never modified)
+    _sprites = {}  # (width, height, color, pressed, facing) -> surface
+
+    @staticmethod
+    def get_sprite(width, height, color, pressed, facing):
+        """Rotated button surface for this look (rendered on first use)"""
+        key = (width, height, color, pressed, facing)
+        sprite = Button._sprites.get(key)
+        if sprite is None:
+            sprite = Button._render(width, height, color, pressed, facing)
+            if pygame.display.get_surface():
+                sprite = sprite.convert()
+            Button._sprites[key] = sprite
+        return sprite
+
+    @staticmethod
+    def _render(width, height, color, pressed, facing):
+        """Draw the button face, rotated to `facing`"""
         # Choose color based on state
-        if self.pressed:
-            button_color = (100, 200, 100) if self.color == 'green' else (200, 50, 50)
+        if pressed:
+            button_color = (100, 200, 100) if color == 'green' else (200, 50, 50)
         else:
-            button_color = (80, 180, 80) if self.color == 'green' else (150, 30, 30)
+            button_color = (80, 180, 80) if color == 'green' else (150, 30, 30)
         
         # Create button surface
-        button_surf = pygame.Surface((self.rect.width, self.rect.height))
+        button_surf = pygame.Surface((width, height))
         button_surf.fill(button_color)
         
         # Draw border
         pygame.draw.rect(button_surf, settings.COLOR_BLACK, button_surf.get_rect(), 2)
         
         # Draw highlight
-        highlight_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height // 3)
+        highlight_rect = pygame.Rect(0, 0, width, height // 3)
         highlight_color = tuple(min(255, c + 40) for c in button_color)
         pygame.draw.rect(button_surf, highlight_color, highlight_rect)
         
         # Draw arrow (always pointing up on surface)
         arrow_color = (255, 255, 255)
-        center_x = self.rect.width // 2
-        center_y = self.rect.height // 2
+        center_x = width // 2
+        center_y = height // 2
         arrow_size = 8
         arrow_points = [
             (center_x, center_y - arrow_size),
@@ -108,13 +116,25 @@ class Button:
         pygame.draw.polygon(button_surf, arrow_color, arrow_points)
         
         # Rotate surface based on facing
-        if self.facing == 'down':
+        if facing == 'down':
             button_surf = pygame.transform.rotate(button_surf, 180)
-        elif self.facing == 'left':
+        elif facing == 'left':
             button_surf = pygame.transform.rotate(button_surf, 90)
-        elif self.facing == 'right':
+        elif facing == 'right':
             button_surf = pygame.transform.rotate(button_surf, -90)
         
-        # Blit rotated surface
+        return button_surf
+
+    def draw(self, screen, camera):
+        """Draw the button"""
+        draw_rect = self.rect.copy()
+        draw_rect.x -= camera.x
+        draw_rect.y -= camera.y
+        
+        # Apply press animation
+        if self.press_timer > 0:
+            draw_rect.y += self.press_depth
+        
+        button_surf = Button.get_sprite(self.rect.width, self.rect.height, self.color, self.pressed, self.facing)
         rotated_rect = button_surf.get_rect(center=(draw_rect.centerx, draw_rect.centery))
         screen.blit(button_surf, rotated_rect)
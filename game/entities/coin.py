@@ -3,33 +3,19 @@ Coin collectible (data canister)
 """
 import pygame
 from game.core import settings
-import math
+from game.entities.collectible import Collectible
 
 
-class Coin:
+class Coin(Collectible):
     """Data canister collectible"""
     
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 16, 16)
-        self.collected = False
-        self.spawn_time = 0  # For animation
-        self.bob_offset = 0
+    __slots__ = ()
     
-    def update(self, dt, player_rect):
-        """Update coin and check collection"""
-        if self.collected:
-            return
-        
-        # Bobbing animation
-        self.spawn_time += dt
-        self.bob_offset = math.sin(self.spawn_time * 3) * 4
-        
-        # Check collision with player
-        if self.rect.colliderect(player_rect):
-            self.collected = True
-            return True
-        
-        return False
+    BOB_RATE = 3.0
+    BOB_AMPLITUDE = 4.0
+    
+    def __init__(self, x, y):
+        super().__init__(pygame.Rect(x, y, 16, 16))
     
     def draw(self, screen, camera):
         """Draw coin"""
@@ -39,7 +25,7 @@ class Coin:
         draw_rect = self.rect.copy()
         draw_rect.x -= camera.x
         draw_rect.y -= camera.y
-        draw_rect.y += self.bob_offset
+        draw_rect.y += self.get_bob_offset()
         
         # Draw coin as a circle
         center = draw_rect.center
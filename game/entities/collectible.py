@@ -0,0 +1,71 @@
+"""
+Shared base for pickups (coins, stars, power-ups, storms)
+"""
+import math
+
+
+class Collectible:
+    """Pickup whose collected flag and animation clock can be backed by a CollectibleStore"""
+    
+    __slots__ = ('rect', 'store', 'store_index', '_collected', '_anim_time', 'entity_id')
+
+    # Vertical bobbing (radians per second, pixels); subclasses override
+    BOB_RATE = 0.0
+    BOB_AMPLITUDE = 0.0
+
+    def __init__(self, rect):
+        self.rect = rect
+        self.store = None  # CollectibleStore this pickup lives in (if any)
+        self.store_index = -1
+        self._collected = False
+        self._anim_time = 0.0
+        self.entity_id = None  # Set by the level (index for checkpoint flags)
+
+    def attach(self, store, index):
+        """Move collected flag and animation clock into a CollectibleStore slot"""
+        self.store = store
+        self.store_index = index
+
+    @property
+    def collected(self):
+        if self.store is not None:
+            return bool(self.store.collected[self.store_index])
+        return self._collected
+
+    @collected.setter
+    def collected(self, value):
+        if self.store is not None:
+            self.store.collected[self.store_index] = value
+        else:
+            self._collected = value
+
+    def is_live(self):
+        """Still needs drawing (see EntityManager)"""
+        return not self.collected
+
+    @property
+    def anim_time(self):
+        """Seconds this pickup has been animating"""
+        if self.store is not None:
+            return self.store.get_anim_time(self.store_index)
+        return self._anim_time
+
+    def get_bob_offset(self):
+        """Current vertical bob offset in pixels"""
+        if self.store is not None:
+            return float(self.store.bob[self.store_index])
+        return math.sin(self._anim_time * self.BOB_RATE) * self.BOB_AMPLITUDE
+
+    def update(self, dt, player_rect):
+        """Update animation and check collection (only used without a store)"""
+        if self.collected:
+            return False
+
+        self._anim_time += dt
+
+        # Check collision with player
+        if self.rect.colliderect(player_rect):
+            self.collected = True
+            return True
+
+        return False
@@ -3,6 +3,7 @@ Enemy entities with gravity-aware combat
 """
 import pygame
 from game.core import settings, sign
+from game.io.assets import load_image, get_sprite
 
 def crop_surface(surface):
     """Crop a surface to its non-transparent bounding box."""
@@ -13,12 +14,15 @@ def crop_surface(surface):
 class Enemy:
     """Base enemy class"""
     
+    __slots__ = ('rect', 'vel_x', 'vel_y', 'alive', 'anchor_surface', 'entity_id')
+    
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         self.vel_x = 0
         self.vel_y = 0
         self.alive = True
         self.anchor_surface = 'floor'  # 'floor' or 'ceiling'
+        self.entity_id = None  # Set by the level (index for checkpoint flags)
     
     def update(self, dt, collision_system):
         """Base update"""
@@ -65,6 +69,10 @@ class Enemy:
         """Defeat the enemy"""
         self.alive = False
     
+    def is_live(self):
+        """Still needs updating/drawing (see EntityManager)"""
+        return self.alive
+    
     def draw(self, screen, camera):
         """Draw enemy"""
         pass
@@ -73,6 +81,8 @@ class Enemy:
 class Drone(Enemy):
     """Patrolling drone enemy"""
     
+    __slots__ = ('patrol_start', 'patrol_range', 'speed', 'direction', 'flash_timer', 'color', 'sprite')
+    
     def __init__(self, x, y, anchor_surface='floor', patrol_range=128, color='blue'):
         super().__init__(x, y, 40, 30)  # Increased from 28x20 to 48x40
 
@@ -84,23 +94,53 @@ class Drone(Enemy):
         self.flash_timer = 0
         self.color = color
         
-        # Try to load sprite
-        self.sprite = None
-        try:
-            sprite_path = f'game/assets/images/sprites/alien{color}.png'
-            self.sprite = pygame.image.load(sprite_path)
-            cropped = crop_surface(self.sprite)
-            # Scale to fit rect size
-            self.sprite = pygame.transform.scale(cropped, (self.rect.width, self.rect.height))
-        except:
-            pass  # Use colored rect fallback
+        # Prebuilt sprite from the asset bundle, else crop and scale the source image
+        self.sprite = get_sprite(f'drone/{color}')
+        if self.sprite is None:
+            try:
+                sprite_path = f'game/assets/images/sprites/alien{color}.png'
+                cropped = crop_surface(load_image(sprite_path))
+                # Scale to fit rect size
+                self.sprite = pygame.transform.scale(cropped, (self.rect.width, self.rect.height))
+            except:
+                pass  # Use colored rect fallback
     
     def update(self, dt, collision_system):
         """Update drone patrol"""
         if not self.alive:
             self.flash_timer -= dt
             return
-        
+
+        # Long gap (woken from sleep or reduced-rate tick): replay in frame steps
+        step = 1.0 / settings.FPS
+        if dt > step * 1.5:
+            self._catch_up(dt, step)
+            return
+
+        self._patrol_step(dt)
+
+    def _catch_up(self, dt, step):
+        """Advance patrol by dt as if it had been updated every frame"""
+        steps = int(dt / step)
+        remainder = dt - steps * step
+
+        # Patrol state (x, direction) repeats with a fixed cycle; once a state
+        # repeats, skip all whole cycles and only replay the leftover steps
+        seen = {}
+        for i in range(steps):
+            state = (self.rect.x, self.direction)
+            if state in seen:
+                cycle = i - seen[state]
+                for _ in range((steps - i) % cycle):
+                    self._patrol_step(step)
+                break
+            seen[state] = i
+            self._patrol_step(step)
+        if remainder > 1e-9:
+            self._patrol_step(remainder)
+
+    def _patrol_step(self, dt):
+        """Single patrol step"""
         # Simple patrol: move back and forth
         self.vel_x = self.direction * self.speed
         self.rect.x += self.vel_x * dt
@@ -118,6 +158,10 @@ class Drone(Enemy):
         super().take_damage()
         self.flash_timer = 0.3
     
+    def is_live(self):
+        """Alive, or still showing the defeat flash"""
+        return self.alive or self.flash_timer > 0
+    
     def draw(self, screen, camera):
         """Draw drone"""
         if not self.alive and self.flash_timer <= 0:
@@ -2,7 +2,7 @@
 Gate entity - vertical barrier with spikes that can open/close
 """
 import pygame
-from game.core import settings
+from game.core import settings, bake_sprite
 
 
 class Gate:
@@ -115,6 +115,23 @@ class Gate:
         
         return False
     
+    # Pre-rendered gate at each height it has been drawn at, shared by all gates (never modified).
+    # A transition only ever shows a handful of heights, so this fills up to a short strip per gate size.
+    _sprites = {}  # (width, height, spike_orientation) -> (surface, (dx, dy))
+    SPIKE_SIZE = 8
+
+    @staticmethod
+    def get_sprite(width, height, spike_orientation):
+        """Sprite and offset for a gate body of this size (rendered on first use)"""
+        key = (width, height, spike_orientation)
+        sprite = Gate._sprites.get(key)
+        if sprite is None:
+            sprite = bake_sprite(width, height,
+                                 lambda surface, x, y: Gate._draw_shape(surface, pygame.Rect(x, y, width, height), spike_orientation),
+                                 pad=Gate.SPIKE_SIZE + 1)
+            Gate._sprites[key] = sprite
+        return sprite
+
     def draw(self, screen, camera):
         """Draw the gate with spikes"""
         collision_rect = self.get_collision_rect()
@@ -126,6 +143,12 @@ class Gate:
         draw_rect.x -= camera.x
         draw_rect.y -= camera.y
         
+        sprite, (dx, dy) = Gate.get_sprite(draw_rect.width, draw_rect.height, self.spike_orientation)
+        screen.blit(sprite, (draw_rect.x + dx, draw_rect.y + dy))
+
+    @staticmethod
+    def _draw_shape(surface, draw_rect, spike_orientation):
+        """Draw bars filling draw_rect and the spikes on its edge"""
         # Draw gate body (metallic bars)
         bar_color = (100, 100, 120)
         shadow_color = (60, 60, 80)
@@ -136,18 +159,18 @@ class Gate:
         for i in range(num_bars):
             bar_x = draw_rect.x + i * bar_width
             bar_rect = pygame.Rect(bar_x, draw_rect.y, bar_width - 2, draw_rect.height)
-            pygame.draw.rect(screen, bar_color, bar_rect)
-            pygame.draw.rect(screen, shadow_color, bar_rect, 1)
+            pygame.draw.rect(surface, bar_color, bar_rect)
+            pygame.draw.rect(surface, shadow_color, bar_rect, 1)
         
         # Draw spikes
         spike_color = (200, 50, 50)
-        spike_size = 8
+        spike_size = Gate.SPIKE_SIZE
         num_spikes = max(1, draw_rect.width // (spike_size * 2))
         
         for i in range(num_spikes):
             spike_x = draw_rect.x + (i * 2 + 1) * spike_size
             
-            if self.spike_orientation == 'up':
+            if spike_orientation == 'up':
                 # Spikes pointing up from top
                 spike_points = [
                     (spike_x - spike_size // 2, draw_rect.top),
@@ -162,5 +185,5 @@ class Gate:
                     (spike_x, draw_rect.bottom + spike_size)
                 ]
             
-            pygame.draw.polygon(screen, spike_color, spike_points)
-            pygame.draw.polygon(screen, (150, 30, 30), spike_points, 1)
+            pygame.draw.polygon(surface, spike_color, spike_points)
+            pygame.draw.polygon(surface, (150, 30, 30), spike_points, 1)
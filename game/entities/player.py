@@ -2,7 +2,10 @@
 Player character with gravity-flip mechanics
 """
 import pygame
-from game.core import settings, Timer, clamp, sign
+from game.core import settings, Timer, clamp, sign, get_log
+from game.io.assets import load_image, get_sprite, get_sprite_frames
+
+_log = get_log('player')
 
 def crop_surface(surface):
     """Crop a surface to its non-transparent bounding box."""
@@ -10,6 +13,42 @@ def crop_surface(surface):
     return surface.subsurface(rect).copy()
 
 
+PLAYER_SHEET = 'game/assets/images/sprites/buddie0_sheet.png'
+
+
+def extract_sheet_frames(sheet):
+    """Cut the player animation frames out of the 32x32-cell sprite sheet
+    
+    Returns {'idle': Surface, 'walk': [...], 'attack': [...], 'bullet': [...]};
+    bullet frames are cropped, the others are full cells.
+    """
+    # Sprite sheet is 32x32 per cell, 8x5 tiles
+    frame_width = 32
+    frame_height = 32
+    
+    # Idle frame (row 1, col 0)
+    idle = sheet.subsurface((0, frame_height, frame_width, frame_height)).copy()
+    
+    # Walking animation frames (row 3, 4 frames)
+    walk = [sheet.subsurface((i * frame_width, 3 * frame_height, frame_width, frame_height)).copy()
+            for i in range(4)]
+    
+    # Attack animation frames (row 4, 4 frames)
+    attack = [sheet.subsurface((i * frame_width, 4 * frame_height, frame_width, frame_height)).copy()
+              for i in range(4)]
+    
+    # Bullet frames (row 4, frames 4-7)
+    bullet = [crop_surface(sheet.subsurface((i * frame_width, 4 * frame_height, frame_width, frame_height)).copy())
+              for i in range(4, 8)]
+    
+    return {'idle': idle, 'walk': walk, 'attack': attack, 'bullet': bullet}
+
+
+def prepare_frame(frame, size):
+    """Crop a frame to its visible pixels and scale it to the player size"""
+    return pygame.transform.scale(crop_surface(frame), size)
+
+
 class Player:
     """Player character with gravity control"""
     
@@ -57,71 +96,14 @@ class Player:
         self.attack_frame_duration = 0.1  # 100ms per attack frame
         self.bullet_spawned = False  # Track if bullet spawned this attack
         
-        try:
-            # Load the sprite sheet
-            sheet_raw = pygame.image.load('game/assets/images/sprites/buddie0_sheet.png').convert()
-            # Set black as transparent
-            sheet_raw.set_colorkey((0, 0, 0))
-            print(f"Loaded sprite sheet: {sheet_raw.get_size()}")
-            sheet_width, sheet_height = sheet_raw.get_size()
-            cell_width = 32
-            cell_height = 32
-
-            cols = sheet_width // cell_width
-            rows = sheet_height // cell_height
-            total_sprites = cols * rows
-
-            print(f"Sheet size: {sheet_width}x{sheet_height}")
-            print(f"Grid: {cols} columns x {rows} rows")
-            print(f"Total sprites: {total_sprites}")
-            
-            # Sprite sheet is 32x32 per cell, 8x5 tiles
-            # Row 0: idle frames
-            # Row 1: walking frames (4 frames)
-            frame_width = 32
-            frame_height = 32
-            
-            # Extract idle frame (row 1, col 0)
-            self.sprite_normal = sheet_raw.subsurface((0, frame_height, frame_width, frame_height)).copy()
-            print("Loaded idle sprite")
-            
-            # Extract walking animation frames (row 3, 4 frames)
-            for i in range(4):
-                frame = sheet_raw.subsurface((i * frame_width, 3 * frame_height, frame_width, frame_height)).copy()
-                self.walk_frames.append(frame)
-            print(f"Loaded {len(self.walk_frames)} walk frames")
-
-            # Extract attack animation frames (row 4, 4 frames)
-            for i in range(4):
-                x = i * frame_width
-                y = 4 * frame_height   # row 4
-                frame = sheet_raw.subsurface((x, y, frame_width, frame_height)).copy()
-                self.attack_frames.append(frame)
-
-            print(f"Loaded {len(self.attack_frames)} attack frames")
-            
-            # Extract bullet frames (row 4, frames 4-7)
-            for i in range(4, 8):
-                x = i * frame_width
-                y = 4 * frame_height  # row 4
-                frame = sheet_raw.subsurface((x, y, frame_width, frame_height)).copy()
-                cropped = crop_surface(frame)
-                self.bullet_frames.append(cropped)
-
-            print(f"Loaded {len(self.bullet_frames)} bullet frames")
-
-            
-            # Powered-up uses a different row or glowing effect
-            # For now, use row 2, frame 0 for powered state
-            # self.sprite_powered = sheet_raw.subsurface((0, frame_height * 2, frame_width, frame_height)).copy()
-            # print("Loaded powered sprite")
-            
-        except Exception as e:
-            print(f"ERROR loading sprite sheet: {e}")
-            # Create a dummy sprite so player is always visible
-            self.sprite_normal = pygame.Surface((24, 32))
-            self.sprite_normal.fill((50, 120, 220))  # Blue
-            print("Using fallback colored rectangle")
+        # Prefer prebuilt frames from the asset bundle (already cropped and scaled)
+        self.sprite_normal = get_sprite('player/idle')
+        if self.sprite_normal is not None:
+            self.walk_frames = get_sprite_frames('player/walk')
+            self.attack_frames = get_sprite_frames('player/attack')
+            self.bullet_frames = get_sprite_frames('player/bullet')
+        else:
+            self._load_sprite_sheet()
         
         # Stats
         self.coins = 0
@@ -133,6 +115,30 @@ class Player:
         self.facing_right = True
         self.alive = True
     
+    def _load_sprite_sheet(self):
+        """Cut animation frames out of the sprite sheet (no asset bundle)"""
+        try:
+            # Load the sprite sheet
+            sheet_raw = load_image(PLAYER_SHEET, alpha=False).copy()
+            # Set black as transparent
+            sheet_raw.set_colorkey((0, 0, 0))
+            frames = extract_sheet_frames(sheet_raw)
+            
+            # Crop and scale once here instead of on every draw
+            size = self.rect.size
+            self.sprite_normal = prepare_frame(frames['idle'], size)
+            self.walk_frames = [prepare_frame(frame, size) for frame in frames['walk']]
+            self.attack_frames = [prepare_frame(frame, size) for frame in frames['attack']]
+            self.bullet_frames = frames['bullet']
+            _log.debug("Loaded %d walk, %d attack, %d bullet frames",
+                       len(self.walk_frames), len(self.attack_frames), len(self.bullet_frames))
+            
+        except Exception as e:
+            _log.error("Could not load sprite sheet (%s), using a fallback rectangle", e)
+            # Create a dummy sprite so player is always visible
+            self.sprite_normal = pygame.Surface((24, 32))
+            self.sprite_normal.fill((50, 120, 220))  # Blue
+    
     def update(self, dt, input_handler, collision_system):
         """Update player state"""
         if not self.alive:
@@ -280,6 +286,15 @@ class Player:
         was_on_ground = self.on_ground
         self.on_ground = False
         
+        # Get out of gates that closed on us since last frame
+        push_x, push_y = collision_system.get_push_out(self.rect)
+        if push_x:
+            self.rect.x += push_x
+            self.vel_x = 0
+        if push_y:
+            self.rect.y += push_y
+            self.vel_y = 0
+        
         # Move horizontally
         self.rect.x += self.vel_x * dt
         
@@ -292,8 +307,9 @@ class Player:
             self.vel_x = 0
         
         # Check horizontal collisions
-        collisions = collision_system.get_tile_collisions(self.rect, self.gravity_dir)
-        for tile_rect in collisions:
+        collisions = collision_system.get_collisions(self.rect, self.gravity_dir)
+        self._touch_colliders(collisions)
+        for tile_rect, _ in collisions:
             if self.vel_x > 0:  # Moving right
                 self.rect.right = tile_rect.left
             elif self.vel_x < 0:  # Moving left
@@ -312,8 +328,9 @@ class Player:
             self.vel_y = 0
         
         # Check vertical collisions
-        collisions = collision_system.get_tile_collisions(self.rect, self.gravity_dir)
-        for tile_rect in collisions:
+        collisions = collision_system.get_collisions(self.rect, self.gravity_dir)
+        self._touch_colliders(collisions)
+        for tile_rect, _ in collisions:
             if self.gravity_dir == 1:  # Normal gravity
                 if self.vel_y > 0:  # Falling down
                     self.rect.bottom = tile_rect.top
@@ -337,12 +354,16 @@ class Player:
                     self.rect.bottom = tile_rect.top
                     self.vel_y = 0
     
+    def _touch_colliders(self, collisions):
+        """Tell dynamic colliders we ran into about it (before velocity is zeroed)"""
+        for _, collider in collisions:
+            if collider is not None and hasattr(collider, 'on_contact'):
+                collider.on_contact(self)
+    
     def take_damage(self, amount=1, camera=None):
         """Take damage if not invulnerable"""
-        print(f"DEBUG: take_damage called with amount={amount}, camera={camera is not None}, current_hp={self.hp}")
-        
         if self.invuln_timer.is_active() or self.flux_surge_timer.is_active():
-            print("DEBUG: Player is invulnerable, damage blocked")
+            _log.debug("Invulnerable, %d damage blocked", amount)
             return False
         
         # Store previous health to check if we're dropping to 1
@@ -355,11 +376,10 @@ class Player:
         if self.audio:
             self.audio.play_sfx('dead-sound')
         
-        print(f"DEBUG: Damage taken! Previous HP: {previous_hp}, New HP: {self.hp}")
+        _log.debug("Damage taken: HP %d -> %d", previous_hp, self.hp)
         
         # Trigger camera shake
         if camera and previous_hp >= 2:
-            print(f"DEBUG: Camera shake triggered! Previous HP: {previous_hp}, Current HP: {self.hp}")
             camera.shake()
         
         if self.hp <= 0:
@@ -490,8 +510,10 @@ class Player:
             sprite = self.sprite_normal
         
         if sprite and not should_skip_render:            
-            sprite = crop_surface(sprite)
-            sprite_scaled = pygame.transform.scale(sprite, (self.rect.width, self.rect.height))
+            # Frames are prepared at load time; only odd-sized fallbacks need work here
+            sprite_scaled = sprite
+            if sprite.get_size() != self.rect.size:
+                sprite_scaled = prepare_frame(sprite, self.rect.size)
 
             if not self.facing_right:
                 sprite_scaled = pygame.transform.flip(sprite_scaled, True, False)
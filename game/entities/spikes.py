@@ -1,13 +1,16 @@
 """
 Spike hazards
 """
+import numpy as np
 import pygame
-from game.core import settings
+from game.core import settings, bake_sprite
 
 
 class Spikes:
     """Deadly spikes that hurt on contact"""
     
+    __slots__ = ('rect', 'orientation', 'dealt_damage')
+    
     def __init__(self, x, y, orientation='up'):
         self.rect = pygame.Rect(x, y, settings.TILE_SIZE, settings.TILE_SIZE)
         self.orientation = orientation  # 'up', 'down', 'left', 'right'
@@ -77,18 +80,28 @@ class Spikes:
         
         return False
     
-    def draw(self, screen, camera, show_hitboxes=False):
-        """Draw spikes"""
-        draw_rect = self.rect.copy()
-        draw_rect.x -= camera.x
-        draw_rect.y -= camera.y
-        
-        # Draw spike triangles
+    # Pre-rendered sprite per orientation, shared by every spike (never modified)
+    _sprites = {}  # orientation -> (surface, (dx, dy) from the tile's top-left)
+
+    @staticmethod
+    def get_sprite(orientation):
+        """Sprite and offset for an orientation (rendered on first use)"""
+        sprite = Spikes._sprites.get(orientation)
+        if sprite is None:
+            size = settings.TILE_SIZE
+            sprite = bake_sprite(size, size,
+                                 lambda surface, x, y: Spikes._draw_shape(surface, pygame.Rect(x, y, size, size), orientation))
+            Spikes._sprites[orientation] = sprite
+        return sprite
+
+    @staticmethod
+    def _draw_shape(surface, draw_rect, orientation):
+        """Draw the spike triangles filling draw_rect"""
         spike_color = (180, 50, 50)  # Dark red
         num_spikes = 4
         spike_width = settings.TILE_SIZE // num_spikes
         
-        if self.orientation == 'up':
+        if orientation == 'up':
             for i in range(num_spikes):
                 x = draw_rect.left + i * spike_width
                 points = [
@@ -96,9 +109,9 @@ class Spikes:
                     (x + spike_width // 2, draw_rect.top),
                     (x + spike_width, draw_rect.bottom)
                 ]
-                pygame.draw.polygon(screen, spike_color, points)
+                pygame.draw.polygon(surface, spike_color, points)
         
-        elif self.orientation == 'down':
+        elif orientation == 'down':
             for i in range(num_spikes):
                 x = draw_rect.left + i * spike_width
                 points = [
@@ -106,9 +119,9 @@ class Spikes:
                     (x + spike_width // 2, draw_rect.bottom),
                     (x + spike_width, draw_rect.top)
                 ]
-                pygame.draw.polygon(screen, spike_color, points)
+                pygame.draw.polygon(surface, spike_color, points)
         
-        elif self.orientation == 'left':
+        elif orientation == 'left':
             for i in range(num_spikes):
                 y = draw_rect.top + i * spike_width
                 points = [
@@ -116,9 +129,9 @@ class Spikes:
                     (draw_rect.left, y + spike_width // 2),
                     (draw_rect.right, y + spike_width)
                 ]
-                pygame.draw.polygon(screen, spike_color, points)
+                pygame.draw.polygon(surface, spike_color, points)
         
-        elif self.orientation == 'right':
+        elif orientation == 'right':
             for i in range(num_spikes):
                 y = draw_rect.top + i * spike_width
                 points = [
@@ -126,149 +139,251 @@ class Spikes:
                     (draw_rect.right, y + spike_width // 2),
                     (draw_rect.left, y + spike_width)
                 ]
-                pygame.draw.polygon(screen, spike_color, points)
+                pygame.draw.polygon(surface, spike_color, points)
+    
+    def draw(self, screen, camera, show_hitboxes=False):
+        """Draw spikes"""
+        draw_rect = self.rect.copy()
+        draw_rect.x -= camera.x
+        draw_rect.y -= camera.y
+        
+        sprite, (dx, dy) = Spikes.get_sprite(self.orientation)
+        screen.blit(sprite, (draw_rect.x + dx, draw_rect.y + dy))
         
         # Draw hitbox if debug mode is enabled
         if show_hitboxes:
             pygame.draw.rect(screen, (255, 0, 255), draw_rect, 2)  # Magenta outline
 
 
-class AnimatedSpike:
-    """Animated spike that grows from floor/ceiling (for boss attacks)"""
-    
-    def __init__(self, x, y, orientation='up', telegraph_time=1, grow_time=0.5, active_time=1.5, retract_time=0.5):
-        self.x = x
-        self.y = y
-        self.orientation = orientation  # 'up' or 'down'
-        self.telegraph_time = telegraph_time  # Time warning indicator shows
-        self.grow_time = grow_time  # Time to fully extend
-        self.active_time = active_time  # Time spike stays extended
-        self.retract_time = retract_time  # Time to retract
-        
-        self.total_duration = telegraph_time + grow_time + active_time + retract_time
-        self.timer = 0
-        self.state = 'telegraph'  # 'telegraph', 'growing', 'active', 'retracting', 'done'
-        
-        self.max_height = 64  # Maximum spike height in pixels
-        self.width = settings.TILE_SIZE
-        self.current_height = 0
-        
-        self.player_touching = False
-    
+class SpikePool:
+    """Animated boss spikes that grow from the floor/ceiling, stored in parallel arrays
+
+    Every spike goes telegraph -> growing -> active -> retracting -> done.
+    Live spikes are kept packed at the front of the arrays in spawn order;
+    update() advances all of them with vectorized operations and drops
+    finished ones, check_collision() tests them all against the player at once.
+    """
+
+    # Spike states (index into the per-spike durations)
+    TELEGRAPH, GROWING, ACTIVE, RETRACTING, DONE = range(5)
+
+    MAX_HEIGHT = 64  # Maximum spike height in pixels
+    WIDTH = settings.TILE_SIZE
+    ARRAYS = ('x', 'y', 'down', 'state', 'timer', 'height', 'durations', 'phase_time', 'player_touching')
+
+    def __init__(self, capacity=128):
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Create (or grow) the backing arrays"""
+        n = self.count
+        arrays = {
+            'x': np.zeros(capacity, dtype=np.int32),
+            'y': np.zeros(capacity, dtype=np.int32),
+            'down': np.zeros(capacity, dtype=bool),  # Grows down from the ceiling
+            'state': np.zeros(capacity, dtype=np.int8),
+            'timer': np.zeros(capacity, dtype=np.float64),
+            'height': np.zeros(capacity, dtype=np.float64),
+            'durations': np.ones((capacity, 4), dtype=np.float64),  # telegraph, grow, active, retract
+            'phase_time': np.ones(capacity, dtype=np.float64),  # Duration of the current state
+            'player_touching': np.zeros(capacity, dtype=bool),
+        }
+        for name, array in arrays.items():
+            if n:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def copy(self):
+        """Independent copy (used by level snapshots)"""
+        pool = SpikePool(self.capacity)
+        pool.count = self.count
+        for name in self.ARRAYS:
+            getattr(pool, name)[:] = getattr(self, name)
+        return pool
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, x, y, orientation='up', telegraph_time=1, grow_time=0.5, active_time=1.5, retract_time=0.5):
+        """Add a spike in its telegraph state"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.down[i] = orientation == 'down'
+        self.state[i] = self.TELEGRAPH
+        self.timer[i] = 0
+        self.height[i] = 0
+        self.durations[i] = (telegraph_time, grow_time, active_time, retract_time)
+        self.phase_time[i] = telegraph_time
+        self.player_touching[i] = False
+        self.count += 1
+
     def update(self, dt):
-        """Update spike animation"""
-        self.timer += dt
-        
-        if self.state == 'telegraph':
-            if self.timer >= self.telegraph_time:
-                self.state = 'growing'
-                self.timer = 0
-        
-        elif self.state == 'growing':
-            progress = min(1.0, self.timer / self.grow_time)
-            self.current_height = self.max_height * progress
-            if self.timer >= self.grow_time:
-                self.state = 'active'
-                self.timer = 0
-                self.current_height = self.max_height
-        
-        elif self.state == 'active':
-            if self.timer >= self.active_time:
-                self.state = 'retracting'
-                self.timer = 0
-        
-        elif self.state == 'retracting':
-            progress = min(1.0, self.timer / self.retract_time)
-            self.current_height = self.max_height * (1.0 - progress)
-            if self.timer >= self.retract_time:
-                self.state = 'done'
-                self.current_height = 0
-    
-    def is_done(self):
-        return self.state == 'done'
-    
-    def is_dangerous(self):
-        """Returns True if spike can damage player"""
-        return self.state in ['growing', 'active', 'retracting']
-    
-    def get_hitbox(self):
-        """Get current collision rectangle"""
-        if self.orientation == 'up':
-            return pygame.Rect(self.x, self.y - self.current_height, self.width, self.current_height)
-        else:  # 'down'
-            return pygame.Rect(self.x, self.y, self.width, self.current_height)
-    
-    def check_collision(self, player_rect, player_gravity_dir):
-        """Check if player hit spike and should take damage"""
-        if not self.is_dangerous():
+        """Advance every spike one step and remove finished ones"""
+        n = self.count
+        if n == 0:
+            return
+        state = self.state[:n]
+        timer = self.timer[:n]
+        height = self.height[:n]
+        phase_time = self.phase_time[:n]
+        timer += dt
+
+        # Height follows the state the spike was in at the start of the step
+        moving = (state & 1).view(bool)  # GROWING and RETRACTING are the odd states
+        if np.count_nonzero(moving):
+            progress = np.minimum(1.0, timer[moving] / phase_time[moving])
+            retracting = state[moving] == self.RETRACTING
+            progress[retracting] = 1.0 - progress[retracting]
+            height[moving] = self.MAX_HEIGHT * progress
+
+        expired = timer >= phase_time
+        if not np.count_nonzero(expired):
+            return
+
+        # At most one transition per step; the timer restarts except when finishing
+        growing = state == self.GROWING
+        retracting = state == self.RETRACTING
+        height[expired & growing] = self.MAX_HEIGHT
+        height[expired & retracting] = 0
+        timer[expired & ~retracting] = 0
+        state[expired] += 1
+        changed = np.flatnonzero(expired & ~retracting)
+        phase_time[changed] = self.durations[changed, state[changed]]
+
+        # Drop finished spikes, keeping the rest packed in spawn order
+        if np.count_nonzero(expired & retracting):
+            keep = state < self.DONE
+            m = int(np.count_nonzero(keep))
+            for name in self.ARRAYS:
+                array = getattr(self, name)
+                array[:m] = array[:n][keep]
+            self.count = m
+
+    def retract_all(self):
+        """Send every spike straight to retracting"""
+        n = self.count
+        self.state[:n] = self.RETRACTING  # Finished spikes never stay in the pool
+        self.timer[:n] = 0
+        self.phase_time[:n] = self.durations[:n, self.RETRACTING]
+
+    def _hitboxes(self, indices):
+        """(left, top, height) arrays of the hitboxes of `indices` (truncated like pygame.Rect)"""
+        height = self.height[indices]
+        y = self.y[indices]
+        top = np.where(self.down[indices], y, np.trunc(y - height))
+        return self.x[indices], top.astype(np.int64), height.astype(np.int64)
+
+    def check_collision(self, player_rect):
+        """True if the player newly touched a dangerous spike
+
+        Spikes are checked in spawn order and only damage on first contact;
+        like checking them one at a time, the scan stops at the first hit.
+        """
+        n = self.count
+        if n == 0:
             return False
-        
-        hitbox = self.get_hitbox()
-        is_touching = hitbox.colliderect(player_rect)
-        
-        # Only damage on FIRST contact
-        if is_touching and not self.player_touching:
-            self.player_touching = True
+        dangerous = self.state[:n] != self.TELEGRAPH  # growing, active or retracting
+        x = self.x[:n]
+        candidates = np.flatnonzero(dangerous & (x < player_rect.right) & (x + self.WIDTH > player_rect.left))
+        player_touching = self.player_touching[:n]
+        if not candidates.size:
+            player_touching[dangerous] = False  # Nothing in reach: every contact has ended
+            return False
+
+        touching = np.zeros(n, dtype=bool)
+        _, top, height = self._hitboxes(candidates)
+        touching[candidates] = (height > 0) & (top < player_rect.bottom) & (top + height > player_rect.top)
+
+        hits = np.flatnonzero(touching & ~player_touching)
+        end = int(hits[0]) if hits.size else n
+        # Spikes scanned before the hit forget a contact that ended
+        player_touching[:end][dangerous[:end] & ~touching[:end]] = False
+        if hits.size:
+            player_touching[end] = True
             return True
-        
-        if not is_touching:
-            self.player_touching = False
-        
         return False
-    
+
+    # Pre-rendered sprites (never modified); offsets are from the spike's base point
+    HEIGHT_STEPS = 16  # Growing/retracting spikes are drawn in MAX_HEIGHT / HEIGHT_STEPS pixel steps
+    _sprites = {}  # (down, step) -> (surface, (dx, dy))
+    _telegraph = {}  # down -> (surface, (dx, dy))
+
+    @staticmethod
+    def _draw_spike(surface, x, base_y, tip_y):
+        spike_width = SpikePool.WIDTH // 4
+        for i in range(4):
+            sx = x + i * spike_width
+            points = [
+                (sx, base_y),
+                (sx + spike_width // 2, tip_y),
+                (sx + spike_width, base_y)
+            ]
+            pygame.draw.polygon(surface, (200, 50, 50), points)
+            pygame.draw.polygon(surface, (150, 30, 30), points, 2)
+
+    @staticmethod
+    def _draw_telegraph(surface, x, y):
+        """Pulsing warning box"""
+        indicator_rect = pygame.Rect(x, y, SpikePool.WIDTH, 10)
+        pygame.draw.rect(surface, (255, 255, 0), indicator_rect)
+        pygame.draw.rect(surface, (255, 200, 0), indicator_rect, 2)
+
+    @staticmethod
+    def get_sprite(down, step):
+        """Spike sprite `step` of HEIGHT_STEPS (rendered on first use)"""
+        key = (down, step)
+        sprite = SpikePool._sprites.get(key)
+        if sprite is None:
+            height = SpikePool.MAX_HEIGHT * step // SpikePool.HEIGHT_STEPS
+            if down:
+                surface, offset = bake_sprite(SpikePool.WIDTH, height,
+                                              lambda s, x, y: SpikePool._draw_spike(s, x, y, y + height))
+            else:
+                surface, (dx, dy) = bake_sprite(SpikePool.WIDTH, height,
+                                                lambda s, x, y: SpikePool._draw_spike(s, x, y + height, y))
+                offset = (dx, dy - height)  # Box top is `height` above the base
+            sprite = SpikePool._sprites[key] = (surface, offset)
+        return sprite
+
+    @staticmethod
+    def get_telegraph_sprite(down):
+        sprite = SpikePool._telegraph.get(down)
+        if sprite is None:
+            surface, (dx, dy) = bake_sprite(SpikePool.WIDTH, 10, SpikePool._draw_telegraph)
+            sprite = SpikePool._telegraph[down] = (surface, (dx, dy if down else dy - 10))
+        return sprite
+
     def draw(self, screen, camera, show_hitboxes=False):
-        """Draw animated spike"""
-        draw_x = self.x - camera.x
-        draw_y = self.y - camera.y
-        
-        # Draw telegraph indicator
-        if self.state == 'telegraph':
-            alpha = int(128 + 127 * (self.timer / self.telegraph_time))
-            color = (255, 255, 0, alpha)  # Yellow warning
-            indicator_rect = pygame.Rect(draw_x, draw_y - 10, self.width, 10)
-            if self.orientation == 'down':
-                indicator_rect.y = draw_y
-            
-            # Draw pulsing warning box
-            pygame.draw.rect(screen, (255, 255, 0), indicator_rect)
-            pygame.draw.rect(screen, (255, 200, 0), indicator_rect, 2)
-        
-        # Draw spike if it's growing/active/retracting
-        if self.current_height > 0:
-            spike_color = (200, 50, 50)  # Red for danger
-            num_spikes = 4
-            spike_width = self.width // num_spikes
-            
-            if self.orientation == 'up':
-                base_y = draw_y
-                tip_y = draw_y - self.current_height
-                for i in range(num_spikes):
-                    x = draw_x + i * spike_width
-                    points = [
-                        (x, base_y),
-                        (x + spike_width // 2, tip_y),
-                        (x + spike_width, base_y)
-                    ]
-                    pygame.draw.polygon(screen, spike_color, points)
-                    pygame.draw.polygon(screen, (150, 30, 30), points, 2)
-            
-            else:  # 'down'
-                base_y = draw_y
-                tip_y = draw_y + self.current_height
-                for i in range(num_spikes):
-                    x = draw_x + i * spike_width
-                    points = [
-                        (x, base_y),
-                        (x + spike_width // 2, tip_y),
-                        (x + spike_width, base_y)
-                    ]
-                    pygame.draw.polygon(screen, spike_color, points)
-                    pygame.draw.polygon(screen, (150, 30, 30), points, 2)
-        
-        # Draw hitbox if debug mode is enabled
-        if show_hitboxes and self.is_dangerous():
-            hitbox = self.get_hitbox()
-            debug_rect = hitbox.copy()
-            debug_rect.x -= camera.x
-            debug_rect.y -= camera.y
-            pygame.draw.rect(screen, (255, 0, 255), debug_rect, 2)  # Magenta outline
+        """Draw telegraph markers and spikes (one blit each)"""
+        n = self.count
+        if n == 0:
+            return
+        # Round heights up so every spike that can hurt is visible
+        steps = np.ceil(self.height[:n] * (self.HEIGHT_STEPS / self.MAX_HEIGHT)).astype(np.int64)
+        blits = []
+        for x, y, down, state, step in zip(self.x[:n].tolist(), self.y[:n].tolist(), self.down[:n].tolist(),
+                                           self.state[:n].tolist(), steps.tolist()):
+            draw_x = int(x - camera.x)
+            draw_y = int(y - camera.y)
+            if state == self.TELEGRAPH:
+                sprite, (dx, dy) = self.get_telegraph_sprite(down)
+                blits.append((sprite, (draw_x + dx, draw_y + dy)))
+            if step > 0:
+                sprite, (dx, dy) = self.get_sprite(down, min(step, self.HEIGHT_STEPS))
+                blits.append((sprite, (draw_x + dx, draw_y + dy)))
+        screen.blits(blits, doreturn=False)
+
+        # Draw hitboxes if debug mode is enabled
+        if show_hitboxes:
+            dangerous = np.flatnonzero(self.state[:n] != self.TELEGRAPH)
+            for left, top, height in zip(*(part.tolist() for part in self._hitboxes(dangerous))):
+                debug_rect = pygame.Rect(left - camera.x, top - camera.y, self.WIDTH, height)
+                pygame.draw.rect(screen, (255, 0, 255), debug_rect, 2)  # Magenta outline
@@ -2,67 +2,63 @@
 Flux Surge power-up
 """
 import pygame
-from game.core import settings
+from game.core import settings, get_log
 import math
+from game.entities.collectible import Collectible
+from game.io.assets import load_image, get_sprite_frames
 
+STAR_SHEET = 'game/assets/images/sprites/Star.png'
 
-class FluxStar:
+
+def split_star_frames(sprite_sheet, size):
+    """Cut the horizontal star sheet into square frames scaled to size x size"""
+    sheet_width = sprite_sheet.get_width()
+    sheet_height = sprite_sheet.get_height()
+    frame_width = sheet_height  # Assuming frames are square
+    num_frames = sheet_width // frame_width
+    
+    frames = []
+    for i in range(num_frames):
+        frame_rect = pygame.Rect(i * frame_width, 0, frame_width, sheet_height)
+        frame = sprite_sheet.subsurface(frame_rect).copy()
+        frames.append(pygame.transform.scale(frame, (size, size)))
+    return frames
+
+
+class FluxStar(Collectible):
     """Flux Surge power-up"""
     
+    __slots__ = ('frame_duration', 'frames')
+    
     def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 24, 24)
-        self.collected = False
-        self.rotation = 0
-        self.pulse = 0
+        super().__init__(pygame.Rect(x, y, 24, 24))
         
-        # Try to load star sprite sheet and extract frames
-        self.frames = []
-        self.current_frame = 0
-        self.animation_time = 0
         self.frame_duration = 0.08  # seconds per frame
         
-        try:
-            sprite_path = 'game/assets/images/sprites/Star.png'
-            sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-            
-            # Extract frames from sprite sheet (assuming horizontal layout)
-            sheet_width = sprite_sheet.get_width()
-            sheet_height = sprite_sheet.get_height()
-            frame_width = sheet_height  # Assuming frames are square
-            num_frames = sheet_width // frame_width
-            
-            for i in range(num_frames):
-                frame_rect = pygame.Rect(i * frame_width, 0, frame_width, sheet_height)
-                frame = sprite_sheet.subsurface(frame_rect).copy()
-                # Scale to desired size
-                frame_scaled = pygame.transform.scale(frame, (24, 24))
-                self.frames.append(frame_scaled)
-        except Exception as e:
-            print(f"Failed to load star sprite: {e}")
-            pass  # Use fallback rendering
+        # Prebuilt frames from the asset bundle, else cut them from the sheet
+        self.frames = get_sprite_frames('star/24')
+        if not self.frames:
+            try:
+                self.frames = split_star_frames(load_image(STAR_SHEET), 24)
+            except Exception as e:
+                get_log('assets').warning("Failed to load star sprite: %s", e)  # Use fallback rendering
     
-    def update(self, dt, player_rect):
-        """Update star and check collection"""
-        if self.collected:
-            return False
-        
-        # Update animation
-        if len(self.frames) > 0:
-            self.animation_time += dt
-            if self.animation_time >= self.frame_duration:
-                self.animation_time = 0
-                self.current_frame = (self.current_frame + 1) % len(self.frames)
-        
-        # Rotation animation (for fallback)
-        self.rotation += dt * 180  # degrees per second
-        self.pulse += dt * 4
-        
-        # Check collision with player
-        if self.rect.colliderect(player_rect):
-            self.collected = True
-            return True
-        
-        return False
+    @property
+    def current_frame(self):
+        """Animation frame index derived from the animation clock"""
+        if not self.frames:
+            return 0
+        return int(self.anim_time / self.frame_duration) % len(self.frames)
+    
+    @property
+    def rotation(self):
+        """Rotation for fallback rendering (degrees)"""
+        return self.anim_time * 180  # degrees per second
+    
+    @property
+    def pulse(self):
+        """Glow pulse phase"""
+        return self.anim_time * 4
     
     def draw(self, screen, camera):
         """Draw star with glow effect"""
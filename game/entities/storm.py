@@ -4,41 +4,37 @@ Storm powerup - permanent stamina boost
 import pygame
 from game.core import settings
 import math
+from game.entities.collectible import Collectible
+from game.io.assets import load_image, get_sprite
 
 
-class StormPowerup:
+class StormPowerup(Collectible):
     """Energy powerup that permanently increases stamina capacity and regen rate"""
     
+    __slots__ = ('sprite',)
+    
     def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 24, 24)
-        self.collected = False
-        self.rotation = 0
-        self.pulse = 0
+        super().__init__(pygame.Rect(x, y, 24, 24))
         
         # Try to load energy sprite
-        self.sprite = None
-        try:
-            sprite_path = 'game/assets/images/sprites/energy.png'
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (32, 32))
-        except:
-            pass  # Use fallback rendering
+        self.sprite = get_sprite('storm/32')
+        if self.sprite is None:
+            try:
+                sprite_path = 'game/assets/images/sprites/energy.png'
+                self.sprite = load_image(sprite_path)
+                self.sprite = pygame.transform.scale(self.sprite, (32, 32))
+            except:
+                pass  # Use fallback rendering
     
-    def update(self, dt, player_rect):
-        """Update storm powerup and check collection"""
-        if self.collected:
-            return False
-        
-        # Rotation and pulse animation
-        self.rotation += dt * 120  # degrees per second
-        self.pulse += dt * 5
-        
-        # Check collision with player
-        if self.rect.colliderect(player_rect):
-            self.collected = True
-            return True
-        
-        return False
+    @property
+    def rotation(self):
+        """Sprite rotation (degrees)"""
+        return self.anim_time * 120  # degrees per second
+    
+    @property
+    def pulse(self):
+        """Glow pulse phase"""
+        return self.anim_time * 5
     
     def draw(self, screen, camera):
         """Draw energy powerup"""
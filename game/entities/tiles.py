@@ -2,7 +2,7 @@
 Interactive tile entities (crates, coin boxes, etc.)
 """
 import pygame
-from game.core import settings
+from game.core import settings, get_font
 
 
 class Crate:
@@ -90,7 +90,7 @@ class CoinBox:
         
         # Draw question mark if has coins
         if self.coins_left > 0:
-            font = pygame.font.Font(None, 24)
+            font = get_font(24)
             text = font.render('?', True, settings.COLOR_BLACK)
             text_rect = text.get_rect(center=draw_rect.center)
             screen.blit(text, text_rect)
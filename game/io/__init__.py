@@ -1,4 +1,11 @@
 """
-Input/Output systems
+Input/Output systems (modules are imported on first access)
 """
-from .input import InputHandler
+from game.core.utils import lazy_exports
+
+_EXPORTS = {
+    'InputHandler': '.input',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
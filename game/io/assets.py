@@ -0,0 +1,253 @@
+"""
+Image cache and threaded asset preloading
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from game.core import settings
+from game.core.log import get_log
+
+_log = get_log('assets')
+
+# Every image the game loads from disk (decoded up front by AssetPreloader)
+IMAGE_FILES = [
+    'game/assets/images/bg/Layers/back.png',
+    'game/assets/images/bg/Layers/buildings.png',
+    'game/assets/images/bg/Layers/front.png',
+    'game/assets/images/sprites/buddie0_sheet.png',
+    'game/assets/images/sprites/Star.png',
+    'game/assets/images/sprites/energy.png',
+    'game/assets/images/sprites/alienblue.png',
+    'game/assets/images/sprites/aliengreen.png',
+    'game/assets/images/sprites/alienred.png',
+]
+
+_images = {}  # (path, alpha) -> display-format Surface
+_raw_images = {}  # path -> decoded Surface waiting for conversion
+_missing = set()  # Paths that failed to load
+
+
+def _convert(surface, alpha):
+    """Convert to the display pixel format (needs a display mode)"""
+    if not pygame.display.get_surface():
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def load_image(path, alpha=True):
+    """Display-format surface for `path`, loaded once and shared
+
+    Callers must copy() the result before modifying it in place.
+    Raises FileNotFoundError for files that don't exist, like pygame does.
+    """
+    key = (path, alpha)
+    surface = _images.get(key)
+    if surface is not None:
+        return surface
+    if path in _missing:
+        raise FileNotFoundError(path)
+
+    raw = _raw_images.get(path)
+    if raw is None:
+        try:
+            raw = pygame.image.load(path)
+        except (FileNotFoundError, pygame.error):
+            _missing.add(path)
+            raise
+        _raw_images[path] = raw
+
+    surface = _convert(raw, alpha)
+    _images[key] = surface
+    return surface
+
+
+# Prebuilt asset bundle (python -m game.tools.build_assets)
+BUNDLE_FILE = 'game/assets/build/assets.bundle'
+BUNDLE_MAGIC = b'GCAB'
+BUNDLE_VERSION = 2
+BUNDLE_HEADER = struct.Struct('<4sIII')  # magic, version, manifest length, data start
+BUNDLE_SETTINGS = ('SCREEN_WIDTH', 'SCREEN_HEIGHT')  # Settings the build depends on, recorded in the manifest
+
+_bundle = None  # {'mmap', 'manifest', 'images', 'sprites'} once opened, False if unavailable
+
+
+def source_digest(path):
+    """SHA-1 of a source file's contents (None if it can't be read), as recorded in the bundle manifest"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _stale_reason(manifest):
+    """Why the bundle no longer matches the sources and settings it was built from, or None"""
+    for path, digest in manifest.get('sources', {}).items():
+        if source_digest(path) != digest:
+            return f"{path} changed"
+    for name, value in manifest.get('settings', {}).items():
+        if getattr(settings, name, None) != value:
+            return f"settings.{name} changed"
+    return None
+
+
+def _open_bundle():
+    """Map the bundle file and read its manifest (once); a stale bundle is ignored"""
+    global _bundle
+    if _bundle is not None:
+        return _bundle
+
+    _bundle = False
+    if not os.path.exists(BUNDLE_FILE):
+        return _bundle
+    try:
+        with open(BUNDLE_FILE, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, manifest_size, data_start = BUNDLE_HEADER.unpack_from(data, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            _log.warning("Ignoring %s (unknown format, rebuild it)", BUNDLE_FILE)
+            return _bundle
+        manifest = json.loads(bytes(data[BUNDLE_HEADER.size:BUNDLE_HEADER.size + manifest_size]))
+        stale = _stale_reason(manifest)
+        if stale:
+            _log.warning("Ignoring %s (%s since it was built, rebuild it)", BUNDLE_FILE, stale)
+            data.close()
+            return _bundle
+        _bundle = {'mmap': data, 'data_start': data_start, 'manifest': manifest, 'images': {}, 'sprites': {}}
+    except Exception as e:
+        _log.warning("Could not open asset bundle: %s", e)
+    return _bundle
+
+
+def bundle_available():
+    """True if a prebuilt asset bundle is present"""
+    return bool(_open_bundle())
+
+
+def _bundle_image(bundle, name):
+    """Display-format surface for a whole image (atlas page or layer) in the bundle"""
+    surface = bundle['images'].get(name)
+    if surface is None:
+        entry = bundle['manifest']['images'][name]
+        offset, size = bundle['data_start'] + entry['offset'], entry['size']
+        pixels = memoryview(bundle['mmap'])[offset:offset + size]
+        surface = pygame.image.frombuffer(pixels, (entry['width'], entry['height']), 'RGBA')
+        surface = _convert(surface, True) if pygame.display.get_surface() else surface.copy()
+        bundle['images'][name] = surface
+    return surface
+
+
+def warm_bundle():
+    """Convert every image in the bundle now rather than on first use"""
+    bundle = _open_bundle()
+    if bundle:
+        for name in bundle['manifest']['images']:
+            _bundle_image(bundle, name)
+
+
+def get_sprite(name):
+    """Prebuilt surface `name` from the bundle, or None if there is no bundle/entry
+
+    Shared like load_image(): copy() before modifying in place.
+    """
+    bundle = _open_bundle()
+    if not bundle:
+        return None
+    sprite = bundle['sprites'].get(name)
+    if sprite is not None:
+        return sprite
+
+    entry = bundle['manifest']['sprites'].get(name)
+    if entry is None:
+        return None
+    page = _bundle_image(bundle, entry['image'])
+    rect = entry.get('rect')
+    sprite = page.subsurface(rect) if rect else page
+    bundle['sprites'][name] = sprite
+    return sprite
+
+
+def get_sprite_frames(name):
+    """Prebuilt animation frames `name_0`, `name_1`, ... (empty list if not bundled)"""
+    frames = []
+    while True:
+        frame = get_sprite(f"{name}_{len(frames)}")
+        if frame is None:
+            return frames
+        frames.append(frame)
+
+
+class AssetPreloader:
+    """Decodes images and sounds on a thread pool while the game keeps drawing
+
+    The worker threads only decode files; poll() runs on the main thread and
+    converts finished images to the display format within a time budget.
+    """
+
+    def __init__(self, images=None, sounds=None, workers=None):
+        if images is None:
+            # The bundle already holds everything derived from the source images
+            images = [] if bundle_available() else IMAGE_FILES
+        self.images = images
+        self.sounds = {}  # name -> pygame.mixer.Sound (or None on failure)
+        self.start_time = time.perf_counter()
+        self.finish_time = None
+
+        workers = workers or min(4, os.cpu_count() or 1)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='asset-loader')
+        self.jobs = []  # (kind, key, future)
+        for path in self.images:
+            if path not in _raw_images and not any(k[0] == path for k in _images):
+                self.jobs.append(('image', path, self.executor.submit(pygame.image.load, path)))
+        for name, path in (sounds or {}).items():
+            self.jobs.append(('sound', name, self.executor.submit(pygame.mixer.Sound, path)))
+        self.total = len(self.jobs)
+        self.done = 0
+
+    def poll(self, budget=0.004):
+        """Take finished jobs (main thread); returns progress in 0..1"""
+        deadline = time.perf_counter() + budget
+        pending = []
+        for job in self.jobs:
+            kind, key, future = job
+            if not future.done() or time.perf_counter() > deadline:
+                pending.append(job)
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                _log.warning("Could not preload %s: %s", key, e)
+                result = None
+            if kind == 'image':
+                if result is None:
+                    _missing.add(key)
+                else:
+                    _raw_images[key] = result
+                    load_image(key)  # Display-format conversion
+            else:
+                self.sounds[key] = result
+            self.done += 1
+        self.jobs = pending
+
+        if not self.jobs and self.finish_time is None:
+            warm_bundle()
+            self.finish_time = time.perf_counter()
+            self.executor.shutdown(wait=False)
+        return self.progress
+
+    @property
+    def progress(self):
+        return 1.0 if self.total == 0 else self.done / self.total
+
+    def is_done(self):
+        return not self.jobs
+
+    def elapsed(self):
+        """Seconds from start until everything finished (or until now)"""
+        end = self.finish_time if self.finish_time is not None else time.perf_counter()
+        return end - self.start_time
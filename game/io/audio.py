@@ -3,6 +3,9 @@ Audio management system
 """
 import pygame
 import os
+from game.core import get_log
+
+_log = get_log('audio')
 
 
 class AudioManager:
@@ -21,6 +24,16 @@ class AudioManager:
     SFX_GAME_OVER = 'game/assets/audio/sfx/game-over-39-199830.mp3'
     SFX_DEAD = 'game/assets/audio/sfx/dead-sound.mp3'
     
+    # SFX name -> file (decoded up front, see AssetPreloader)
+    SFX_FILES = {
+        'bump': SFX_BUMP,
+        'stomp': SFX_STOMP,
+        'coin': SFX_COIN,
+        'powerup': SFX_POWERUP,
+        'game_over': SFX_GAME_OVER,
+        'dead-sound': SFX_DEAD,
+    }
+    
     def __init__(self):
         pygame.mixer.init()
         
@@ -46,10 +59,18 @@ class AudioManager:
             sound.set_volume(self.sfx_volume)
             self.sfx_cache[name] = sound
         except:
-            print(f"Warning: Could not load SFX '{name}' from {filepath}")
+            _log.warning("Could not load SFX '%s' from %s", name, filepath)
             # Create a dummy silent sound
             self.sfx_cache[name] = None
     
+    def add_sfx(self, name, sound, filepath=''):
+        """Register an already decoded sound effect"""
+        if sound is None:
+            _log.warning("Could not load SFX '%s' from %s", name, filepath)
+        else:
+            sound.set_volume(self.sfx_volume)
+        self.sfx_cache[name] = sound
+    
     def play_sfx(self, name):
         """Play a sound effect"""
         if name in self.sfx_cache and self.sfx_cache[name]:
@@ -64,7 +85,7 @@ class AudioManager:
                 pygame.mixer.music.play(loops)
                 self.current_music = filepath
         except:
-            print(f"Warning: Could not load music from {filepath}")
+            _log.warning("Could not load music from %s", filepath)
     
     def stop_music(self):
         """Stop background music"""
@@ -99,15 +120,17 @@ class AudioManager:
         """Get current SFX volume"""
         return self.sfx_volume
     
-    def load_all_audio(self):
-        """Pre-load all necessary music and SFX at game startup"""
+    def load_all_audio(self, sounds=None):
+        """Pre-load all necessary music and SFX at game startup
+        
+        sounds: optional name -> Sound already decoded by an AssetPreloader
+        """
         # Load SFX
-        self.load_sfx('bump', self.SFX_BUMP)
-        self.load_sfx('stomp', self.SFX_STOMP)
-        self.load_sfx('coin', self.SFX_COIN)
-        self.load_sfx('powerup', self.SFX_POWERUP)
-        self.load_sfx('game_over', self.SFX_GAME_OVER)
-        self.load_sfx('dead-sound', self.SFX_DEAD)
+        for name, filepath in self.SFX_FILES.items():
+            if sounds and name in sounds:
+                self.add_sfx(name, sounds[name], filepath)
+            else:
+                self.load_sfx(name, filepath)
         
         # Load placeholder SFX for sounds we don't have files for yet
         placeholder_sfx = ['jump', 'gravity_flip', 'hit', 'enemy_defeat', 
@@ -2,13 +2,31 @@
 Level loading from JSON format
 """
 import json
-from game.core import settings
+from game.core import settings, get_log
 from game.world.tile import Tile
 
+_log = get_log('loader')
+
 
 class LevelLoader:
     """Loads level data from JSON"""
     
+    _templates = {}  # filepath -> parsed level data, shared (see load_template)
+    
+    @staticmethod
+    def load_template(filepath):
+        """Parsed level data, parsed once per file and shared by every LevelState
+        
+        The result is a read-only template: the tile grid and entity spawn
+        dicts must not be modified (nothing in the game mutates tiles).
+        Safe to call from a worker thread to parse a level ahead of time.
+        """
+        template = LevelLoader._templates.get(filepath)
+        if template is None:
+            template = LevelLoader.load_from_json(filepath)
+            LevelLoader._templates[filepath] = template
+        return template
+    
     @staticmethod
     def load_from_json(filepath):
         """Load level from JSON file"""
@@ -17,7 +35,7 @@ class LevelLoader:
                 data = json.load(f)
             return LevelLoader._parse_level_data(data)
         except FileNotFoundError:
-            print(f"Warning: Level file {filepath} not found, using test level")
+            _log.warning("Level file %s not found, using test level", filepath)
             return LevelLoader.create_test_level()
     
     @staticmethod
@@ -100,6 +118,8 @@ class LevelLoader:
                                              breakable=True, charged_face=face)
         
         # Parse entities
+        # Every entity gets an 'id': its index within its type's list. IDs are
+        # dense and stable for a given level file (checkpoint snapshots use them)
         entities_data = level_data.get('entities', {})
         
         # Coins
@@ -108,7 +128,7 @@ class LevelLoader:
             col, row = pos[0], pos[1]
             x = col * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 8
             y = row * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 8
-            coins.append((x, y))
+            coins.append({'id': len(coins), 'x': x, 'y': y})
         
         # Stars (Flux Surge)
         stars = []
@@ -116,7 +136,7 @@ class LevelLoader:
             col, row = pos[0], pos[1]
             x = col * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 12
             y = row * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 12
-            stars.append((x, y))
+            stars.append({'id': len(stars), 'x': x, 'y': y})
         
         # Power-ups
         powerups = []
@@ -125,7 +145,7 @@ class LevelLoader:
             ptype = pos[2] if len(pos) > 2 else 'speed'
             x = col * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 12
             y = row * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 12
-            powerups.append({'x': x, 'y': y, 'type': ptype})
+            powerups.append({'id': len(powerups), 'x': x, 'y': y, 'type': ptype})
         
         # Storm powerups
         storms = []
@@ -133,8 +153,9 @@ class LevelLoader:
             col, row = pos[0], pos[1]
             x = col * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 12
             y = row * settings.TILE_SIZE + settings.TILE_SIZE // 2 - 12
-            print(f"Level loader: Adding storm at ({x}, {y})")  # Debug output
-            storms.append((x, y))
+            if _log.on_debug:
+                _log.debug("Adding storm at (%d, %d)", x, y)
+            storms.append({'id': len(storms), 'x': x, 'y': y})
         
         # Spikes
         spikes = []
@@ -143,7 +164,7 @@ class LevelLoader:
             orientation = pos[2] if len(pos) > 2 else 'up'
             x = col * settings.TILE_SIZE
             y = row * settings.TILE_SIZE
-            spikes.append({'x': x, 'y': y, 'orientation': orientation})
+            spikes.append({'id': len(spikes), 'x': x, 'y': y, 'orientation': orientation})
         
         # Buttons
         buttons = []
@@ -151,9 +172,11 @@ class LevelLoader:
             col, row = pos[0], pos[1]
             color = pos[2] if len(pos) > 2 else 'red'
             facing = pos[3] if len(pos) > 3 else 'up'
+            toggles = pos[4] if len(pos) > 4 else []  # Ids of the gates it opens/closes
             x = col * settings.TILE_SIZE
             y = row * settings.TILE_SIZE
-            buttons.append({'x': x, 'y': y, 'color': color, 'facing': facing})
+            buttons.append({'id': len(buttons), 'x': x, 'y': y, 'color': color, 'facing': facing,
+                            'toggles': toggles})
         
         # Gates
         gates = []
@@ -164,7 +187,7 @@ class LevelLoader:
             x = col * settings.TILE_SIZE
             y = row * settings.TILE_SIZE
             height = height_tiles * settings.TILE_SIZE
-            gates.append({'x': x, 'y': y, 'height': height, 'orientation': orientation})
+            gates.append({'id': len(gates), 'x': x, 'y': y, 'height': height, 'orientation': orientation})
         
         # Breakable blocks
         breakables = []
@@ -173,7 +196,7 @@ class LevelLoader:
             contents = pos[2] if len(pos) > 2 else None
             x = col * settings.TILE_SIZE
             y = row * settings.TILE_SIZE
-            breakables.append({'x': x, 'y': y, 'contents': contents})
+            breakables.append({'id': len(breakables), 'x': x, 'y': y, 'contents': contents})
         
         # Checkpoints
         checkpoints = []
@@ -194,6 +217,7 @@ class LevelLoader:
             x = col * settings.TILE_SIZE
             y = row * settings.TILE_SIZE
             enemies.append({
+                'id': len(enemies),
                 'type': 'drone',
                 'x': x,
                 'y': y,
@@ -265,14 +289,14 @@ class LevelLoader:
             'boss_x': 4480,
             'boss_y': 360,
             'checkpoints': [(1600, settings.WORLD_HEIGHT - 96)],
-            'coins': [(400 + i * 64, settings.WORLD_HEIGHT - 160) for i in range(20)],
-            'stars': [(2400, settings.WORLD_HEIGHT - 180)],
+            'coins': [{'id': i, 'x': 400 + i * 64, 'y': settings.WORLD_HEIGHT - 160} for i in range(20)],
+            'stars': [{'id': 0, 'x': 2400, 'y': settings.WORLD_HEIGHT - 180}],
             'powerups': [],
             'spikes': [],
             'breakables': [],
             'enemies': [
-                {'type': 'drone', 'x': 800, 'y': settings.WORLD_HEIGHT - 80, 'anchor': 'floor', 'range': 128, 'color': 'blue'},
-                {'type': 'drone', 'x': 1200, 'y': settings.WORLD_HEIGHT - 80, 'anchor': 'floor', 'range': 96, 'color': 'green'}
+                {'id': 0, 'type': 'drone', 'x': 800, 'y': settings.WORLD_HEIGHT - 80, 'anchor': 'floor', 'range': 128, 'color': 'blue'},
+                {'id': 1, 'type': 'drone', 'x': 1200, 'y': settings.WORLD_HEIGHT - 80, 'anchor': 'floor', 'range': 96, 'color': 'green'}
             ],
             'buttons': [],
             'gates': []
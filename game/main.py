@@ -1,23 +1,66 @@
 """
 Gravity Courier - Main entry point
 """
-import pygame
 import sys
-from game.core import StateStack, settings
-from game.ui.main_menu import MainMenuState
+import time
+_start_time = time.perf_counter()  # For time-to-first-frame
+
+# --profile-startup: time every import from here on (see game.tools.startup_profile)
+_profiler = None
+if '--profile-startup' in sys.argv:
+    from game.tools.startup_profile import StartupProfiler
+    _profiler = StartupProfiler(_start_time)
+    _profiler.install()
+
+import pygame
+from game.core import StateStack, settings, log
+from game.core.telemetry import telemetry
+from game.core.hitch import hitches
+from game.core.gc_policy import gc_policy
+from game.core.save_system import SaveSystem
+from game.ui.loading import LoadingState
 from game.io.audio import AudioManager
 
 
 def main():
     """Main game loop"""
+    # --log=camera:debug,level:debug sets per-category log levels; crashes dump the trace ring
+    for arg in sys.argv[1:]:
+        if arg.startswith('--log='):
+            log.configure(arg[len('--log='):])
+    log.install_crash_dump()
+    
+    # --memory-report [level ids]: print what each level holds in memory and exit (see game.tools.memory_report)
+    if '--memory-report' in sys.argv:
+        from game.tools.memory_report import run
+        sys.exit(run(sys.argv[sys.argv.index('--memory-report') + 1:]))
+    
+    # --hitch-budget=MS overrides settings.HITCH_BUDGET for hitch snapshots and telemetry
+    budget = None
+    for arg in sys.argv[1:]:
+        if arg.startswith('--hitch-budget='):
+            budget = float(arg[len('--hitch-budget='):]) / 1000
+    
+    # --telemetry records frame metrics to settings.TELEMETRY_FILE; --telemetry-port=N also serves them live
+    port = settings.TELEMETRY_PORT
+    for arg in sys.argv[1:]:
+        if arg.startswith('--telemetry-port='):
+            port = int(arg[len('--telemetry-port='):])
+    if settings.TELEMETRY_ENABLED or port or '--telemetry' in sys.argv:
+        telemetry.start(port=port, hitch_budget=budget)
+    
     # Initialize Pygame
     pygame.init()
     pygame.mixer.init()
     
     # Create window
-    # 1280x720
-    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    # 1280x720; --scaled: resizable, SDL scales it to the window (and fullscreen with F11)
+    scaled = settings.DISPLAY_SCALED or '--scaled' in sys.argv
+    flags = pygame.SCALED | pygame.RESIZABLE if scaled else 0
+    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), flags)
     pygame.display.set_caption(settings.TITLE)
+    if _profiler:
+        _profiler.mark('window created')
     
     # Create clock
     clock = pygame.time.Clock()
@@ -25,15 +68,33 @@ def main():
     # Create state stack
     state_stack = StateStack(screen)
     
+    # --render-scale=0.5..1: draw the background and tiles at reduced resolution (see LevelState)
+    for arg in sys.argv[1:]:
+        if arg.startswith('--render-scale='):
+            state_stack.persistent_data['render_scale'] = float(arg[len('--render-scale='):])
+    
     # Initialize audio manager
     audio_manager = AudioManager()
     state_stack.persistent_data['audio'] = audio_manager
     
-    # Load all audio assets
-    audio_manager.load_all_audio()
+    if _profiler:
+        _profiler.mark('audio ready')
+    
+    # Snapshot frames that go over budget (see game.core.hitch)
+    if settings.HITCH_SNAPSHOTS and '--no-hitch-snapshots' not in sys.argv:
+        hitches.start(state_stack, budget)
     
-    # Push initial state
-    state_stack.push(MainMenuState)
+    # Freeze and tune the garbage collector during levels (see game.core.gc_policy)
+    if settings.GC_POLICY and '--no-gc-policy' not in sys.argv:
+        gc_policy.start()
+    overlay = None  # Profiler overlay, created on the first F3
+    
+    # Push initial state (assets load in the background, then the main menu opens)
+    state_stack.push(LoadingState)
+    first_frame = True
+    
+    if _profiler:
+        _profiler.mark('first state pushed')
     
     # Main loop
     running = True
@@ -41,14 +102,26 @@ def main():
         # Get delta time
         dt = clock.tick(settings.FPS) / 1000.0  # Convert to seconds
         state_stack.persistent_data['fps'] = clock.get_fps()
+        frame_start = time.perf_counter()
+        hitches.begin_frame()
         
         # Handle events
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == settings.LOG_DUMP_KEY:
+                log.get_log('boot').info("Trace ring written to %s", log.dump(reason="Dump requested (F9)"))
+            elif event.type == pygame.KEYDOWN and event.key == settings.PROFILER_OVERLAY_KEY:
+                if overlay is None:
+                    from game.ui.profiler_overlay import ProfilerOverlay
+                    overlay = ProfilerOverlay()
+                overlay.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == settings.FULLSCREEN_KEY and scaled:
+                pygame.display.toggle_fullscreen()
             else:
                 state_stack.handle_event(event)
+        hitches.mark('events')
         
         # Check if state stack is empty
         if state_stack.is_empty():
@@ -56,14 +129,35 @@ def main():
         
         # Update
         state_stack.update(dt, events)
+        update_end = time.perf_counter()
+        hitches.mark('update')
         
         # Draw
         state_stack.draw(screen)
+        if overlay:
+            overlay.draw(screen)
+        hitches.mark('draw')
         
         # Flip display
         pygame.display.flip()
+        hitches.mark('flip')
+        draw_time = time.perf_counter() - update_end
+        telemetry.frame(dt, update_end - frame_start, draw_time)
+        if overlay:
+            overlay.frame(dt, update_end - frame_start, draw_time)
+        hitches.end_frame()
+        
+        if first_frame:
+            first_frame = False
+            log.get_log('boot').info("First frame after %.0f ms", (time.perf_counter() - _start_time) * 1000)
+            if _profiler:
+                _profiler.first_frame()
     
-    # Cleanup
+    # Cleanup - make sure queued saves reach the disk
+    SaveSystem.flush()
+    telemetry.stop()
+    if _profiler:
+        print(_profiler.report_on_demand())
     pygame.quit()
     sys.exit()
 
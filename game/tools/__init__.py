@@ -0,0 +1,3 @@
+"""
+Development tools (run with python -m game.tools.<name>)
+"""
@@ -0,0 +1,199 @@
+"""
+Offline asset build: python -m game.tools.build_assets
+
+Precomputes everything the game derives from the source art at runtime
+(cropped/scaled player and drone sprites, star frames, dimmed background
+layers), packs the small sprites into texture atlases and writes it all to
+one bundle file that the game maps with mmap (see game.io.assets). Also
+fills the navigation graph cache for every level (see game.world.navigation).
+
+Bundle layout:
+    header   magic 'GCAB', version, manifest length, data start (little endian u32)
+    manifest JSON: {'images': {name: {offset, size, width, height}},
+                    'sprites': {name: {image, rect}},
+                    'sources': {path: SHA-1 of the file}, 'settings': {name: value}}
+    data     raw RGBA pixels of every image, 16-byte aligned, offsets relative to data start
+
+The game ignores the bundle when any source file or setting it records has
+changed since (see assets.BUNDLE_SETTINGS), so rebuild after editing the art.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import numpy as np
+import pygame
+from game.core import settings
+from game.io import assets
+from game.io.assets import load_image
+from game.entities.player import PLAYER_SHEET, extract_sheet_frames, prepare_frame, crop_surface
+from game.entities.star import STAR_SHEET, split_star_frames
+from game.world.background import ParallaxBackground
+from game.world.navigation import get_nav_graph
+from game.io.level_loader import LevelLoader
+
+PLAYER_SIZE = (24, 32)  # Player rect
+DRONE_SIZE = (40, 30)  # Drone rect
+DRONE_COLORS = ['blue', 'green', 'red']
+STORM_SHEET = 'game/assets/images/sprites/energy.png'
+ATLAS_WIDTH = 512
+ALIGN = 16
+
+
+def rgba_surface(surface):
+    """Copy with colorkey and surface alpha baked into per-pixel alpha"""
+    rgba = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    if surface.get_colorkey() is not None:
+        rgba.blit(surface, (0, 0))  # Colorkey pixels stay transparent
+    else:
+        rgba.blit(surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)  # Exact copy onto (0,0,0,0)
+
+    alpha = surface.get_alpha()
+    if surface.get_flags() & pygame.SRCALPHA and alpha is not None and alpha < 255:
+        pixels = pygame.surfarray.pixels_alpha(rgba)
+        pixels[...] = (pixels.astype(np.uint16) * alpha + 127) // 255
+        del pixels  # Unlock the surface
+    return rgba
+
+
+def collect_sprites():
+    """name -> Surface for everything that goes into the atlases"""
+    sprites = {}
+
+    sheet = load_image(PLAYER_SHEET, alpha=False).copy()
+    sheet.set_colorkey((0, 0, 0))
+    frames = extract_sheet_frames(sheet)
+    sprites['player/idle'] = prepare_frame(frames['idle'], PLAYER_SIZE)
+    for i, frame in enumerate(frames['walk']):
+        sprites[f'player/walk_{i}'] = prepare_frame(frame, PLAYER_SIZE)
+    for i, frame in enumerate(frames['attack']):
+        sprites[f'player/attack_{i}'] = prepare_frame(frame, PLAYER_SIZE)
+    for i, frame in enumerate(frames['bullet']):
+        sprites[f'player/bullet_{i}'] = frame
+
+    for color in DRONE_COLORS:
+        image = load_image(f'game/assets/images/sprites/alien{color}.png')
+        sprites[f'drone/{color}'] = pygame.transform.scale(crop_surface(image), DRONE_SIZE)
+
+    for size in (24, 20):  # In-level stars and the how-to-play screen
+        for i, frame in enumerate(split_star_frames(load_image(STAR_SHEET), size)):
+            sprites[f'star/{size}_{i}'] = frame
+
+    sprites['storm/32'] = pygame.transform.scale(load_image(STORM_SHEET), (32, 32))
+    return sprites
+
+
+def pack_atlases(sprites, width=ATLAS_WIDTH, padding=1):
+    """Shelf-pack sprites into atlas pages; returns (pages, name -> (page, rect))"""
+    names = sorted(sprites, key=lambda name: (-sprites[name].get_height(), name))
+    placements = {}
+    x = y = shelf_height = 0
+    for name in names:
+        w, h = sprites[name].get_size()
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        placements[name] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+
+    page = pygame.Surface((width, y + shelf_height), pygame.SRCALPHA)
+    page.fill((0, 0, 0, 0))
+    for name, rect in placements.items():
+        page.blit(rgba_surface(sprites[name]), rect[:2], special_flags=pygame.BLEND_RGBA_MAX)
+
+    return {'atlas/0': page}, {name: ('atlas/0', rect) for name, rect in placements.items()}
+
+
+def collect_layers():
+    """Bundle name -> finished background layer for the configured screen size"""
+    layers = {}
+    for path in ParallaxBackground.LAYER_PATHS:
+        image = load_image(path)
+        name = ParallaxBackground.layer_name(path, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        layers[name] = ParallaxBackground.build_layer(image, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    return layers
+
+
+def write_bundle(path, images, sprites, sources):
+    """Write images (name -> Surface) and sprite placements to a bundle file"""
+    manifest = {'images': {}, 'sprites': {}, 'sources': sources, 'built_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'settings': {name: getattr(settings, name) for name in assets.BUNDLE_SETTINGS}}
+    blobs = []
+    offset = 0
+    for name, surface in images.items():
+        data = pygame.image.tobytes(rgba_surface(surface), 'RGBA')
+        width, height = surface.get_size()
+        manifest['images'][name] = {'offset': offset, 'size': len(data), 'width': width, 'height': height}
+        padding = -len(data) % ALIGN
+        blobs.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    for name, (image, rect) in sprites.items():
+        manifest['sprites'][name] = {'image': image, 'rect': list(rect) if rect else None}
+
+    manifest_bytes = json.dumps(manifest, sort_keys=True).encode('utf-8')
+    header_size = assets.BUNDLE_HEADER.size
+    data_start = header_size + len(manifest_bytes)
+    data_start += -data_start % ALIGN
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(assets.BUNDLE_HEADER.pack(assets.BUNDLE_MAGIC, assets.BUNDLE_VERSION, len(manifest_bytes), data_start))
+        f.write(manifest_bytes)
+        f.write(b'\0' * (data_start - header_size - len(manifest_bytes)))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return data_start + offset
+
+
+def build_nav_graphs():
+    """Fill the navigation graph cache for every level (gates closed, as levels start)"""
+    for path in sorted(glob.glob('game/assets/levels/level*.json')):
+        start = time.perf_counter()
+        graph = get_nav_graph(path, LevelLoader.load_template(path))
+        print(f"Navigation graph for {path}: {len(graph.nodes)} nodes, {sum(map(len, graph.edges))} edges "
+              f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the packed asset bundle")
+    parser.add_argument('--output', default=assets.BUNDLE_FILE, help="bundle path (default: %(default)s)")
+    parser.add_argument('--no-nav', action='store_true', help="skip the navigation graph cache")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    pygame.init()
+
+    sprites = collect_sprites()
+    pages, placements = pack_atlases(sprites)
+    layers = collect_layers()
+
+    images = dict(pages)
+    images.update(layers)
+    for name in layers:
+        placements[name] = (name, None)  # Whole image
+
+    sources = {}
+    for path in [PLAYER_SHEET, STAR_SHEET, STORM_SHEET] + ParallaxBackground.LAYER_PATHS + \
+            [f'game/assets/images/sprites/alien{color}.png' for color in DRONE_COLORS]:
+        sources[path] = assets.source_digest(path)
+
+    size = write_bundle(args.output, images, placements, sources)
+    print(f"Wrote {args.output}: {len(sprites)} sprites in {len(pages)} atlas page(s), "
+          f"{len(layers)} background layers, {size / 1024:.0f} KiB "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    
+    if not args.no_nav:
+        build_nav_graphs()
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Level reachability check: python -m game.tools.level_check [level files]
+
+Builds the navigation graph (game.world.navigation) of every level in
+game/assets/levels and game/old-levels, or of the files given, and checks
+that from the spawn point the player can reach:
+- every coin, star, power-up, storm and checkpoint;
+- the GyroBoss arena (the point where the boss wakes up), if there is one;
+- the exit (x past WORLD_WIDTH - 100).
+Reaching means some chain of graph moves passes the player rect over it.
+
+Buttons are pressed by stomping them or shooting them (a bullet from where
+the player stands or jumps, flying until it hits something solid). Each
+press toggles the gates the button lists, so the search walks every
+button combination the player can actually produce, carrying on from
+where the button was pressed; a level with a gate/button puzzle passes
+when the puzzle opens the way. Targets are reported with the presses that
+first reach them. Breakable blocks count as intact: they stop bullets, and
+moves only get past them by breaking them on the way (see NavGraph).
+
+Levels are checked in parallel, one per worker process. Graphs are cached
+in game/assets/build/nav like the game's, so re-runs after small edits
+only rebuild the gate setups that changed. Exit status 1 if anything is
+unreachable.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pygame
+from game.core import settings
+
+LEVEL_GLOBS = ('game/assets/levels/*.json', 'game/old-levels/*.json')
+
+# Hitbox sizes of the things the player touches (see the entity classes)
+TARGET_SIZES = {'coin': (16, 16), 'star': (24, 24), 'powerup': (24, 24), 'storm': (24, 24), 'checkpoint': (16, 48)}
+BULLET_SIZE = (12, 8)
+BULLET_OFFSET = 16  # Bullets start this far in front of the player's centre
+BOSS_WAKE_DISTANCE = 200  # The boss wakes when the player's right edge gets this close
+
+
+def _targets(level_data):
+    """[(label, rect)] of everything the player has to be able to reach"""
+    from game.world.navigation import PLAYER_SIZE
+    targets = []
+    for group, label in (('coins', 'coin'), ('stars', 'star'), ('powerups', 'powerup'), ('storms', 'storm')):
+        for item in level_data.get(group, []):
+            targets.append((f"{label} {item['id']}", pygame.Rect((item['x'], item['y']), TARGET_SIZES[label])))
+    for index, (x, y) in enumerate(level_data.get('checkpoints', [])):
+        targets.append((f"checkpoint {index}", pygame.Rect((x, y), TARGET_SIZES['checkpoint'])))
+    if 'boss_x' in level_data:
+        # Touched once the player's right edge is past boss_x - BOSS_WAKE_DISTANCE
+        left = level_data['boss_x'] - BOSS_WAKE_DISTANCE
+        targets.append(('boss arena', pygame.Rect(left, 0, settings.WORLD_WIDTH - left, settings.WORLD_HEIGHT)))
+    # Touched once the player's x is past WORLD_WIDTH - 100
+    left = settings.WORLD_WIDTH - 100 + PLAYER_SIZE[0]
+    targets.append(('exit', pygame.Rect(left, 0, settings.WORLD_WIDTH - left, settings.WORLD_HEIGHT)))
+    return targets
+
+
+def _open_gates(buttons, pressed):
+    """Gate ids open with these buttons pressed (each press toggles the button's gates)"""
+    open_gates = set()
+    for button, down in zip(buttons, pressed):
+        if down:
+            open_gates.symmetric_difference_update(button.get('toggles', ()))
+    return frozenset(open_gates)
+
+
+def _stomps(player, vel_y, gravity, button_rect):
+    """Button.check_stomp for a player rect"""
+    if not player.colliderect(button_rect):
+        return False
+    if gravity == 1:
+        return vel_y > 0 and player.bottom <= button_rect.centery
+    return vel_y < 0 and player.top >= button_rect.centery
+
+
+def _shoots(graph, player, button_rect):
+    """Whether a bullet fired either way from this player rect hits the button before anything solid"""
+    size = settings.TILE_SIZE
+    width, height = BULLET_SIZE
+    y = player.centery
+    if y + height <= button_rect.top or y >= button_rect.bottom:
+        return False
+    rows = range(max(0, y // size), min(graph.rows - 1, (y + height) // size) + 1)
+    solid = graph.solid[1]  # Bullets collide like gravity-down tiles, closed gates and intact breakable blocks
+    for direction in (-1, 1):
+        x = player.centerx + BULLET_OFFSET * direction
+        if direction == 1 and button_rect.right <= x or direction == -1 and button_rect.left >= x + width:
+            continue
+        near, far = (x, button_rect.left) if direction == 1 else (button_rect.right, x + width)
+        cols = range(max(0, near // size), min(graph.cols - 1, far // size) + 1)
+        if not any(solid[row][col] for row in rows for col in cols):
+            return True
+    return False
+
+
+def _graph(level_data, open_gates, graphs):
+    from game.world.navigation import NavGraph, NAV_CACHE_DIR
+    graph = graphs.get(open_gates)
+    if graph is None:
+        graph = graphs[open_gates] = NavGraph.from_level_data(level_data, open_gates, NAV_CACHE_DIR)
+    return graph
+
+
+def _start_node(graph, cell):
+    """Node index for a (col, row, gravity_dir) cell from another gate setup's graph"""
+    from game.world.navigation import PLAYER_SIZE
+    node = graph.index.get(cell)
+    if node is None:
+        node = graph.node_at(pygame.Rect(graph.node_position(cell), PLAYER_SIZE), cell[2])  # Falls from there
+    return node
+
+
+def check_level(path):
+    """(path, report lines, number of problems) for one level file"""
+    from game.io.level_loader import LevelLoader
+    from game.world.navigation import MOVES, PLAYER_SIZE
+    started = time.perf_counter()
+    level_data = LevelLoader.load_from_json(path)
+    targets = _targets(level_data)
+    rects = [rect for _, rect in targets]
+    buttons = level_data.get('buttons', [])
+    button_rects = [pygame.Rect(button['x'], button['y'], settings.TILE_SIZE * 2, settings.TILE_SIZE) for button in buttons]
+    graphs = {}
+
+    spawn = pygame.Rect((level_data['spawn_x'], level_data['spawn_y']), PLAYER_SIZE)
+    initial = (False,) * len(buttons)
+    graph = _graph(level_data, _open_gates(buttons, initial), graphs)
+    start = graph.node_at(spawn, 1)
+    if start is None:
+        return path, [f"{path}: nowhere to stand below the spawn point"], 1
+
+    reached = {}  # Target index -> button presses that first reached it
+    explored = {}  # Button states -> cells already searched with them
+    pending = deque([(initial, graph.nodes[start], ())])  # Fewest presses first
+    queued = {(initial, graph.nodes[start])}
+    while pending:
+        pressed, cell, presses = pending.popleft()
+        graph = _graph(level_data, _open_gates(buttons, pressed), graphs)
+        seen = explored.setdefault(pressed, set())
+        node = _start_node(graph, cell)
+        if node is None or graph.nodes[node] in seen:
+            continue
+        new = [n for n in graph.reachable(node) if graph.nodes[n] not in seen]
+        seen.update(graph.nodes[n] for n in new)
+
+        for node in new:
+            standing = pygame.Rect(graph.node_position(node), PLAYER_SIZE)
+            frames = [(node, [(standing.x, standing.y, 0.0, graph.nodes[node][2])])]
+            for move in range(len(MOVES)):
+                landing, trace = graph.trace_move(node, move)
+                if landing is not None:
+                    frames.append((landing, trace))
+
+            for landing, trace in frames:
+                for x, y, vel_y, gravity in trace:
+                    player = pygame.Rect((x, y), PLAYER_SIZE)
+                    for index in player.collidelistall(rects):
+                        reached.setdefault(index, presses)
+                    for index, button_rect in enumerate(button_rects):
+                        if _stomps(player, vel_y, gravity, button_rect) or _shoots(graph, player, button_rect):
+                            toggled = pressed[:index] + (not pressed[index],) + pressed[index + 1:]
+                            if (toggled, graph.nodes[landing]) not in queued:
+                                queued.add((toggled, graph.nodes[landing]))
+                                pending.append((toggled, graph.nodes[landing], presses + (index,)))
+
+    problems = 0
+    lines = []
+    for index, (label, rect) in enumerate(targets):
+        if index not in reached:
+            problems += 1
+            lines.append(f"  UNREACHABLE {label} at tile ({rect.x // settings.TILE_SIZE}, {rect.y // settings.TILE_SIZE})")
+        elif reached[index] and label in ('boss arena', 'exit'):
+            lines.append(f"  {label}: press buttons {', '.join(map(str, reached[index]))} in that order")
+    seconds = time.perf_counter() - started
+    lines.insert(0, f"{path}: {len(targets) - problems}/{len(targets)} reachable, "
+                    f"{len(explored)} button states, {seconds:.1f} s")
+    return path, lines, problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that everything in the levels can be reached from the spawn")
+    parser.add_argument('levels', nargs='*', help="Level files (default: every level in " + ', '.join(LEVEL_GLOBS) + ")")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    paths = args.levels or sorted(path for pattern in LEVEL_GLOBS for path in glob.glob(pattern))
+    workers = max(1, min(len(paths), args.workers or os.cpu_count() or 1))
+    problems = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, lines, count in pool.map(check_level, paths):
+            print('\n'.join(lines))
+            problems += count
+    print(f"{len(paths)} levels, {problems} unreachable")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
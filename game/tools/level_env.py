@@ -0,0 +1,272 @@
+"""
+Gym-style environment over LevelState, for training and evaluating agents
+
+    env = LevelEnv(level_id=1)
+    obs, info = env.reset(seed=0)
+    obs, reward, terminated, truncated, info = env.step(env.encode_action('right', 'jump'))
+
+Runs headless (SDL dummy drivers, no audio) at a fixed 1/FPS timestep, as
+fast as the level updates; nothing is drawn unless observations are frames.
+Same reset/step signatures as gymnasium, without depending on it.
+
+Actions are a bitmask over ACTIONS (the InputHandler actions a player holds),
+so there are 2 ** len(ACTIONS) of them. Each step holds that set for
+frame_skip frames; changes are sent to the level as key events, the same
+way the keyboard drives it (so 'jump' has to be let go to jump again).
+
+Observations ('grid', the default) are a GRID_ROWS x GRID_COLS int8 window of
+the tile map around the player with entities painted in (see the CELL_*
+codes). 'frame' observations are the rendered screen scaled down by
+FRAME_SCALE, as uint8 (height, width, 3).
+
+An episode ends (terminated) when the player dies or reaches the end of the
+level, and is cut off (truncated) after max_frames. reset() restarts the
+level in place (LevelState.restart), so nothing is re-loaded between episodes.
+For many environments at once see game.tools.vector_env.
+"""
+import atexit
+import os
+import random
+import tempfile
+import numpy as np
+import pygame
+from game.core import settings
+
+ACTIONS = ('left', 'right', 'jump', 'action', 'attack')
+
+# Grid observation cell codes
+CELL_EMPTY = 0
+CELL_SOLID = 1
+CELL_HAZARD = 2  # Spikes
+CELL_PICKUP = 3  # Coins, stars, power-ups
+CELL_ENEMY = 4  # Drones and the boss
+CELL_BLOCK = 5  # Closed gates and unbroken breakable blocks
+CELL_PLAYER = 6  # Normal gravity
+CELL_PLAYER_FLIPPED = 7  # Gravity up
+
+GRID_ROWS = -(-settings.WORLD_HEIGHT // settings.TILE_SIZE)  # The whole level height
+GRID_COLS = 40  # Screen width in tiles, centred on the player
+FRAME_SCALE = 8  # 'frame' observations are SCREEN_WIDTH / 8 x SCREEN_HEIGHT / 8
+
+# Reward per unit: tiles of new ground towards the exit, coins, enemies, hit points lost, outcomes
+REWARDS = {'progress': 0.1, 'coin': 1.0, 'enemy': 2.0, 'damage': -1.0, 'death': -10.0, 'win': 50.0}
+
+_PICKUP_GROUPS = ('coins', 'stars', 'powerups', 'storms')
+
+_save_directory = None  # TemporaryDirectory holding this process's saves and run history
+
+
+def init_headless():
+    """Dummy video/audio and a display mode (LevelState converts surfaces); once per process"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    if pygame.display.get_surface() is None:
+        pygame.init()
+        pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+
+        # Episodes aren't attempts: keep saves and run history out of the player's files
+        global _save_directory
+        from game.core.save_system import SaveSystem
+        from game.core.run_history import RunHistory
+        _save_directory = tempfile.TemporaryDirectory(prefix='courier-env-')
+        atexit.register(cleanup_headless)
+        directory = _save_directory.name
+        SaveSystem.SAVE_FILE = os.path.join(directory, 'save_game.json')
+        RunHistory.LOG_FILE = os.path.join(directory, 'run_history.jsonl')
+        RunHistory.INDEX_FILE = os.path.join(directory, 'run_history_index.json')
+
+
+def cleanup_headless():
+    """Delete the temporary save directory (atexit; multiprocessing workers call it themselves)"""
+    global _save_directory
+    if _save_directory is not None:
+        from game.core.save_system import SaveSystem
+        SaveSystem.flush()  # Queued writes would land in the deleted directory
+        _save_directory.cleanup()
+        _save_directory = None
+
+
+def observation_spec(observation='grid'):
+    """(shape, dtype) of one observation"""
+    if observation == 'grid':
+        return (GRID_ROWS, GRID_COLS), np.int8
+    if observation == 'frame':
+        return (settings.SCREEN_HEIGHT // FRAME_SCALE, settings.SCREEN_WIDTH // FRAME_SCALE, 3), np.uint8
+    raise ValueError(f"Unknown observation type {observation!r}")
+
+
+def _make_stack():
+    from game.core import StateStack
+
+    class EnvStack(StateStack):
+        """Stack the level runs on: remembers the state it asks for instead of fading to it"""
+
+        requested = None
+
+        def _start_transition(self, action, state_class, args, kwargs):
+            self.requested = state_class
+
+    return EnvStack(pygame.display.get_surface())
+
+
+class LevelEnv:
+    """One level, stepped with held-action bitmasks (see module docstring)"""
+
+    action_count = 2 ** len(ACTIONS)
+
+    def __init__(self, level_id=1, observation='grid', frame_skip=4, max_frames=settings.FPS * 180):
+        init_headless()
+        from game.world.level import LevelState
+        self.observation = observation
+        self.observation_shape, self.observation_dtype = observation_spec(observation)
+        self.frame_skip = frame_skip
+        self.max_frames = max_frames
+        self.dt = 1.0 / settings.FPS
+
+        self.stack = _make_stack()
+        self.level = self.stack.push(LevelState, level_id=level_id)
+        handler = self.level.input_handler
+        self.keys = {}  # action -> a key bound to it
+        for key, action in handler.key_map.items():
+            self.keys.setdefault(action, key)
+        self.held = 0
+        self.frames = 0
+        self.surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)) if observation == 'frame' else None
+        self._static_grid = self._build_static_grid() if observation == 'grid' else None
+        self._started = False
+
+    @staticmethod
+    def encode_action(*names):
+        """Bitmask holding the named ACTIONS"""
+        return sum(1 << ACTIONS.index(name) for name in names)
+
+    @staticmethod
+    def decode_action(action):
+        return [name for bit, name in enumerate(ACTIONS) if action & (1 << bit)]
+
+    def reset(self, seed=None, options=None):
+        """Start the level over; returns (observation, info)"""
+        if seed is not None:
+            random.seed(seed)  # The boss picks spike waves with the random module
+        if self._started:
+            self.level.restart()
+        self._started = True
+        self.stack.requested = None
+        self.held = 0
+        self.frames = 0
+        self._furthest = self.level.player.rect.x
+        self._score = self._tally()
+        return self.observe(), self._info(None)
+
+    def step(self, action):
+        """Hold `action` for frame_skip frames; returns (observation, reward, terminated, truncated, info)"""
+        reward, terminated, truncated, info = self.advance(action)
+        return self.observe(), reward, terminated, truncated, info
+
+    def advance(self, action):
+        """step() without the observation: (reward, terminated, truncated, info)"""
+        events = self._key_events(int(action))
+        level, stack = self.level, self.stack
+        for _ in range(self.frame_skip):
+            level.update(self.dt, events)
+            events = ()
+            self.frames += 1
+            if stack.requested is not None:
+                break
+
+        outcome = None
+        if stack.requested is not None:
+            outcome = 'win' if stack.requested.__name__ == 'WinState' else 'death'
+        reward = self._reward(outcome)
+        truncated = outcome is None and self.frames >= self.max_frames
+        return reward, outcome is not None, truncated, self._info(outcome)
+
+    def observe(self, out=None):
+        """Current observation, written into `out` if given (e.g. a shared-memory slot)"""
+        if out is None:
+            out = np.empty(self.observation_shape, self.observation_dtype)
+        if self.observation == 'grid':
+            self._observe_grid(out)
+        else:
+            self.level.draw(self.surface)
+            small = pygame.transform.smoothscale(self.surface, (self.observation_shape[1], self.observation_shape[0]))
+            out[...] = pygame.surfarray.pixels3d(small).transpose(1, 0, 2)
+        return out
+
+    def _key_events(self, action):
+        """KEYDOWN/KEYUP for the actions that changed since the last step"""
+        events = []
+        for bit, name in enumerate(ACTIONS):
+            mask = 1 << bit
+            if (action ^ self.held) & mask:
+                event_type = pygame.KEYDOWN if action & mask else pygame.KEYUP
+                events.append(pygame.event.Event(event_type, key=self.keys[name]))
+        self.held = action
+        return events
+
+    def _tally(self):
+        player = self.level.player
+        return player.coins, self.level.clear_conditions.enemies_defeated, player.hp
+
+    def _reward(self, outcome):
+        coins, enemies, hp = self._tally()
+        last_coins, last_enemies, last_hp = self._score
+        self._score = (coins, enemies, hp)
+        x = self.level.player.rect.x
+        reward = (REWARDS['coin'] * (coins - last_coins) + REWARDS['enemy'] * (enemies - last_enemies)
+                  + REWARDS['damage'] * max(0, last_hp - hp))
+        if x > self._furthest:
+            reward += REWARDS['progress'] * (x - self._furthest) / settings.TILE_SIZE
+            self._furthest = x
+        if outcome:
+            reward += REWARDS[outcome]
+        return reward
+
+    def _info(self, outcome):
+        player = self.level.player
+        return {'outcome': outcome, 'frames': self.frames, 'x': player.rect.x, 'y': player.rect.y,
+                'hp': player.hp, 'coins': player.coins}
+
+    def _build_static_grid(self):
+        """Tiles and spikes for the whole level, padded with solid cells left and right"""
+        tile_map = self.level.tile_map
+        pad = GRID_COLS // 2
+        width = len(tile_map[0]) if tile_map else 0
+        grid = np.full((GRID_ROWS, width + 2 * pad), CELL_SOLID, np.int8)
+        grid[:, pad:pad + width] = CELL_EMPTY
+        for row, tiles in enumerate(tile_map[:GRID_ROWS]):
+            for col, tile in enumerate(tiles):
+                if tile is not None:
+                    grid[row, pad + col] = CELL_SOLID
+        for spike in self.level.spikes:
+            self._paint(grid, spike.rect, CELL_HAZARD)
+        return grid
+
+    @staticmethod
+    def _paint(grid, rect, code):
+        """Mark the cells a world rect covers"""
+        size = settings.TILE_SIZE
+        pad = GRID_COLS // 2
+        top, bottom = max(0, rect.top // size), min(GRID_ROWS, (rect.bottom - 1) // size + 1)
+        grid[top:bottom, max(0, rect.left // size + pad):(rect.right - 1) // size + pad + 1] = code
+
+    def _observe_grid(self, out):
+        level = self.level
+        grid = self._static_grid.copy()
+        entities = level.entities
+        for group in _PICKUP_GROUPS:
+            for pickup in entities.live(group):
+                self._paint(grid, pickup.rect, CELL_PICKUP)
+        for block in entities.live('gates') + entities.live('breakables'):
+            if block.is_solid():
+                self._paint(grid, block.get_collision_rect(), CELL_BLOCK)
+        for enemy in entities.live('enemies'):
+            self._paint(grid, enemy.rect, CELL_ENEMY)
+        if level.boss and not level.boss.defeated:
+            self._paint(grid, level.boss.rect, CELL_ENEMY)
+        player = level.player
+        self._paint(grid, player.rect, CELL_PLAYER if player.gravity_dir == 1 else CELL_PLAYER_FLIPPED)
+
+        # Window centred on the player (the grid is padded by half a window on each side)
+        left = min(max(0, player.rect.centerx // settings.TILE_SIZE), grid.shape[1] - GRID_COLS)
+        out[...] = grid[:, left:left + GRID_COLS]
@@ -0,0 +1,189 @@
+"""
+Level memory report: python -m game.main --memory-report [level ids]
+
+Builds each level (all of game/assets/levels by default) the way the game
+does, with tracemalloc running, and prints:
+- bytes per entity type: the entities plus what only they reference (rects,
+  lists, their own surfaces); sprites and values shared between entities are
+  counted once, under 'shared';
+- the level footprint: what LevelState.__init__ allocated and still holds,
+  cold (first load, includes the templates and sprite caches later loads
+  reuse) and warm (a second load of the same level);
+- the source lines holding most of the warm footprint.
+Levels whose cold footprint is over settings.LEVEL_MEMORY_BUDGET are flagged
+and make the exit status 1. Saves go to a temporary file, so building the
+levels doesn't count as attempts.
+"""
+import gc
+import glob
+import os
+import re
+import sys
+import tempfile
+import tracemalloc
+import types
+import pygame
+from game.core import settings
+
+TOP_LINES = 8  # Source lines listed per level
+TRACE_FRAMES = 1  # Traceback depth (1 groups by the line that allocated)
+
+_CONTAINERS = (list, tuple, dict, set, frozenset)
+_SKIPPED = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+
+def _attribute_values(obj):
+    """Instance attribute values, slotted or not"""
+    values = []
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__') and hasattr(obj, name):
+                values.append(getattr(obj, name))
+    if hasattr(obj, '__dict__'):
+        values.extend(obj.__dict__.values())
+    return values
+
+
+def _children(value):
+    if isinstance(value, dict):
+        return list(value.keys()) + list(value.values())
+    if isinstance(value, _CONTAINERS):
+        return list(value)
+    return []
+
+
+def _size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, pygame.Surface):
+        size += value.get_width() * value.get_height() * value.get_bytesize()  # Pixels live outside the object
+    return size
+
+
+def _reachable(entity):
+    """Objects an entity's attributes reach through containers (not through other objects)"""
+    return _reachable_from(_attribute_values(entity))
+
+
+def _reachable_from(pending):
+    found = {}
+    while pending:
+        value = pending.pop()
+        if value is None or isinstance(value, _SKIPPED) or id(value) in found:
+            continue
+        found[id(value)] = value
+        pending.extend(_children(value))
+    return found
+
+
+def entity_sizes(level):
+    """{type name: [count, bytes]} for every entity in the level, plus 'shared'"""
+    groups = [('tiles', [tile for row in level.tile_map for tile in row if tile is not None]),
+              ('player', [level.player]), ('bullets', level.bullets)]
+    groups += [(name, pool.entities) for name, pool in level.entities.pools.items()]
+    if level.boss:
+        groups.append(('boss', [level.boss]))
+
+    entity_ids = {id(entity) for _, entities in groups for entity in entities}
+    cached = set()  # Reachable from class attributes (sprite caches and such)
+    for cls in {type(entity) for _, entities in groups for entity in entities}:
+        for base in cls.__mro__[:-1]:
+            cached.update(_reachable_from(list(vars(base).values())))
+    owners = {}  # Object id -> number of entities reaching it
+    reached = []
+    for name, entities in groups:
+        for entity in entities:
+            objects = _reachable(entity)
+            reached.append((name, entity, objects))
+            for object_id in objects:
+                if object_id not in entity_ids:
+                    owners[object_id] = owners.get(object_id, 0) + 1
+
+    sizes = {name: [0, 0] for name, _ in groups}
+    shared = {}
+    for name, entity, objects in reached:
+        total = sizes[name]
+        total[0] += 1
+        total[1] += sys.getsizeof(entity) + (sys.getsizeof(entity.__dict__) if hasattr(entity, '__dict__') else 0)
+        for object_id, value in objects.items():
+            if object_id in entity_ids:
+                continue
+            if owners[object_id] > 1 or object_id in cached:
+                shared[object_id] = value
+            else:
+                total[1] += _size(value)
+    sizes['shared'] = [len(shared), sum(_size(value) for value in shared.values())]
+    return sizes
+
+
+def _build(stack, level_id):
+    """LevelState for a level plus the tracemalloc snapshot taken right after"""
+    from game.world.level import LevelState
+    from game.core.save_system import SaveSystem
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    level = LevelState(stack, level_id)
+    SaveSystem.flush()  # The queued attempt counter write isn't part of the level
+    gc.collect()
+    return level, before, tracemalloc.take_snapshot()
+
+
+def _kb(size):
+    return f"{size / 1024:9.1f} KB"
+
+
+def report_level(stack, level_id):
+    """Report for one level; returns (text, cold footprint in bytes)"""
+    level, before, after = _build(stack, level_id)
+    cold = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    level = None  # Let the first copy go before measuring a second load
+    level, before, after = _build(stack, level_id)
+    stats = after.compare_to(before, 'lineno')
+    warm = sum(stat.size_diff for stat in stats)
+
+    lines = [f"Level {level_id}", f"  {'type':<14} {'count':>6} {'bytes':>12} {'per entity':>11}"]
+    sizes = entity_sizes(level)
+    shared_count, shared_size = sizes.pop('shared')
+    for name, (count, size) in sorted(sizes.items(), key=lambda item: -item[1][1]):
+        if count:
+            lines.append(f"  {name:<14} {count:6d} {size:12d} {size / count:11.0f}")
+    lines.append(f"  {'shared':<14} {shared_count:6d} {shared_size:12d}")
+    over = cold > settings.LEVEL_MEMORY_BUDGET
+    lines += [f"  footprint {_kb(warm)} warm, {_kb(cold)} cold"
+              f"  (budget {settings.LEVEL_MEMORY_BUDGET / 1024:.0f} KB{', OVER' if over else ''})",
+              "  largest allocations:"]
+    for stat in stats[:TOP_LINES]:
+        frame = stat.traceback[0]
+        path = os.path.relpath(frame.filename)
+        lines.append(f"    {_kb(stat.size_diff)}  {frame.filename if path.startswith('..') else path}:{frame.lineno}")
+    return '\n'.join(lines), cold
+
+
+def _level_ids():
+    paths = glob.glob('game/assets/levels/level*.json')
+    return sorted(int(match.group(1)) for match in map(re.compile(r'level(\d+)\.json$').search, paths) if match)
+
+
+def run(argv):
+    """Print the report for the level ids in argv (all levels if none); returns the exit status"""
+    from game.core import StateStack
+    from game.core.save_system import SaveSystem
+    level_ids = [int(arg) for arg in argv if arg.isdigit()] or _level_ids()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Nothing is shown
+    pygame.init()
+    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    stack = StateStack(screen)
+
+    status = 0
+    with tempfile.TemporaryDirectory(prefix='courier-memory-') as directory:
+        SaveSystem.SAVE_FILE = os.path.join(directory, 'save_game.json')
+        tracemalloc.start(TRACE_FRAMES)
+        for level_id in level_ids:
+            text, cold = report_level(stack, level_id)  # Flushes the save before returning
+            print(text + '\n')
+            if cold > settings.LEVEL_MEMORY_BUDGET:
+                status = 1
+        tracemalloc.stop()
+    pygame.quit()
+    return status
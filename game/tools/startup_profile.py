@@ -0,0 +1,131 @@
+"""
+Startup profiler: python -m game.main --profile-startup
+
+Installed by game.main before anything else is imported. Times every module
+import from then on (inclusive and self time, like python -X importtime) and
+reports them together with time-to-first-frame. Modules imported after the
+first frame (states and entities that load on demand) are listed at exit.
+"""
+import sys
+import time
+
+
+class _TimedLoader:
+    """Wraps a module loader and reports how long the module took to load"""
+
+    def __init__(self, loader, profiler, name):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        # Extension modules do their work here, so the clock starts now
+        self._profiler._enter(self._name)
+        create = getattr(self._loader, 'create_module', None)
+        try:
+            return create(spec) if create else None
+        except BaseException:
+            self._profiler._exit(self._name)
+            raise
+
+    def exec_module(self, module):
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)  # get_data, get_resource_reader, ...
+
+
+class StartupProfiler:
+    """Meta path finder that times imports"""
+
+    REPORT_LIMIT = 20  # Slowest non-game modules to list
+
+    def __init__(self, start_time=None):
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.records = []  # (name, inclusive seconds, self seconds, finished at)
+        self.marks = []  # (label, seconds since start)
+        self.first_frame_time = None
+        self._stack = []  # [name, start, time spent in nested imports]
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path, target=None):
+        """Let the real finders locate the module, then time its loader"""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self, name)
+            return spec
+        return None
+
+    def _enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name):
+        if not self._stack or self._stack[-1][0] != name:
+            return
+        _, start, nested = self._stack.pop()
+        now = time.perf_counter()
+        inclusive = now - start
+        if self._stack:
+            self._stack[-1][2] += inclusive
+        self.records.append((name, inclusive, inclusive - nested, now))
+
+    def mark(self, label):
+        """Remember a named point in the startup sequence"""
+        self.marks.append((label, time.perf_counter() - self.start_time))
+
+    def first_frame(self):
+        """Call once the first frame is on screen; prints the boot report"""
+        if self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter()
+            self.mark('first frame')
+            print(self.report())
+
+    def _format(self, records):
+        lines = [f"  {'incl ms':>8} {'self ms':>8}  module"]
+        for name, inclusive, own, _ in records:
+            lines.append(f"  {inclusive * 1000:8.1f} {own * 1000:8.1f}  {name}")
+        return lines
+
+    def report(self):
+        """Import times up to the first frame plus the startup marks"""
+        end = self.first_frame_time or time.perf_counter()
+        boot = [r for r in self.records if r[3] <= end]
+        game_modules = [r for r in boot if r[0] == 'game' or r[0].startswith('game.')]
+        others = sorted((r for r in boot if r not in game_modules), key=lambda r: -r[2])
+
+        total = sum(r[2] for r in boot)
+        lines = ["", "=== Startup profile ===",
+                 f"{len(boot)} modules imported before the first frame, {total * 1000:.1f} ms in imports", "",
+                 "Game modules (import order):"]
+        lines += self._format(game_modules)
+        lines += ["", f"Slowest other modules (by self time, top {self.REPORT_LIMIT}):"]
+        lines += self._format(others[:self.REPORT_LIMIT])
+        lines += ["", "Timeline:"]
+        for label, at in self.marks:
+            lines.append(f"  {at * 1000:8.1f} ms  {label}")
+        return '\n'.join(lines)
+
+    def report_on_demand(self):
+        """Game modules that were imported after the first frame"""
+        if self.first_frame_time is None:
+            return ""
+        later = [r for r in self.records if r[3] > self.first_frame_time
+                 and (r[0] == 'game' or r[0].startswith('game.'))]
+        lines = ["", "=== Loaded on demand after the first frame ==="]
+        lines += self._format(later)
+        return '\n'.join(lines)
@@ -0,0 +1,213 @@
+"""
+N LevelEnvs stepped in parallel worker processes
+
+    with VectorEnv(16, level_id=1) as envs:
+        obs, infos = envs.reset(seed=0)
+        obs, rewards, terminated, truncated, infos = envs.step(actions)  # one action per env
+
+The environments are split across worker processes (one per CPU by
+default), each running its share in turn. Observations, actions, rewards
+and done flags live in shared memory, so a step sends only a short command
+and the per-env info dicts through the pipes. The arrays returned by reset()
+and step() are views of that shared memory and get overwritten by the next
+call: copy them to keep them.
+
+Environments that finish are reset in the same step. Their last
+observation is in info['final_observation'] and the returned one is the
+first of the next episode.
+
+Benchmark with random actions: python -m game.tools.vector_env --envs 8
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from game.core import settings
+from game.tools.level_env import LevelEnv, cleanup_headless, observation_spec
+
+
+def _shared_array(shape, dtype, name=None):
+    """(SharedMemory, array view); creates the block unless a name is given"""
+    size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    memory = shared_memory.SharedMemory(name=name, create=name is None, size=max(1, size) if name is None else 0)
+    return memory, np.ndarray(shape, dtype, buffer=memory.buf)
+
+
+def _worker(conn, indices, env_kwargs, buffers):
+    """Worker process: owns the environments at `indices`, steps them on command"""
+    views = {}
+    memories = []
+    for key, (name, shape, dtype) in buffers.items():
+        memory, views[key] = _shared_array(shape, dtype, name)
+        memories.append(memory)
+    observations, actions = views['observations'], views['actions']
+    rewards, terminated, truncated = views['rewards'], views['terminated'], views['truncated']
+    envs = [LevelEnv(**env_kwargs[index]) for index in indices]
+    conn.send('ready')
+
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == 'step':
+                infos = []
+                for index, env in zip(indices, envs):
+                    reward, done, cut, info = env.advance(actions[index])
+                    if done or cut:
+                        info['final_observation'] = env.observe()
+                        observations[index], _ = env.reset()
+                    else:
+                        env.observe(observations[index])
+                    rewards[index], terminated[index], truncated[index] = reward, done, cut
+                    infos.append(info)
+                conn.send(infos)
+            elif command == 'reset':
+                infos = []
+                for index, env in zip(indices, envs):
+                    observations[index], info = env.reset(seed=None if data is None else data + index)
+                    infos.append(info)
+                conn.send(infos)
+            elif command == 'close':
+                break
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        del observations, actions, rewards, terminated, truncated, views  # Views pin the buffers
+        for memory in memories:
+            memory.close()
+        conn.close()
+        cleanup_headless()  # Worker processes exit without running atexit handlers
+
+
+class VectorEnv:
+    """Gym-style batch of LevelEnvs over a pool of worker processes (see module docstring)"""
+
+    def __init__(self, num_envs, level_id=1, observation='grid', workers=None, context='spawn', **env_kwargs):
+        """level_id is one id for every env or a sequence of num_envs ids; env_kwargs go to LevelEnv"""
+        self.num_envs = num_envs
+        self.action_count = LevelEnv.action_count
+        self.observation_shape, self.observation_dtype = observation_spec(observation)
+        level_ids = [level_id] * num_envs if isinstance(level_id, int) else list(level_id)
+        if len(level_ids) != num_envs:
+            raise ValueError(f"Got {len(level_ids)} level ids for {num_envs} environments")
+        kwargs = [dict(env_kwargs, level_id=level_ids[index], observation=observation) for index in range(num_envs)]
+
+        self._memories = []
+        buffers = {}
+        for key, shape, dtype in (('observations', (num_envs,) + self.observation_shape, self.observation_dtype),
+                                  ('actions', (num_envs,), np.int64), ('rewards', (num_envs,), np.float64),
+                                  ('terminated', (num_envs,), np.bool_), ('truncated', (num_envs,), np.bool_)):
+            memory, array = _shared_array(shape, dtype)
+            self._memories.append(memory)
+            setattr(self, key, array)
+            buffers[key] = (memory.name, shape, dtype)
+
+        # Contiguous runs of environments per worker
+        workers = self.workers = max(1, min(num_envs, workers or os.cpu_count() or 1))
+        ctx = multiprocessing.get_context(context)  # spawn: workers don't inherit the parent's pygame state
+        self._conns = []
+        self._processes = []
+        for worker in range(workers):
+            indices = list(range(worker * num_envs // workers, (worker + 1) * num_envs // workers))
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(target=_worker, args=(child_conn, indices, kwargs, buffers),
+                                  name=f'level-env-{worker}', daemon=True)
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+        for conn in self._conns:
+            conn.recv()  # 'ready' once its levels are built
+        self.closed = False
+
+    def reset(self, seed=None):
+        """Reset every environment (env i gets seed + i); returns (observations, infos)"""
+        for conn in self._conns:
+            conn.send(('reset', seed))
+        return self.observations, self._gather()
+
+    def step_async(self, actions):
+        """Start a step; collect it with step_wait()"""
+        self.actions[:] = actions
+        for conn in self._conns:
+            conn.send(('step', None))
+
+    def step_wait(self):
+        infos = self._gather()
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
+
+    def step(self, actions):
+        """One action per environment; returns (observations, rewards, terminated, truncated, infos)"""
+        self.step_async(actions)
+        return self.step_wait()
+
+    def _gather(self):
+        infos = []
+        for conn in self._conns:
+            infos.extend(conn.recv())
+        return infos
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        if self.closed:
+            return
+        self.closed = True
+        for conn in self._conns:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        del self.observations, self.actions, self.rewards, self.terminated, self.truncated
+        for memory in self._memories:
+            try:
+                memory.close()
+            except BufferError:
+                pass  # The caller still holds a view; the block goes away with it
+            memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Step VectorEnv with random actions and report the speed")
+    parser.add_argument('--envs', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--level', type=int, default=1)
+    parser.add_argument('--observation', choices=('grid', 'frame'), default='grid')
+    parser.add_argument('--frame-skip', type=int, default=4)
+    parser.add_argument('--steps', type=int, default=1000, help="Vector steps to run")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    with VectorEnv(args.envs, level_id=args.level, observation=args.observation, workers=args.workers,
+                   frame_skip=args.frame_skip) as envs:
+        ready = time.perf_counter()
+        envs.reset(seed=args.seed)
+        rng = np.random.default_rng(args.seed)
+        episodes = {}
+        for _ in range(args.steps):
+            _, _, _, _, infos = envs.step(rng.integers(0, envs.action_count, envs.num_envs))
+            for info in infos:
+                if 'final_observation' in info:
+                    episodes[info['outcome']] = episodes.get(info['outcome'], 0) + 1
+        seconds = time.perf_counter() - ready
+        steps = args.steps * args.envs
+        frames = steps * args.frame_skip  # Upper bound: steps that end an episode stop early
+        print(f"{args.envs} envs on {envs.workers} workers, started in {ready - start:.1f} s")
+        print(f"{steps} steps in {seconds:.1f} s: {steps / seconds:.0f} steps/s, "
+              f"{frames / seconds:.0f} frames/s ({frames / seconds / settings.FPS:.0f}x real time)")
+        print(f"episodes finished: {episodes or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,18 @@
 """
-UI systems
+UI systems (state modules are imported on first access)
 """
-from .hud import HUD
-from .main_menu import MainMenuState
-from .options import OptionsState
-from .controls import ControlsState
-from .about import AboutState
-from .pause import PauseState
-from .win import WinState
-from .lose import LoseState
+from game.core.utils import lazy_exports
+
+_EXPORTS = {
+    'HUD': '.hud',
+    'MainMenuState': '.main_menu',
+    'OptionsState': '.options',
+    'ControlsState': '.controls',
+    'AboutState': '.about',
+    'PauseState': '.pause',
+    'WinState': '.win',
+    'LoseState': '.lose',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
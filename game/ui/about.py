@@ -3,7 +3,7 @@ About/Credits screen with improved UX design
 """
 import pygame
 import math
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
 
 
 class AboutState(GameState):
@@ -11,10 +11,10 @@ class AboutState(GameState):
     
     def __init__(self, stack):
         super().__init__(stack)
-        self.title_font = pygame.font.Font(None, 48)
-        self.section_font = pygame.font.Font(None, 32)
-        self.body_font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(48)
+        self.section_font = get_font(32)
+        self.body_font = get_font(24)
+        self.small_font = get_font(20)
         
         # Animation variables
         self.time = 0
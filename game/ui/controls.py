@@ -2,7 +2,7 @@
 Controls/key remapping menu
 """
 import pygame
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
 
 
 class ControlsState(GameState):
@@ -11,8 +11,8 @@ class ControlsState(GameState):
     def __init__(self, stack):
         super().__init__(stack)
         self.selected = 0
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(36)
+        self.small_font = get_font(24)
         
         # Get current key bindings or use defaults
         self.key_bindings = stack.persistent_data.get('key_bindings', settings.DEFAULT_KEY_BINDINGS.copy())
@@ -2,7 +2,9 @@
 How to Play screen
 """
 import pygame
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
+from game.io.assets import load_image, get_sprite_frames
+from game.entities.star import STAR_SHEET, split_star_frames
 
 
 class HowToPlayState(GameState):
@@ -10,38 +12,26 @@ class HowToPlayState(GameState):
     
     def __init__(self, stack):
         super().__init__(stack)
-        self.title_font = pygame.font.Font(None, 56)
-        self.section_font = pygame.font.Font(None, 36)
-        self.text_font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(56)
+        self.section_font = get_font(36)
+        self.text_font = get_font(24)
+        self.small_font = get_font(20)
         
         # Scrolling support
         self.scroll_offset = 0
         self.max_scroll = 0
         
         # Load star sprite sheet frames for animation
-        self.star_frames = []
         self.star_current_frame = 0
         self.star_animation_time = 0
         self.star_frame_duration = 0.08
         
-        try:
-            sprite_path = 'game/assets/images/sprites/Star.png'
-            sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-            
-            # Extract frames from sprite sheet
-            sheet_width = sprite_sheet.get_width()
-            sheet_height = sprite_sheet.get_height()
-            frame_width = sheet_height  # Assuming frames are square
-            num_frames = sheet_width // frame_width
-            
-            for i in range(num_frames):
-                frame_rect = pygame.Rect(i * frame_width, 0, frame_width, sheet_height)
-                frame = sprite_sheet.subsurface(frame_rect).copy()
-                frame_scaled = pygame.transform.scale(frame, (20, 20))
-                self.star_frames.append(frame_scaled)
-        except:
-            pass  # Will draw manually if sprite fails to load
+        self.star_frames = get_sprite_frames('star/20')
+        if not self.star_frames:
+            try:
+                self.star_frames = split_star_frames(load_image(STAR_SHEET), 20)
+            except:
+                pass  # Will draw manually if sprite fails to load
         
     def handle_event(self, event):
         """Handle input"""
@@ -2,15 +2,15 @@
 Heads-up display
 """
 import pygame
-from game.core import settings
+from game.core import settings, get_font
 
 
 class HUD:
     """Display player stats and game info"""
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 20)
+        self.font = get_font(28)
+        self.small_font = get_font(20)
     
     def draw(self, screen, player, boss=None, show_fps=False, fps=0, show_hitboxes=False, clear_conditions=None, game_time=0.0, camera=None, minimap_entities=None, audio_manager=None):
         """Draw HUD elements"""
@@ -3,8 +3,9 @@ Level selection menu
 """
 import math
 import pygame
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
 from game.core.save_system import SaveSystem
+from game.core.run_history import RunHistory
 from game.world.background import ParallaxBackground
 
 
@@ -13,9 +14,9 @@ class LevelSelectState(GameState):
     
     def __init__(self, stack):
         super().__init__(stack)
-        self.title_font = pygame.font.Font(None, 64)
-        self.level_font = pygame.font.Font(None, 42)
-        self.small_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(64)
+        self.level_font = get_font(42)
+        self.small_font = get_font(20)
         
         # Get unlocked levels from save
         self.unlocked_levels = SaveSystem.get_unlocked_levels()
@@ -28,6 +29,19 @@ class LevelSelectState(GameState):
         
         self.selected = 0
         
+        # Run history lines per level (rendered once; the index is tiny)
+        self.history_surfs = {}
+        for level in self.levels:
+            summary = RunHistory.get_level_summary(level['id'])
+            if summary['attempts'] == 0:
+                continue
+            best = f"Best {summary['best_time']:.1f}s" if summary['best_time'] is not None else "No clear yet"
+            runs = f"{summary['attempts']} runs | {summary['wins']} clears | {summary['deaths']} deaths"
+            self.history_surfs[level['id']] = (
+                self.small_font.render(best, True, settings.COLOR_YELLOW),
+                self.small_font.render(runs, True, settings.COLOR_GRAY)
+            )
+        
         # Animated background
         self.background = ParallaxBackground(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
         self._bg_time = 0.0
@@ -122,13 +136,19 @@ class LevelSelectState(GameState):
             screen.blit(level_num_surf, (x_pos + 20, y_pos + 15))
             
             # Level name
-            name_surf = pygame.font.Font(None, 32).render(level['name'], True, settings.COLOR_WHITE if is_unlocked else (100, 100, 100))
+            name_surf = get_font(32).render(level['name'], True, settings.COLOR_WHITE if is_unlocked else (100, 100, 100))
             screen.blit(name_surf, (x_pos + 20, y_pos + 50))
             
             # Description
             desc_surf = self.small_font.render(level['description'], True, settings.COLOR_GRAY if is_unlocked else (60, 60, 60))
             screen.blit(desc_surf, (x_pos + 20, y_pos + 75))
             
+            # Run history summary
+            if is_unlocked and level_id in self.history_surfs:
+                best_surf, runs_surf = self.history_surfs[level_id]
+                screen.blit(best_surf, best_surf.get_rect(right=x_pos + card_width - 20, y=y_pos + 20))
+                screen.blit(runs_surf, runs_surf.get_rect(right=x_pos + card_width - 20, y=y_pos + 75))
+            
             # Lock icon for locked levels
             if not is_unlocked:
                 lock_text = self.level_font.render("🔒", True, (100, 100, 100))
@@ -0,0 +1,65 @@
+"""
+Startup loading screen
+"""
+import math
+import pygame
+from game.core import GameState, settings, get_font, get_log
+from game.io.assets import AssetPreloader
+
+
+class LoadingState(GameState):
+    """Shows progress while images and sounds are decoded on worker threads"""
+
+    watch_hitches = False  # Frames wait on decoding while the bar fills
+
+    def __init__(self, stack):
+        super().__init__(stack)
+        self.title_font = get_font(72)
+        self.small_font = get_font(24)
+        self._time = 0.0
+        self._finished = False
+
+        from game.io.audio import AudioManager
+        self.preloader = AssetPreloader(sounds=AudioManager.SFX_FILES)
+
+    def update(self, dt, events):
+        """Collect finished assets and move on to the main menu when done"""
+        self._time += dt
+        self.preloader.poll()
+
+        if self.preloader.is_done() and not self._finished:
+            self._finished = True
+            get_log('assets').info("Assets preloaded in %.0f ms", self.preloader.elapsed() * 1000)
+            audio = self.stack.persistent_data.get('audio')
+            if audio:
+                audio.load_all_audio(self.preloader.sounds)
+
+            from game.ui.main_menu import MainMenuState
+            self.stack.replace_with_transition(MainMenuState)
+
+    def draw(self, screen):
+        """Draw title, progress bar and spinner"""
+        screen.fill((20, 10, 40))
+
+        title = self.title_font.render(settings.TITLE.upper(), True, settings.COLOR_YELLOW)
+        screen.blit(title, title.get_rect(centerx=settings.SCREEN_WIDTH // 2, y=240))
+
+        # Progress bar
+        bar_width = 400
+        bar_rect = pygame.Rect(settings.SCREEN_WIDTH // 2 - bar_width // 2, 360, bar_width, 16)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_width * self.preloader.progress)
+        pygame.draw.rect(screen, settings.COLOR_DARK_GRAY, bar_rect)
+        pygame.draw.rect(screen, settings.COLOR_YELLOW, fill_rect)
+        pygame.draw.rect(screen, settings.COLOR_WHITE, bar_rect, 2)
+
+        # Spinner dots
+        for i in range(8):
+            angle = self._time * 4 + i * math.pi / 4
+            x = settings.SCREEN_WIDTH // 2 + math.cos(angle) * 20
+            y = 430 + math.sin(angle) * 20
+            shade = 80 + i * 20
+            pygame.draw.circle(screen, (shade, shade, shade), (int(x), int(y)), 3)
+
+        text = self.small_font.render(f"Loading... {self.preloader.done}/{self.preloader.total}", True, settings.COLOR_GRAY)
+        screen.blit(text, text.get_rect(centerx=settings.SCREEN_WIDTH // 2, y=470))
@@ -3,7 +3,8 @@ Lose/Game Over screen
 """
 import math
 import pygame
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
+from game.core.gc_policy import gc_policy
 from game.world.background import ParallaxBackground
 from game.core.save_system import SaveSystem
 
@@ -15,9 +16,9 @@ class LoseState(GameState):
         super().__init__(stack)
         self.options = ['Retry From Checkpoint', 'Main Menu']
         self.selected = 0
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(72)
+        self.menu_font = get_font(48)
+        self.small_font = get_font(20)
         self.option_rects = []
         self.mouse_enabled = True
         self._pulse_time = 0.0
@@ -28,6 +29,7 @@ class LoseState(GameState):
     
     def enter(self, previous_state=None):
         """Called when entering this state"""
+        gc_policy.safe_point('lose')
         audio = self.stack.persistent_data.get('audio')
         if audio:
             audio.stop_music()
@@ -69,6 +71,9 @@ class LoseState(GameState):
             self.stack.pop_with_transition()
         elif option == 'Main Menu':
             # Exit to main menu with transition
+            for state in self.stack.states:
+                if hasattr(state, 'end_run'):
+                    state.end_run('quit')  # Record the abandoned attempt
             from game.ui.main_menu import MainMenuState
             self.stack.clear_and_push_with_transition(MainMenuState)
     
@@ -82,7 +87,7 @@ class LoseState(GameState):
 
         # Title with shadow
         title_text = "TRANSMISSION FAILED"
-        shadow = pygame.font.Font(None, 72).render(title_text, True, (0, 0, 0))
+        shadow = get_font(72).render(title_text, True, (0, 0, 0))
         shadow_rect = shadow.get_rect(centerx=settings.SCREEN_WIDTH // 2 + 3, y=120)
         screen.blit(shadow, shadow_rect)
         title = self.title_font.render(title_text, True, settings.COLOR_RED)
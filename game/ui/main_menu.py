@@ -3,7 +3,8 @@ Main menu
 """
 import math
 import pygame
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
+from game.core.gc_policy import gc_policy
 from game.core.save_system import SaveSystem
 from game.world.background import ParallaxBackground
 
@@ -13,9 +14,9 @@ class MainMenuState(GameState):
     
     def __init__(self, stack):
         super().__init__(stack)
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(72)
+        self.menu_font = get_font(48)
+        self.small_font = get_font(20)
         self._update_options()
         
         # Animated background reused from gameplay
@@ -31,6 +32,7 @@ class MainMenuState(GameState):
     
     def enter(self, previous_state=None):
         """Called when entering this state"""
+        gc_policy.leave_gameplay()
         audio = self.stack.persistent_data.get('audio')
         if audio:
             audio.play_music(audio.MUSIC_MENU)
@@ -129,7 +131,7 @@ class MainMenuState(GameState):
         screen.blit(title, title_rect)
         
         # Subtitle
-        subtitle_font = pygame.font.Font(None, 24)
+        subtitle_font = get_font(24)
         subtitle = subtitle_font.render("Flip gravity. Deliver data. Survive.", True, settings.COLOR_WHITE)
         subtitle_rect = subtitle.get_rect(centerx=settings.SCREEN_WIDTH // 2, y=180)
         screen.blit(subtitle, subtitle_rect)
@@ -3,7 +3,7 @@ Options menu
 """
 import math
 import pygame
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
 
 
 class OptionsState(GameState):
@@ -12,7 +12,7 @@ class OptionsState(GameState):
     def __init__(self, stack):
         super().__init__(stack)
         self.selected = 0
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
         self.audio = stack.persistent_data.get('audio')
         self.num_options = 3  # Music, SFX, Controls
         
@@ -173,7 +173,7 @@ class OptionsState(GameState):
                 screen.blit(pct_surf, (bar_x + bar_width + 20, bar_y - 5))
         
         # Instructions
-        inst_font = pygame.font.Font(None, 24)
+        inst_font = get_font(24)
         inst = inst_font.render("Enter/Click: Select   Arrows/WASD or Wheel: Adjust   ESC: Back", True, settings.COLOR_GRAY)
         inst_rect = inst.get_rect(centerx=settings.SCREEN_WIDTH // 2, bottom=settings.SCREEN_HEIGHT - 50)
         screen.blit(inst, inst_rect)
@@ -3,9 +3,11 @@ Pause menu
 """
 import math
 import pygame
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
+from game.core.gc_policy import gc_policy
 from game.world.background import ParallaxBackground
 from game.core.save_system import SaveSystem
+from game.world.checkpoints import encode_checkpoint_data
 
 
 class PauseState(GameState):
@@ -15,9 +17,9 @@ class PauseState(GameState):
         super().__init__(stack)
         self.options = ['Resume', 'Save & Exit', 'Restart', 'Options', 'Main Menu']
         self.selected = 0
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(72)
+        self.menu_font = get_font(48)
+        self.small_font = get_font(20)
         self.option_rects = []
         self.mouse_enabled = True
         self._pulse_time = 0.0
@@ -28,6 +30,7 @@ class PauseState(GameState):
     
     def enter(self, previous_state=None):
         """Pause music on enter"""
+        gc_policy.safe_point('pause')
         audio = self.persistent_data.get('audio')
         if audio:
             audio.pause_music()
@@ -71,17 +74,26 @@ class PauseState(GameState):
         # elif option == 'Exit Without Saving':
         #     self._exit_without_saving()
         elif option == 'Restart':
-            from game.world.level import LevelState
+            self._end_run()
             self.stack.pop()  # Remove pause
-            self.stack.replace(LevelState)  # Restart level
+            level_state = self.stack.current_state()
+            if hasattr(level_state, 'restart'):
+                level_state.restart()  # In place, same level
         elif option == 'Options':
             from game.ui.options import OptionsState
             self.stack.push(OptionsState)
         elif option == 'Main Menu':
             from game.ui.main_menu import MainMenuState
+            self._end_run()
             self.stack.clear()
             self.stack.push(MainMenuState)
     
+    def _end_run(self):
+        """Record the level attempt underneath as abandoned"""
+        for state in self.stack.states:
+            if hasattr(state, 'end_run'):
+                state.end_run('quit')
+    
     def _save_and_exit(self):
         """Save current game state and exit to main menu"""
         # Get current level state
@@ -126,7 +138,7 @@ class PauseState(GameState):
             }
             
             # Use checkpoint data if available, otherwise create empty state
-            entities_data = level_state.checkpoint_data if hasattr(level_state, 'checkpoint_data') and level_state.checkpoint_data else None
+            entities_data = encode_checkpoint_data(level_state.checkpoint_data) if hasattr(level_state, 'checkpoint_data') and level_state.checkpoint_data else None
             
             game_time = level_state.stopwatch.get_time()
             coins_collected = level_state.player.coins
@@ -135,6 +147,7 @@ class PauseState(GameState):
             SaveSystem.save_game(player_data, level_data, game_time, coins_collected, enemies_defeated, boss_data, entities_data)
         
         # Exit to main menu
+        self._end_run()
         from game.ui.main_menu import MainMenuState
         self.stack.clear()
         self.stack.push(MainMenuState)
@@ -0,0 +1,73 @@
+"""
+Profiler overlay (F3): frame timings and garbage collector activity
+"""
+import gc
+from collections import deque
+import pygame
+from game.core import settings, get_font
+from game.core.gc_policy import gc_policy
+from game.core.hitch import hitches
+
+
+class ProfilerOverlay:
+    """Drawn by the main loop on top of every state"""
+
+    REFRESH = 0.25  # Seconds between text updates (rendering text every frame costs more than it shows)
+
+    def __init__(self):
+        self.visible = False
+        self.frames = deque(maxlen=settings.FPS * 2)  # (frame, update, draw) seconds
+        self.font = get_font(16)
+        self.lines = []
+        self.surface = None
+        self._since_refresh = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._since_refresh = self.REFRESH  # Refresh on the next frame
+
+    def frame(self, frame_seconds, update_seconds, draw_seconds):
+        """Main loop, once per frame"""
+        self.frames.append((frame_seconds, update_seconds, draw_seconds))
+        if self.visible:
+            self._since_refresh += frame_seconds
+            if self._since_refresh >= self.REFRESH:
+                self._since_refresh = 0.0
+                self._refresh()
+
+    def _refresh(self):
+        frames = self.frames
+        count = max(1, len(frames))
+        frame_ms = [f[0] * 1000 for f in frames] or [0.0]
+        update_avg = sum(f[1] for f in frames) * 1000 / count
+        draw_avg = sum(f[2] for f in frames) * 1000 / count
+        pauses = hitches.gc
+        collections = pauses.total_collections
+        safe_point = gc_policy.last_safe_point
+        self.lines = [
+            f"frame {sum(frame_ms) / count:5.1f} ms avg  {max(frame_ms):5.1f} max  ({count} frames)",
+            f"update {update_avg:5.2f} ms  draw {draw_avg:5.2f} ms",
+            f"hitches {hitches.hitches}  (> {hitches.budget * 1000:.0f} ms)",
+            f"gc pause last {pauses.last_pause * 1000:.2f}  max {pauses.max_pause * 1000:.2f}  "
+            f"total {pauses.total_time * 1000:.1f} ms",
+            f"gc runs gen0 {collections[0]}  gen1 {collections[1]}  gen2 {collections[2]}",
+            f"gc counts {gc.get_count()}  thresholds {gc.get_threshold()}",
+            f"gc frozen {gc.get_freeze_count()}  safe points {gc_policy.safe_points}"
+            + (f"  (last: {safe_point[0]}, {safe_point[1] * 1000:.1f} ms)" if safe_point else ""),
+        ]
+        self.surface = None
+
+    def draw(self, screen):
+        if not self.visible or not self.lines:
+            return
+        if self.surface is None:
+            texts = [self.font.render(line, True, settings.COLOR_WHITE) for line in self.lines]
+            width = max(text.get_width() for text in texts) + 16
+            height = sum(text.get_height() for text in texts) + 12
+            self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.surface.fill((0, 0, 0, 170))
+            y = 6
+            for text in texts:
+                self.surface.blit(text, (8, y))
+                y += text.get_height()
+        screen.blit(self.surface, (10, settings.SCREEN_HEIGHT - self.surface.get_height() - 40))  # Above the controls hint
@@ -3,7 +3,8 @@ Enhanced Win screen with modern UI/UX design
 """
 import pygame
 import math
-from game.core import GameState, settings
+from game.core import GameState, settings, get_font
+from game.core.gc_policy import gc_policy
 
 
 class WinState(GameState):
@@ -26,11 +27,19 @@ class WinState(GameState):
         self.buttons.append('exit')
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 84)
-        self.subtitle_font = pygame.font.Font(None, 32)
-        self.stats_font = pygame.font.Font(None, 28)
-        self.condition_font = pygame.font.Font(None, 24)
-        self.instruction_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(84)
+        self.subtitle_font = get_font(32)
+        self.stats_font = get_font(28)
+        self.condition_font = get_font(24)
+        self.instruction_font = get_font(20)
+        
+        # Run history (this run is already recorded by the level)
+        from game.core.run_history import RunHistory
+        summary = RunHistory.get_level_summary(level_id)
+        self.new_best = summary['best_time'] is not None and round(time, 3) <= summary['best_time']
+        self.history_text = f"Attempt #{summary['attempts']}  |  Best: {summary['best_time']:.1f}s" if summary['best_time'] is not None else ""
+        if summary['best_splits']:
+            self.history_text += "  |  Best splits: " + " / ".join(f"{split:.1f}" for split in summary['best_splits'])
         
         # Animation variables
         self.time_elapsed = 0
@@ -45,6 +54,7 @@ class WinState(GameState):
     
     def enter(self, previous_state=None):
         """Called when entering this state"""
+        gc_policy.leave_gameplay()
         audio = self.stack.persistent_data.get('audio')
         if audio:
             audio.play_music(audio.MUSIC_MENU)
@@ -249,8 +259,17 @@ class WinState(GameState):
             for i, text in enumerate(stats_text):
                 text_surf = self.stats_font.render(text, True, settings.COLOR_WHITE)
                 text_surf.set_alpha(self.stats_alpha)
-                text_rect = text_surf.get_rect(centerx=settings.SCREEN_WIDTH // 2, y=250 + i * 40)
+                text_rect = text_surf.get_rect(centerx=settings.SCREEN_WIDTH // 2, y=240 + i * 34)
                 screen.blit(text_surf, text_rect)
+            
+            # Run history line
+            if self.history_text:
+                history_color = settings.COLOR_YELLOW if self.new_best else settings.COLOR_GRAY
+                history_text = ("NEW BEST!  " if self.new_best else "") + self.history_text
+                history_surf = self.instruction_font.render(history_text, True, history_color)
+                history_surf.set_alpha(self.stats_alpha)
+                history_rect = history_surf.get_rect(centerx=settings.SCREEN_WIDTH // 2, y=310)
+                screen.blit(history_surf, history_rect)
         
         # Clear conditions section
         if self.conditions_alpha > 0 and self.clear_conditions:
@@ -1,5 +1,12 @@
 """
-World systems (level, camera, collisions)
+World systems (level, camera, collisions) (modules are imported on first access)
 """
-from .tile import Tile
-from .collisions import CollisionSystem
+from game.core.utils import lazy_exports
+
+_EXPORTS = {
+    'Tile': '.tile',
+    'CollisionSystem': '.collisions',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
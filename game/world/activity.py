@@ -0,0 +1,142 @@
+"""
+Active-region simulation: entities far from the camera sleep
+"""
+import bisect
+from game.core import settings
+
+
+class ActivityManager:
+    """Decides which entities tick each frame based on distance from the camera
+
+    Entities are bucketed by their home x position (the world only scrolls
+    horizontally). Each frame only the buckets near the camera are visited:
+    - within ACTIVE_RADIUS entities tick every frame,
+    - within SLEEP_RADIUS they tick every LOD_TICK_INTERVAL frames,
+    - anything further away sleeps and costs nothing.
+    Every tick hands the entity the full time since its previous tick, so a
+    woken entity can catch up deterministically. Retired entities (dead ones,
+    see EntityManager) are taken out of their bucket until revived.
+    """
+
+    def __init__(self, active_radius=None, sleep_radius=None, lod_interval=None, bucket_size=None):
+        self.active_radius = settings.ACTIVE_RADIUS if active_radius is None else active_radius
+        self.sleep_radius = settings.SLEEP_RADIUS if sleep_radius is None else sleep_radius
+        self.sleep_radius = max(self.sleep_radius, self.active_radius)
+        self.lod_interval = settings.LOD_TICK_INTERVAL if lod_interval is None else lod_interval
+        self.bucket_size = settings.ACTIVITY_BUCKET_SIZE if bucket_size is None else bucket_size
+
+        self.clock = 0.0
+        self.frame = 0
+        self.center_x = 0
+        self.groups = {}
+
+    def add(self, group, entity, x=None, reach=None):
+        """Register an entity; x is its home position, reach how far it can stray from it"""
+        data = self.groups.get(group)
+        if data is None:
+            data = {'entities': [], 'home_x': [], 'reach': [], 'last_tick': [], 'buckets': {}, 'max_reach': 0,
+                    'retired': set()}
+            self.groups[group] = data
+
+        if x is None:
+            x = entity.rect.centerx
+        if reach is None:
+            reach = entity.rect.width // 2
+
+        index = len(data['entities'])
+        data['entities'].append(entity)
+        data['home_x'].append(x)
+        data['reach'].append(reach)
+        data['last_tick'].append(self.clock)
+        data['buckets'].setdefault(int(x) // self.bucket_size, []).append(index)
+        data['max_reach'] = max(data['max_reach'], reach)
+        return index
+
+    def _bucket(self, data, index):
+        return data['buckets'].setdefault(int(data['home_x'][index]) // self.bucket_size, [])
+
+    def retire(self, group, index):
+        """Stop ticking entity `index` of `group` (no-op if already retired)"""
+        data = self.groups[group]
+        if index not in data['retired']:
+            data['retired'].add(index)
+            self._bucket(data, index).remove(index)
+
+    def revive(self, group, index):
+        """Tick a retired entity again, starting from now (no-op if it isn't retired)"""
+        data = self.groups[group]
+        if index in data['retired']:
+            data['retired'].discard(index)
+            bisect.insort(self._bucket(data, index), index)
+            data['last_tick'][index] = self.clock  # No catch-up for the time it was dead
+
+    def snapshot(self):
+        """Copy of the simulation clock and per-entity tick times (see restore)"""
+        return {
+            'clock': self.clock,
+            'frame': self.frame,
+            'center_x': self.center_x,
+            'last_tick': {group: list(data['last_tick']) for group, data in self.groups.items()},
+            'retired': {group: set(data['retired']) for group, data in self.groups.items()}
+        }
+
+    def restore(self, snapshot):
+        """Go back to a snapshot (entities must not have been added since)"""
+        self.clock = snapshot['clock']
+        self.frame = snapshot['frame']
+        self.center_x = snapshot['center_x']
+        for group, last_tick in snapshot['last_tick'].items():
+            self.groups[group]['last_tick'][:] = last_tick
+        for group, retired in snapshot['retired'].items():
+            data = self.groups[group]
+            for index in data['retired'] - retired:
+                bisect.insort(self._bucket(data, index), index)
+            for index in retired - data['retired']:
+                self._bucket(data, index).remove(index)
+            data['retired'] = set(retired)
+
+    def begin_frame(self, dt, camera):
+        """Advance the simulation clock and recentre on the camera"""
+        self.clock += dt
+        self.frame += 1
+        self.center_x = camera.x + camera.screen_width // 2
+
+    def active_span(self):
+        """World x range that is simulated at full rate"""
+        return (self.center_x - self.active_radius, self.center_x + self.active_radius)
+
+    def ticks(self, group):
+        """List of (entity, dt) for entities of `group` that tick this frame"""
+        data = self.groups.get(group)
+        if data is None:
+            return []
+
+        # Only visit buckets that can hold awake entities
+        reach = self.sleep_radius + data['max_reach']
+        first = int(self.center_x - reach) // self.bucket_size
+        last = int(self.center_x + reach) // self.bucket_size
+        buckets = data['buckets']
+        candidates = []
+        for col in range(first, last + 1):
+            indices = buckets.get(col)
+            if indices:
+                candidates.extend(indices)
+        candidates.sort()  # Keep spawn order so updates stay deterministic
+
+        home_x = data['home_x']
+        entity_reach = data['reach']
+        last_tick = data['last_tick']
+        entities = data['entities']
+        result = []
+        for index in candidates:
+            distance = abs(home_x[index] - self.center_x) - entity_reach[index]
+            if distance > self.sleep_radius:
+                continue  # Asleep
+            if distance > self.active_radius and self.lod_interval > 1:
+                # Reduced rate, staggered so LOD ticks spread across frames
+                if (self.frame + index) % self.lod_interval:
+                    continue
+            result.append((entities[index], self.clock - last_tick[index]))
+            last_tick[index] = self.clock
+
+        return result
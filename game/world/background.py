@@ -3,7 +3,10 @@ Proper city skyline background system with transparency support
 """
 import pygame
 import os
-from game.core import settings
+from game.core import settings, get_log
+from game.io.assets import load_image, get_sprite
+
+_log = get_log('background')
 
 
 class ParallaxBackground:
@@ -13,64 +16,105 @@ class ParallaxBackground:
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        print(f"Creating transparent city skyline background: {screen_width}x{screen_height}")
-        
         # Create a dark sky background
-        self.sky_surface = pygame.Surface((screen_width, screen_height))
-        # Dark blue-purple sky gradient
-        for y in range(screen_height):
-            r = int(20 + (y / screen_height) * 30)
-            g = int(10 + (y / screen_height) * 20)
-            b = int(40 + (y / screen_height) * 60)
-            color = (r, g, b)
-            pygame.draw.line(self.sky_surface, color, (0, y), (screen_width, y))
+        self.sky_surface = self.build_sky(screen_width, screen_height)
         
         # Load the actual city skyline images with proper transparency
         self.layers = []
         self._load_transparent_images()
         
-        print(f"Background ready with {len(self.layers)} transparent layers")
+        _log.debug("Background ready: %d layers at %dx%d", len(self.layers), screen_width, screen_height)
     
-    def _load_transparent_images(self):
-        """Load city skyline images with proper transparency handling"""
-        layer_paths = [
-            "game/assets/images/bg/Layers/back.png",
-            "game/assets/images/bg/Layers/buildings.png", 
-            "game/assets/images/bg/Layers/front.png"
-        ]
+    # Skyline layers (back to front) and their parallax speeds
+    LAYER_PATHS = [
+        "game/assets/images/bg/Layers/back.png",
+        "game/assets/images/bg/Layers/buildings.png", 
+        "game/assets/images/bg/Layers/front.png"
+    ]
+    LAYER_SPEEDS = [0.2, 0.5, 0.8]
+    
+    # Finished surfaces shared by every background of the same size (never modified)
+    _sky_cache = {}  # (w, h) -> sky gradient
+    _layer_cache = {}  # (path, w, h) -> built layer
+    
+    @staticmethod
+    def build_sky(screen_width, screen_height):
+        """Dark blue-purple sky gradient (built once per size)"""
+        key = (screen_width, screen_height)
+        sky = ParallaxBackground._sky_cache.get(key)
+        if sky is None:
+            sky = pygame.Surface((screen_width, screen_height))
+            for y in range(screen_height):
+                r = int(20 + (y / screen_height) * 30)
+                g = int(10 + (y / screen_height) * 20)
+                b = int(40 + (y / screen_height) * 60)
+                color = (r, g, b)
+                pygame.draw.line(sky, color, (0, y), (screen_width, y))
+            ParallaxBackground._sky_cache[key] = sky
+        return sky
+    
+    @staticmethod
+    def prepare(screen_width, screen_height):
+        """Build the sky and skyline layers ahead of time (safe on a worker thread)"""
+        ParallaxBackground.build_sky(screen_width, screen_height)
+        for path in ParallaxBackground.LAYER_PATHS:
+            try:
+                ParallaxBackground._get_layer(path, screen_width, screen_height)
+            except Exception:
+                pass  # The constructor reports it and uses a fallback
+    
+    @staticmethod
+    def _get_layer(path, screen_width, screen_height):
+        """Finished layer for `path`: prebuilt from the asset bundle, else built once and cached"""
+        # Prefer the prebuilt layer from the asset bundle
+        layer = get_sprite(ParallaxBackground.layer_name(path, screen_width, screen_height))
+        if layer is not None:
+            return layer
+        key = (path, screen_width, screen_height)
+        layer = ParallaxBackground._layer_cache.get(key)
+        if layer is None:
+            _log.debug("Building transparent layer: %s", path)
+            layer = ParallaxBackground.build_layer(load_image(path), screen_width, screen_height)
+            ParallaxBackground._layer_cache[key] = layer
+        return layer
+    
+    @staticmethod
+    def layer_name(path, screen_width, screen_height):
+        """Bundle name of a prepared layer (see game.tools.build_assets)"""
+        return f"bg/{os.path.splitext(os.path.basename(path))[0]}@{screen_width}x{screen_height}"
+    
+    @staticmethod
+    def build_layer(image, screen_width, screen_height):
+        """Scale a skyline image to the screen height, dim it and widen it for scrolling"""
+        # Scale to fit screen height, maintain aspect ratio
+        scale_factor = screen_height / image.get_height()
+        new_width = int(image.get_width() * scale_factor)
+        new_height = int(image.get_height() * scale_factor)
         
-        speeds = [0.2, 0.5, 0.8]  # Back, middle, front
+        # Scale the image while preserving transparency
+        scaled_image = pygame.transform.scale(image, (new_width, new_height))
         
-        for i, (path, speed) in enumerate(zip(layer_paths, speeds)):
+        # Make the layer more dim by reducing opacity
+        scaled_image = scaled_image.copy()
+        scaled_image.set_alpha(100)  # 0-255, lower = more dim
+        
+        # Ensure the image is wide enough for seamless scrolling
+        if new_width < screen_width * 2:
+            # Create a wider version by repeating the image
+            repeat_count = (screen_width * 2) // new_width + 1
+            wide_surface = pygame.Surface((new_width * repeat_count, new_height), pygame.SRCALPHA)
+            for j in range(repeat_count):
+                wide_surface.blit(scaled_image, (j * new_width, 0))
+            scaled_image = wide_surface
+        
+        return scaled_image
+    
+    def _load_transparent_images(self):
+        """Load city skyline images with proper transparency handling"""
+        for i, (path, speed) in enumerate(zip(self.LAYER_PATHS, self.LAYER_SPEEDS)):
             try:
-                print(f"Loading transparent layer {i+1}: {path}")
-                
-                # Load with alpha channel preserved
-                image = pygame.image.load(path).convert_alpha()
-                print(f"Original: {image.get_size()}")
-                
-                # Scale to fit screen height, maintain aspect ratio
-                scale_factor = self.screen_height / image.get_height()
-                new_width = int(image.get_width() * scale_factor)
-                new_height = int(image.get_height() * scale_factor)
-                
-                # Scale the image while preserving transparency
-                scaled_image = pygame.transform.scale(image, (new_width, new_height))
-                
-                # Make the layer more dim by reducing opacity
-                scaled_image = scaled_image.copy()
-                scaled_image.set_alpha(100)  # 0-255, lower = more dim
-                print(f"Scaled: {scaled_image.get_size()}")
-                
-                # Ensure the image is wide enough for seamless scrolling
-                if new_width < self.screen_width * 2:
-                    # Create a wider version by repeating the image
-                    repeat_count = (self.screen_width * 2) // new_width + 1
-                    wide_surface = pygame.Surface((new_width * repeat_count, new_height), pygame.SRCALPHA)
-                    for j in range(repeat_count):
-                        wide_surface.blit(scaled_image, (j * new_width, 0))
-                    scaled_image = wide_surface
-                    new_width = scaled_image.get_width()
+                scaled_image = self._get_layer(path, self.screen_width, self.screen_height)
+                new_width, new_height = scaled_image.get_size()
                 
                 layer = {
                     'image': scaled_image,
@@ -81,10 +125,9 @@ class ParallaxBackground:
                 }
                 
                 self.layers.append(layer)
-                print(f"Transparent layer {i+1} loaded: {new_width}x{new_height}, speed={speed}")
                 
             except Exception as e:
-                print(f"Error loading {path}: {e}")
+                _log.warning("Could not load %s (%s), using a fallback layer", path, e)
                 # Create a visible fallback with transparency
                 fallback = pygame.Surface((self.screen_width * 2, self.screen_height), pygame.SRCALPHA)
                 colors = [(100, 50, 50, 200), (50, 100, 50, 200), (50, 50, 100, 200)]
@@ -98,7 +141,6 @@ class ParallaxBackground:
                     'x': 0
                 }
                 self.layers.append(layer)
-                print(f"Created transparent fallback layer {i+1}")
     
     def update(self, camera_x):
         """Update parallax positions"""
@@ -3,7 +3,9 @@ Camera system with follow and clamping
 """
 import math
 import random
-from game.core import settings, lerp, clamp, Timer
+from game.core import settings, lerp, clamp, Timer, get_log
+
+_log = get_log('camera')
 
 
 class Camera:
@@ -62,9 +64,8 @@ class Camera:
             self.shake_offset_x = math.sin(time * settings.CAMERA_SHAKE_FREQUENCY * 2 * math.pi) * current_intensity
             self.shake_offset_y = math.cos(time * settings.CAMERA_SHAKE_FREQUENCY * 2 * math.pi) * current_intensity
             
-            # Debug output (only print occasionally to avoid spam)
-            if int(time * 60) % 10 == 0:  # Print every 10 frames
-                print(f"DEBUG: Shake active - offset_x={self.shake_offset_x:.2f}, offset_y={self.shake_offset_y:.2f}")
+            if _log.on_debug:
+                _log.debug("Shake active - offset_x=%.2f, offset_y=%.2f", self.shake_offset_x, self.shake_offset_y)
         else:
             self.shake_offset_x = 0.0
             self.shake_offset_y = 0.0
@@ -103,7 +104,6 @@ class Camera:
         if duration is None:
             duration = settings.CAMERA_SHAKE_DURATION
             
-        print(f"DEBUG: Camera shake called with intensity={intensity}, duration={duration}")
+        _log.debug("Shake started with intensity=%s, duration=%s", intensity, duration)
         self.shake_intensity = intensity
         self.shake_timer.start(duration)
-        print(f"DEBUG: Shake timer active: {self.shake_timer.is_active()}")
@@ -1,13 +1,17 @@
 """
 Checkpoint system for respawn
 """
+import copy
 import pygame
-from game.core import settings
+from game.core import settings, Timer, Stopwatch
+from game.entities.spikes import SpikePool
 
 
 class Checkpoint:
     """Respawn checkpoint flag"""
     
+    __slots__ = ('rect', 'activated', 'animation_time')
+    
     def __init__(self, x, y):
         self.rect = pygame.Rect(x, y, 16, 48)
         self.activated = False
@@ -53,3 +57,117 @@ class Checkpoint:
             pygame.draw.line(screen, settings.COLOR_WHITE,
                            (check_x + 3, check_y + 3),
                            (check_x + 8, check_y - 4), 2)
+
+
+# Checkpoint snapshots: one flag byte per entity, indexed by entity_id
+# (group name -> entity attribute that is stored)
+SNAPSHOT_FLAGS = {
+    'enemies': 'alive',
+    'coins': 'collected',
+    'stars': 'collected',
+    'powerups': 'collected',
+    'storms': 'collected',
+    'breakables': 'broken',
+    'buttons': 'pressed',
+    'gates': 'open',
+}
+
+
+def capture_flags(entities, attr):
+    """Pack one boolean attribute of a list of entities into a bytearray"""
+    flags = bytearray(len(entities))
+    for entity in entities:
+        if getattr(entity, attr):
+            flags[entity.entity_id] = 1
+    return flags
+
+
+def restore_flags(entities, attr, flags):
+    """Apply a bytearray from capture_flags; entities past its end get False"""
+    count = len(flags)
+    for entity in entities:
+        entity_id = entity.entity_id
+        setattr(entity, attr, entity_id < count and flags[entity_id] == 1)
+
+
+def encode_checkpoint_data(data):
+    """Copy of checkpoint data that json can store (flag bytes become hex strings)"""
+    if not data:
+        return data
+    encoded = dict(data)
+    encoded['flags'] = {group: bytes(flags).hex() for group, flags in data.get('flags', {}).items()}
+    return encoded
+
+
+def decode_checkpoint_data(data):
+    """Inverse of encode_checkpoint_data
+
+    Saves from older versions identified entities by position; their entity
+    state can't be mapped onto IDs, so only the player part is kept.
+    """
+    if not data:
+        return data
+    decoded = dict(data)
+    flags = data.get('flags')
+    if isinstance(flags, dict):
+        decoded['flags'] = {group: bytearray.fromhex(value) if isinstance(value, str) else bytearray(value)
+                            for group, value in flags.items()}
+    else:
+        decoded['flags'] = {}
+    return decoded
+
+
+def _copy_value(value):
+    """Copy the mutable parts of an attribute; surfaces, callbacks and managers stay shared"""
+    if isinstance(value, (pygame.Rect, list, dict, set, bytearray)):
+        return value.copy()
+    if isinstance(value, (Timer, Stopwatch)):
+        return copy.copy(value)
+    if isinstance(value, SpikePool):
+        return value.copy()
+    return value
+
+
+_slot_names = {}  # class -> every __slots__ field along its MRO
+
+
+def _get_slot_names(cls):
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in ('__dict__', '__weakref__') and name not in names:
+                    names.append(name)
+        names = _slot_names[cls] = tuple(names)
+    return names
+
+
+def capture_state(obj):
+    """Snapshot every attribute of an entity (for restoring it to this exact state later)
+
+    Works for instance dicts and __slots__ alike (unset slots are left out).
+    """
+    state = {name: _copy_value(value) for name, value in getattr(obj, '__dict__', {}).items()}
+    for name in _get_slot_names(type(obj)):
+        if hasattr(obj, name):
+            state[name] = _copy_value(getattr(obj, name))
+    return state
+
+
+def restore_state(obj, state):
+    """Put an entity back to a capture_state() snapshot; the snapshot stays reusable"""
+    slots = _get_slot_names(type(obj))
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is not None:
+        attrs.clear()
+    for name in slots:
+        if name in state:
+            setattr(obj, name, _copy_value(state[name]))
+        elif hasattr(obj, name):
+            delattr(obj, name)
+    if attrs is not None:
+        for name, value in state.items():
+            if name not in slots:
+                attrs[name] = _copy_value(value)
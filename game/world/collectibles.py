@@ -0,0 +1,135 @@
+"""
+Struct-of-arrays store for pickups (coins, stars, power-ups, storms)
+"""
+import numpy as np
+
+
+class CollectibleStore:
+    """Keeps pickup positions, sizes, animation phases and collected flags in NumPy arrays
+
+    One vectorized pass per frame advances the bobbing animation and tests every
+    uncollected pickup against the player rect. Pickups are reported as index
+    lists per kind; the entity objects stay around for drawing and read their
+    state back from the arrays (see Collectible).
+    """
+
+    KINDS = ('coin', 'star', 'powerup', 'storm')
+    ARRAYS = {
+        'x': np.int32,
+        'y': np.int32,
+        'w': np.int32,
+        'h': np.int32,
+        'kind': np.int8,
+        'spawn_clock': np.float64,
+        'bob_rate': np.float64,
+        'bob_amp': np.float64,
+        'bob': np.float64,
+        'collected': bool,
+    }
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.clock = 0.0  # Shared animation clock (seconds)
+        self.entities = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Create (or grow) the backing arrays"""
+        old_count = self.count
+        for name, dtype in self.ARRAYS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old_count:
+                array[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def add(self, entity, kind):
+        """Register a pickup and move its state into the arrays; returns its index"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        index = self.count
+        rect = entity.rect
+        self.x[index] = rect.x
+        self.y[index] = rect.y
+        self.w[index] = rect.width
+        self.h[index] = rect.height
+        self.kind[index] = self.KINDS.index(kind)
+        self.spawn_clock[index] = self.clock - entity.anim_time
+        self.bob_rate[index] = entity.BOB_RATE
+        self.bob_amp[index] = entity.BOB_AMPLITUDE
+        self.bob[index] = entity.get_bob_offset()
+        self.collected[index] = entity.collected
+        self.entities.append(entity)
+        self.count += 1
+
+        entity.attach(self, index)
+        return index
+
+    def snapshot(self):
+        """Copy of every pickup's state (see restore)"""
+        n = self.count
+        return {
+            'count': n,
+            'clock': self.clock,
+            'arrays': {name: getattr(self, name)[:n].copy() for name in self.ARRAYS}
+        }
+
+    def restore(self, snapshot):
+        """Go back to a snapshot with bulk array copies; pickups added since are dropped"""
+        n = snapshot['count']
+        self.count = n
+        self.clock = snapshot['clock']
+        del self.entities[n:]
+        for name, array in snapshot['arrays'].items():
+            getattr(self, name)[:n] = array
+
+    def reset_collected(self):
+        """Mark every pickup uncollected"""
+        self.collected[:self.count] = False
+
+    def get_anim_time(self, index):
+        """Seconds pickup `index` has been animating"""
+        return self.clock - self.spawn_clock[index]
+
+    def update(self, dt, player_rect, active_span=None):
+        """Advance animation and collect overlapping pickups
+
+        active_span: optional (min_x, max_x); bobbing is only recomputed for
+        pickups inside it (the animation is a function of the shared clock, so
+        pickups outside resume in phase when they come back into range).
+        Returns a dict of kind -> list of indices collected this frame.
+        """
+        self.clock += dt
+        pickups = {kind: [] for kind in self.KINDS}
+
+        n = self.count
+        if n == 0:
+            return pickups
+
+        # Vectorized bobbing
+        if active_span is None:
+            age = self.clock - self.spawn_clock[:n]
+            np.multiply(np.sin(age * self.bob_rate[:n]), self.bob_amp[:n], out=self.bob[:n])
+        else:
+            awake = np.flatnonzero((self.x[:n] >= active_span[0]) & (self.x[:n] <= active_span[1]))
+            age = self.clock - self.spawn_clock[awake]
+            self.bob[awake] = np.sin(age * self.bob_rate[awake]) * self.bob_amp[awake]
+
+        # Vectorized player overlap test (same rule as Rect.colliderect)
+        x = self.x[:n]
+        y = self.y[:n]
+        hits = ~self.collected[:n]
+        hits &= x < player_rect.right
+        hits &= x + self.w[:n] > player_rect.left
+        hits &= y < player_rect.bottom
+        hits &= y + self.h[:n] > player_rect.top
+
+        indices = np.flatnonzero(hits)
+        if indices.size:
+            self.collected[indices] = True
+            kinds = self.kind[indices]
+            for index, kind in zip(indices.tolist(), kinds.tolist()):
+                pickups[self.KINDS[kind]].append(index)
+
+        return pickups
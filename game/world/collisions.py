@@ -1,6 +1,7 @@
 """
 Collision detection with tilegrid
 """
+import bisect
 import pygame
 from game.core import settings
 
@@ -12,9 +13,85 @@ class CollisionSystem:
         self.tile_map = tile_map  # 2D list of Tile objects
         self.width = len(tile_map[0]) if tile_map else 0
         self.height = len(tile_map)
+        
+        # Dynamic colliders (gates, breakable blocks): entities with rect (the
+        # area they can ever cover), is_solid() and get_collision_rect()
+        self.colliders = []
+        self.collider_columns = {}  # tile column -> collider indices, ascending
+        self.collider_spans = []  # index -> columns it is filed under
+    
+    def _columns(self, rect):
+        return range(rect.left // settings.TILE_SIZE, (rect.right - 1) // settings.TILE_SIZE + 1)
+    
+    def add_collider(self, entity):
+        """Register a moving or toggling solid so every collision query sees it"""
+        index = len(self.colliders)
+        self.colliders.append(entity)
+        self.collider_spans.append(range(0))
+        self.move_collider(entity, index)
+        return index
+    
+    def move_collider(self, entity, index=None):
+        """Re-file a collider after its rect moved"""
+        if index is None:
+            index = self.colliders.index(entity)
+        for col in self.collider_spans[index]:
+            self.collider_columns[col].remove(index)
+        span = self._columns(entity.rect)
+        for col in span:
+            bisect.insort(self.collider_columns.setdefault(col, []), index)
+        self.collider_spans[index] = span
+    
+    def get_collider_collisions(self, rect):
+        """(rect, collider) for every solid dynamic collider overlapping rect"""
+        found = None
+        for col in self._columns(rect):
+            indices = self.collider_columns.get(col)
+            if indices:
+                found = indices if found is None else sorted(set(found).union(indices))
+        collisions = []
+        for index in found or ():
+            collider = self.colliders[index]
+            if collider.is_solid():
+                collider_rect = collider.get_collision_rect()
+                if rect.colliderect(collider_rect):
+                    collisions.append((collider_rect, collider))
+        return collisions
+    
+    def get_push_out(self, rect):
+        """(dx, dy) that moves rect out of colliders that closed on top of it
+        
+        Pushes along the axis of smallest overlap, away from the collider's centre.
+        """
+        dx = dy = 0
+        for collider_rect, _ in self.get_collider_collisions(rect):
+            rect = rect.move(dx, dy)
+            overlap_x = min(rect.right, collider_rect.right) - max(rect.left, collider_rect.left)
+            overlap_y = min(rect.bottom, collider_rect.bottom) - max(rect.top, collider_rect.top)
+            if overlap_x <= 0 or overlap_y <= 0:
+                continue  # Already pushed clear by an earlier one
+            if overlap_x < overlap_y:
+                dx += -overlap_x if rect.centerx < collider_rect.centerx else overlap_x
+            else:
+                dy += -overlap_y if rect.centery < collider_rect.centery else overlap_y
+        return dx, dy
+    
+    def get_collisions(self, rect, gravity_dir):
+        """(rect, collider) for solid tiles and colliders overlapping rect; collider is None for tiles"""
+        collisions = [(tile_rect, None) for tile_rect in self._get_static_collisions(rect, gravity_dir)]
+        if self.colliders:
+            collisions += self.get_collider_collisions(rect)
+        return collisions
     
     def get_tile_collisions(self, rect, gravity_dir):
-        """Get all solid tiles colliding with rect for given gravity"""
+        """Get all solid tiles and dynamic colliders colliding with rect for given gravity"""
+        collisions = self._get_static_collisions(rect, gravity_dir)
+        if self.colliders:
+            collisions += [collider_rect for collider_rect, _ in self.get_collider_collisions(rect)]
+        return collisions
+    
+    def _get_static_collisions(self, rect, gravity_dir):
+        """Solid tiles of the tile grid colliding with rect"""
         collisions = []
         
         # Get tile range to check
@@ -97,3 +174,49 @@ class CollisionSystem:
                     tiles.append(tile)
         
         return tiles
+
+
+class CellLayer:
+    """Static objects bucketed by the tile cells their rect covers
+
+    Sits alongside the tile grid for things that never move (spikes,
+    checkpoints): instead of testing every object each frame, callers ask
+    for the ones sharing a cell with a rect.
+    """
+    
+    def __init__(self):
+        self.objects = []
+        self.cells = {}  # (col, row) -> indices into objects, ascending
+    
+    @staticmethod
+    def _cell_range(rect):
+        """Columns and rows of the cells a rect overlaps"""
+        size = settings.TILE_SIZE
+        cols = range(rect.left // size, (rect.right - 1) // size + 1)
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        return cols, rows
+    
+    def add(self, obj):
+        """Bake an object into every cell under its rect"""
+        index = len(self.objects)
+        self.objects.append(obj)
+        cols, rows = self._cell_range(obj.rect)
+        for row in rows:
+            for col in cols:
+                self.cells.setdefault((col, row), []).append(index)
+    
+    def query(self, rect):
+        """Objects sharing a cell with rect, in the order they were added"""
+        cols, rows = self._cell_range(rect)
+        found = None
+        for row in rows:
+            for col in cols:
+                indices = self.cells.get((col, row))
+                if indices:
+                    if found is None:
+                        found = indices
+                    else:
+                        found = sorted(set(found).union(indices))
+        if found is None:
+            return []
+        return [self.objects[index] for index in found]
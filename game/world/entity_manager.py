@@ -0,0 +1,119 @@
+"""
+Entity pools: per-type lists that only hand out live entities
+"""
+
+
+class EntityPool:
+    """Every entity of one type in spawn order, plus the ones still live
+
+    `entities` keeps everything that was spawned (checkpoint flags index it by
+    entity_id and restart() restores it), `live` only what still needs
+    updating and drawing. Entities with an is_live() method drop out of `live`
+    in compact() once it returns False and come back through refresh();
+    entities without one never die.
+    """
+
+    def __init__(self, name, activity=None):
+        self.name = name
+        self.entities = []
+        self.live = []
+        self.live_slots = []  # Slot in `entities` of each live entity
+        self.live_flags = bytearray()  # 1 per slot in `entities`
+        self.mortal = False  # Any entity with is_live()
+        self.activity = activity  # ActivityManager ticking this group (if any)
+        self.activity_index = {}  # slot -> index in the activity group
+
+    def spawn(self, entity, ticked=False, x=None, reach=None):
+        """Add a live entity; ticked ones are also registered with the activity manager"""
+        slot = len(self.entities)
+        self.entities.append(entity)
+        self.live.append(entity)
+        self.live_slots.append(slot)
+        self.live_flags.append(1)
+        self.mortal = self.mortal or hasattr(entity, 'is_live')
+        if ticked:
+            self.activity_index[slot] = self.activity.add(self.name, entity, x=x, reach=reach)
+        return entity
+
+    def _set_live(self, slot, live):
+        self.live_flags[slot] = live
+        index = self.activity_index.get(slot)
+        if index is not None:
+            if live:
+                self.activity.revive(self.name, index)
+            else:
+                self.activity.retire(self.name, index)
+
+    def compact(self):
+        """Drop entities that died from `live` (costs one check per live entity)"""
+        if not self.mortal:
+            return
+        live = self.live
+        for first, entity in enumerate(live):
+            if not entity.is_live():
+                break
+        else:
+            return  # Nothing died
+
+        survivors, survivor_slots = live[:first], self.live_slots[:first]
+        for entity, slot in zip(live[first:], self.live_slots[first:]):
+            if entity.is_live():
+                survivors.append(entity)
+                survivor_slots.append(slot)
+            else:
+                self._set_live(slot, 0)
+        self.live, self.live_slots = survivors, survivor_slots
+
+    def refresh(self):
+        """Re-check every entity, reviving the ones that came back (checkpoint restore, restart)
+
+        Also picks up `entities` being cut short by restart().
+        """
+        del self.live_flags[len(self.entities):]
+        self.live, self.live_slots = [], []
+        for slot, entity in enumerate(self.entities):
+            alive = 1 if not self.mortal or entity.is_live() else 0
+            if alive != self.live_flags[slot]:
+                self._set_live(slot, alive)
+            if alive:
+                self.live.append(entity)
+                self.live_slots.append(slot)
+
+
+class EntityManager:
+    """Typed entity pools for one level
+
+    Update and draw passes go through live() (or the activity manager's
+    ticks() for ticked groups), so their cost follows the number of live
+    entities rather than everything the level ever spawned.
+    """
+
+    def __init__(self, activity=None):
+        self.activity = activity
+        self.pools = {}
+
+    def add_pool(self, name):
+        """Create the pool for one entity type; returns its list of every entity"""
+        pool = self.pools[name] = EntityPool(name, self.activity)
+        return pool.entities
+
+    def spawn(self, name, entity, ticked=False, x=None, reach=None):
+        return self.pools[name].spawn(entity, ticked, x, reach)
+
+    def live(self, name):
+        """Live entities of a type in spawn order (don't modify)"""
+        return self.pools[name].live
+
+    def compact(self):
+        """Once per frame: drop entities that died"""
+        for pool in self.pools.values():
+            pool.compact()
+
+    def refresh(self):
+        """Revive hook: call after entity state was restored from a checkpoint or snapshot"""
+        for pool in self.pools.values():
+            pool.refresh()
+
+    def counts(self):
+        """name -> (live, total)"""
+        return {name: (len(pool.live), len(pool.entities)) for name, pool in self.pools.items()}
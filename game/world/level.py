@@ -1,40 +1,56 @@
 """
 Level state - main gameplay
 """
+import time
 import pygame
-from game.core import GameState, settings, Stopwatch
+from game.core import GameState, settings, Stopwatch, get_log
+from game.core.telemetry import telemetry
+from game.core.hitch import hitches
+from game.core.gc_policy import gc_policy
 from game.core.clear_conditions import ClearConditions
 from game.world.camera import Camera
-from game.world.collisions import CollisionSystem
-from game.world.checkpoints import Checkpoint
+from game.world.collisions import CollisionSystem, CellLayer
+from game.world.checkpoints import (Checkpoint, SNAPSHOT_FLAGS, capture_flags, restore_flags, decode_checkpoint_data,
+                                    capture_state, restore_state)
 from game.world.background import ParallaxBackground
+from game.world.collectibles import CollectibleStore
+from game.world.activity import ActivityManager
+from game.world.entity_manager import EntityManager
 from game.entities.player import Player
 from game.entities.coin import Coin
 from game.entities.star import FluxStar
 from game.entities.powerup import PowerUp
-from game.entities.storm import StormPowerup
 from game.entities.spikes import Spikes
-from game.entities.breakable import BreakableBlock
-from game.entities.enemy import Drone
-from game.entities.boss import GyroBoss
 from game.entities.bullet import Bullet
-from game.entities.button import Button
-from game.entities.gate import Gate
 from game.io.input import InputHandler
 from game.io.level_loader import LevelLoader
 from game.ui.hud import HUD
 
+_log = get_log('level')
+
+
+def world_render_size(render_scale):
+    """Size of the surface the background and tiles draw into at a render scale"""
+    return round(settings.SCREEN_WIDTH * render_scale), round(settings.SCREEN_HEIGHT * render_scale)
+
+
+def _render_scale(stack):
+    """--render-scale / settings.RENDER_SCALE, kept to 50-100%"""
+    return min(1.0, max(0.5, stack.persistent_data.get('render_scale', settings.RENDER_SCALE)))
+
 
 class LevelState(GameState):
     """Main gameplay state"""
     
     def __init__(self, stack, level_id=1, restore_checkpoint=False):
         super().__init__(stack)
+        load_start = time.perf_counter()
         
         # Load level
         level_path = f"game/assets/levels/level{level_id}.json"
-        level_data = LevelLoader.load_from_json(level_path)
+        level_data = LevelLoader.load_template(level_path)  # Parsed once, shared
         self.level_id = level_id
+        self.level_path = level_path
         
         # Track this attempt
         from game.core.save_system import SaveSystem
@@ -45,7 +61,14 @@ class LevelState(GameState):
         self.collision_system = CollisionSystem(level_data['tile_map'])
         self.tile_map = level_data['tile_map']
         self.camera = Camera(settings.WORLD_WIDTH, settings.WORLD_HEIGHT)
-        self.background = ParallaxBackground(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        
+        # Below 100% the background and tiles (most of the fill) draw into a smaller surface that is
+        # scaled up once per frame; sprites and the HUD still draw at full resolution on top
+        self.render_scale = _render_scale(stack)
+        self.world_surface = None
+        if self.render_scale < 1.0:
+            self.world_surface = pygame.Surface(world_render_size(self.render_scale)).convert()
+        self.background = ParallaxBackground(*world_render_size(self.render_scale))
         
         # Load key bindings from persistent data
         key_bindings = stack.persistent_data.get('key_bindings')
@@ -63,94 +86,132 @@ class LevelState(GameState):
         # Always spawn player at level spawn point
         self.player = Player(level_data['spawn_x'], level_data['spawn_y'], self.audio)
         
+        # Pickups share one array-backed store for animation and collection
+        self.collectibles = CollectibleStore()
+        
+        # Entities far from the camera sleep (see ActivityManager)
+        self.activity = ActivityManager()
+        
+        # One pool per entity type; self.coins etc. list everything spawned,
+        # update/draw passes only visit the live ones (see EntityManager)
+        self.entities = EntityManager(self.activity)
+        
         # Spawn coins (always fresh)
-        self.coins = []
-        for pos in level_data['coins']:
-            coin = Coin(pos[0], pos[1])
-            coin.initial_pos = (pos[0], pos[1])  # Store for identification
-            self.coins.append(coin)
+        self.coins = self.entities.add_pool('coins')
+        for cdata in level_data['coins']:
+            coin = Coin(cdata['x'], cdata['y'])
+            coin.entity_id = cdata['id']  # Stable ID for checkpoint snapshots
+            self.collectibles.add(coin, 'coin')
+            self.entities.spawn('coins', coin)
         
         # Spawn stars (always fresh)
-        self.stars = []
-        for pos in level_data['stars']:
-            star = FluxStar(pos[0], pos[1])
-            star.initial_pos = (pos[0], pos[1])
-            self.stars.append(star)
+        self.stars = self.entities.add_pool('stars')
+        for sdata in level_data['stars']:
+            star = FluxStar(sdata['x'], sdata['y'])
+            star.entity_id = sdata['id']
+            self.collectibles.add(star, 'star')
+            self.entities.spawn('stars', star)
         
         # Spawn power-ups (always fresh)
-        self.powerups = []
+        self.powerups = self.entities.add_pool('powerups')
         for pdata in level_data.get('powerups', []):
             powerup = PowerUp(pdata['x'], pdata['y'], pdata['type'])
-            powerup.initial_pos = (pdata['x'], pdata['y'])
-            self.powerups.append(powerup)
+            powerup.entity_id = pdata['id']
+            self.collectibles.add(powerup, 'powerup')
+            self.entities.spawn('powerups', powerup)
         
         # Spawn storm powerups (always fresh)
-        self.storms = []
-        for pos in level_data.get('storms', []):
-            print(f"Loading storm at position: {pos}")  # Debug output
-            storm = StormPowerup(pos[0], pos[1])
-            storm.initial_pos = (pos[0], pos[1])
-            self.storms.append(storm)
-        
-        print(f"Total storms loaded: {len(self.storms)}")  # Debug output
+        # Optional entity modules are only imported for levels that use them
+        self.storms = self.entities.add_pool('storms')
+        if level_data.get('storms'):
+            from game.entities.storm import StormPowerup
+        for sdata in level_data.get('storms', []):
+            if _log.on_debug:
+                _log.debug("Loading storm at position: %s", (sdata['x'], sdata['y']))
+            storm = StormPowerup(sdata['x'], sdata['y'])
+            storm.entity_id = sdata['id']
+            self.collectibles.add(storm, 'storm')
+            self.entities.spawn('storms', storm)
+        
+        _log.debug("Total storms loaded: %d", len(self.storms))
         
         # Spawn spikes
-        self.spikes = []
+        self.spikes = self.entities.add_pool('spikes')
         for sdata in level_data.get('spikes', []):
-            self.spikes.append(Spikes(sdata['x'], sdata['y'], sdata['orientation']))
+            self.entities.spawn('spikes', Spikes(sdata['x'], sdata['y'], sdata['orientation']))
         
         # Spawn gates
-        self.gates = []
+        self.gates = self.entities.add_pool('gates')
+        if level_data.get('gates'):
+            from game.entities.gate import Gate
         for gdata in level_data.get('gates', []):
             gate = Gate(gdata['x'], gdata['y'], gdata['height'], gdata['orientation'])
-            gate.initial_pos = (gdata['x'], gdata['y'])
-            self.gates.append(gate)
+            gate.entity_id = gdata['id']
+            self.entities.spawn('gates', gate, ticked=True)
+            self.collision_system.add_collider(gate)
         
         # Spawn buttons
-        self.buttons = []
+        self.buttons = self.entities.add_pool('buttons')
+        if level_data.get('buttons'):
+            from game.entities.button import Button
         for bdata in level_data.get('buttons', []):
             button = Button(bdata['x'], bdata['y'], bdata['color'], bdata.get('facing', 'up'))
-            button.initial_pos = (bdata['x'], bdata['y'])
-            self.buttons.append(button)
-        
-        # Wire button callbacks to gates for level 2 puzzle
-        if self.level_id == 2 and len(self.buttons) >= 2 and len(self.gates) >= 3:
-            # Button 0 (bottom) toggles gates 0 and 2 (1st and 3rd)
-            def toggle_gates_0_and_2():
-                self.gates[0].toggle()
-                self.gates[2].toggle()
-            self.buttons[0].on_toggle = toggle_gates_0_and_2
-            
-            # Button 1 (middle) toggles gates 1 and 2 (2nd and 3rd)
-            def toggle_gates_1_and_2():
-                self.gates[1].toggle()
-                self.gates[2].toggle()
-            self.buttons[1].on_toggle = toggle_gates_1_and_2
+            button.entity_id = bdata['id']
+            self.entities.spawn('buttons', button, ticked=True)
+        
+        # Wire buttons to the gates they toggle (the level 2 puzzle)
+        gates_by_id = {gate.entity_id: gate for gate in self.gates}
+        for button, bdata in zip(self.buttons, level_data.get('buttons', [])):
+            toggled = [gates_by_id[gate_id] for gate_id in bdata.get('toggles', ()) if gate_id in gates_by_id]
+            if toggled:
+                def toggle_gates(toggled=toggled):
+                    for gate in toggled:
+                        gate.toggle()
+                button.on_toggle = toggle_gates
         
         # Spawn breakable blocks (always fresh)
-        self.breakables = []
+        self.breakables = self.entities.add_pool('breakables')
+        if level_data.get('breakables'):
+            from game.entities.breakable import BreakableBlock
         for bdata in level_data.get('breakables', []):
             block = BreakableBlock(bdata['x'], bdata['y'], bdata['contents'])
-            block.initial_pos = (bdata['x'], bdata['y'])
-            self.breakables.append(block)
+            block.entity_id = bdata['id']
+            block.on_break = self._spawn_block_contents
+            self.entities.spawn('breakables', block, ticked=True)
+            self.collision_system.add_collider(block)
         
         # Spawn checkpoints
-        self.checkpoints = []
+        self.checkpoints = self.entities.add_pool('checkpoints')
         for pos in level_data['checkpoints']:
-            self.checkpoints.append(Checkpoint(pos[0], pos[1]))
+            self.entities.spawn('checkpoints', Checkpoint(pos[0], pos[1]))
+        
+        # Spikes and checkpoints never move: bake them into per-cell layers so
+        # only the ones in the cells under the player get checked
+        self.hazard_layer = CellLayer()
+        for spike in self.spikes:
+            self.hazard_layer.add(spike)
+        self.trigger_layer = CellLayer()
+        for checkpoint in self.checkpoints:
+            self.trigger_layer.add(checkpoint)
+        self.spike_contacts = []  # Spikes that were under the player last frame
         
         # Spawn enemies (always fresh)
-        self.enemies = []
+        self.enemies = self.entities.add_pool('enemies')
         for enemy_data in level_data['enemies']:
             if enemy_data['type'] == 'drone':
+                from game.entities.enemy import Drone
                 color = enemy_data.get('color', 'blue')
                 drone = Drone(enemy_data['x'], enemy_data['y'],
                             enemy_data['anchor'], enemy_data['range'], color)
-                drone.initial_pos = (enemy_data['x'], enemy_data['y'])
-                self.enemies.append(drone)
+                drone.entity_id = enemy_data['id']
+                # Drones roam their whole patrol range around its midpoint
+                half_range = enemy_data['range'] // 2
+                self.entities.spawn('enemies', drone, ticked=True, x=drone.patrol_start + half_range,
+                                    reach=half_range + drone.rect.width)
         
         # Spawn boss (only if boss exists in level)
         if 'boss_x' in level_data and 'boss_y' in level_data:
+            from game.entities.boss import GyroBoss
             self.boss = GyroBoss(level_data['boss_x'], level_data['boss_y'])
             self.boss_active = False
             self.boss_door_open = False
@@ -200,9 +261,17 @@ class LevelState(GameState):
         # Start timer
         self.stopwatch.start()
         
+        # Run history for this attempt (see RunHistory)
+        self.run_deaths = 0
+        self.run_splits = []  # Game time at each checkpoint reached
+        self.run_recorded = False
+        
         # Boss music tracking
         self.boss_music_playing = False
         
+        # Starting state of everything mutable, for restart()
+        self.pristine = self._capture_pristine()
+        
         # Restore from saved checkpoint if requested
         if restore_checkpoint:
             saved_data = SaveSystem._load_data()
@@ -210,13 +279,24 @@ class LevelState(GameState):
                 game_state = saved_data['game_state']
                 # Restore checkpoint data
                 if 'entities' in game_state and game_state['entities']:
-                    self.checkpoint_data = game_state['entities']
+                    self.checkpoint_data = decode_checkpoint_data(game_state['entities'])
                     # Apply the checkpoint state immediately
                     self._restore_from_checkpoint_data()
-                    print("DEBUG: Restored from saved checkpoint")
+                    _log.info("Restored from saved checkpoint")
+        
+        telemetry.timing('level_load', time.perf_counter() - load_start)
+    
+    @classmethod
+    def prepare(cls, stack, level_id=1, restore_checkpoint=False):
+        """Parse the level, read the save file and build the background ahead of time"""
+        from game.core.save_system import SaveSystem
+        LevelLoader.load_template(f"game/assets/levels/level{level_id}.json")
+        SaveSystem._load_data()
+        ParallaxBackground.prepare(*world_render_size(_render_scale(stack)))
     
     def enter(self, previous_state=None):
         """Called when entering this state"""
+        gc_policy.enter_gameplay(self)
         if self.audio:
             self.audio.play_music(self.audio.MUSIC_GAME)
     
@@ -235,6 +315,8 @@ class LevelState(GameState):
         if self.input_handler.is_action_pressed('debug'):
             self.show_hitboxes = not self.show_hitboxes
         
+        hitches.mark('input')
+        
         # Update player
         self.player.update(dt, self.input_handler, self.collision_system)
         
@@ -259,6 +341,8 @@ class LevelState(GameState):
                 bullet = Bullet(bullet_x, bullet_y, bullet_dir, self.player.bullet_frames)
                 self.bullets.append(bullet)
         
+        hitches.mark('player')
+        
         # Update bullets
         for bullet in self.bullets[:]:
             bullet.update(dt, self.collision_system)
@@ -266,7 +350,7 @@ class LevelState(GameState):
                 self.bullets.remove(bullet)
             else:
                 # Check bullet hits enemy
-                for enemy in self.enemies:
+                for enemy in self.entities.live('enemies'):
                     if enemy.alive and bullet.rect.colliderect(enemy.rect):
                         enemy.take_damage()
                         bullet.alive = False
@@ -292,69 +376,64 @@ class LevelState(GameState):
                         if self.audio:
                             self.audio.play_sfx('boss_hit')
         
+        hitches.mark('bullets')
+        
         # Update camera
         self.camera.update(self.player.rect, dt)
         
         # Update background
-        self.background.update(self.camera.x)
+        self.background.update(self.camera.x * self.render_scale)
         
         # Update stopwatch
         self.stopwatch.update(dt)
         
-        # Update coins
-        for coin in self.coins:
-            if coin.update(dt, self.player.rect):
-                hp_gained = self.player.collect_coin()
-                if self.audio:
-                    self.audio.play_sfx('coin')
-                # No extra sound for HP gain - already played in collect_coin()
+        hitches.mark('camera')
         
-        # Update stars
-        for star in self.stars:
-            if star.update(dt, self.player.rect):
-                self.player.activate_flux_surge()
-                if self.audio:
-                    self.audio.play_sfx('powerup')
+        # Decide which entities are awake this frame
+        self.activity.begin_frame(dt, self.camera)
         
-        # Update power-ups (P icon - permanent double shot)
-        for powerup in self.powerups:
-            if powerup.update(dt, self.player.rect):
-                self.player.activate_double_shot()
-                if self.audio:
-                    self.audio.play_sfx('powerup')
+        # Update pickups (coins, stars, power-ups, storms) in one vectorized pass
+        pickups = self.collectibles.update(dt, self.player.rect, self.activity.active_span())
         
-        # Update storm powerups (energy - permanent stamina boost)
-        for storm in self.storms:
-            if storm.update(dt, self.player.rect):
-                self.player.activate_stamina_boost()
-                if self.audio:
-                    self.audio.play_sfx('powerup')
+        # Coins
+        for _ in pickups['coin']:
+            hp_gained = self.player.collect_coin()
+            if self.audio:
+                self.audio.play_sfx('coin')
+            # No extra sound for HP gain - already played in collect_coin()
+        
+        # Stars
+        for _ in pickups['star']:
+            self.player.activate_flux_surge()
+            if self.audio:
+                self.audio.play_sfx('powerup')
+        
+        # Power-ups (P icon - permanent double shot)
+        for _ in pickups['powerup']:
+            self.player.activate_double_shot()
+            if self.audio:
+                self.audio.play_sfx('powerup')
+        
+        # Storm powerups (energy - permanent stamina boost)
+        for _ in pickups['storm']:
+            self.player.activate_stamina_boost()
+            if self.audio:
+                self.audio.play_sfx('powerup')
         
         # Update storm visual effect
         if hasattr(self, 'storm_flash_timer') and self.storm_flash_timer > 0:
             self.storm_flash_timer -= dt
         
-        # Update breakable blocks
-        for block in self.breakables:
-            block.update(dt)
-            if block.is_solid() and block.rect.colliderect(self.player.rect):
-                # Check if player hits it
-                if abs(self.player.vel_y) > 50:  # Moving with some velocity
-                    item = block.hit('any')
-                    if item == 'coin':
-                        # Spawn coin above block
-                        coin = Coin(block.rect.centerx - 8, block.rect.top - 20)
-                        coin.initial_pos = (block.rect.centerx - 8, block.rect.top - 20)
-                        self.coins.append(coin)
-                    elif item == 'powerup':
-                        # Spawn power-up above block
-                        powerup = PowerUp(block.rect.centerx - 12, block.rect.top - 30)
-                        powerup.initial_pos = (block.rect.centerx - 12, block.rect.top - 30)
-                        self.powerups.append(powerup)
-        
-        # Update buttons
-        for button in self.buttons:
-            button.update(dt)
+        hitches.mark('pickups')
+        
+        # Update breakable blocks (awake ones only)
+        # (the player breaks them through CollisionSystem, see _spawn_block_contents)
+        for block, block_dt in self.activity.ticks('breakables'):
+            block.update(block_dt)
+        
+        # Update buttons (awake ones only)
+        for button, button_dt in self.activity.ticks('buttons'):
+            button.update(button_dt)
             # Check if player stomped button
             if button.check_stomp(self.player.rect, self.player.vel_y, self.player.gravity_dir):
                 button.activate()
@@ -363,34 +442,10 @@ class LevelState(GameState):
                 if self.audio:
                     self.audio.play_sfx('stomp')
         
-        # Update gates
-        for gate in self.gates:
-            gate.update(dt)
-            
-            # Check if gate blocks player movement (solid collision)
-            if gate.is_solid():
-                gate_rect = gate.get_collision_rect()
-                if gate_rect.colliderect(self.player.rect):
-                    # Push player out of gate
-                    overlap_x = min(self.player.rect.right, gate_rect.right) - max(self.player.rect.left, gate_rect.left)
-                    overlap_y = min(self.player.rect.bottom, gate_rect.bottom) - max(self.player.rect.top, gate_rect.top)
-                    
-                    # Push in direction of smallest overlap
-                    if overlap_x < overlap_y:
-                        # Push horizontally
-                        if self.player.rect.centerx < gate_rect.centerx:
-                            self.player.rect.right = gate_rect.left
-                        else:
-                            self.player.rect.left = gate_rect.right
-                        self.player.vel_x = 0
-                    else:
-                        # Push vertically
-                        if self.player.rect.centery < gate_rect.centery:
-                            self.player.rect.bottom = gate_rect.top
-                            self.player.on_ground = True
-                        else:
-                            self.player.rect.top = gate_rect.bottom
-                        self.player.vel_y = 0
+        # Update gates (awake ones only)
+        # (solid gates block movement through CollisionSystem)
+        for gate, gate_dt in self.activity.ticks('gates'):
+            gate.update(gate_dt)
             
             # Check gate collision (damage from spikes)
             if gate.check_collision(self.player.rect, self.player.gravity_dir, self.player.is_invulnerable()):
@@ -402,8 +457,16 @@ class LevelState(GameState):
                         if previous_hp >= 2 and self.player.hp == 1:
                             self.low_health_flash_timer = 0.35
         
-        # Check spike collisions
-        for spike in self.spikes:
+        hitches.mark('blocks_gates')
+        
+        # Check spike collisions (spikes the player has left forget their last contact,
+        # like Spikes.check_collision does for a spike that isn't touched)
+        nearby_spikes = self.hazard_layer.query(self.player.rect)
+        for spike in self.spike_contacts:
+            if spike not in nearby_spikes:
+                spike.dealt_damage = False
+        self.spike_contacts = nearby_spikes
+        for spike in nearby_spikes:
             if spike.check_collision(self.player.rect, self.player.gravity_dir, self.player.is_invulnerable()):
                 if not self.player.is_invulnerable():
                     previous_hp = self.player.hp
@@ -429,20 +492,24 @@ class LevelState(GameState):
         #     if self.player.vel_y < 0:  # If trying to jump
         #         self.player.vel_y *= 0.3  # Reduce jump power
         
-        # Update checkpoints
-        for checkpoint in self.checkpoints:
+        # Update checkpoints (only the ones the player can be touching)
+        for checkpoint in self.trigger_layer.query(self.player.rect):
             if checkpoint.update(dt, self.player.rect):
                 # Set checkpoint to middle of checkpoint position
                 self.player.set_checkpoint((checkpoint.rect.centerx - self.player.rect.width // 2, 
                                            checkpoint.rect.bottom - self.player.rect.height))
+                self.run_splits.append(self.stopwatch.get_time())
                 # Capture game state when checkpoint is activated
                 self._capture_checkpoint_state()
+                gc_policy.safe_point('checkpoint', generation=1)
                 if self.audio:
                     self.audio.play_sfx('checkpoint')
         
-        # Update enemies
-        for enemy in self.enemies:
-            enemy.update(dt, self.collision_system)
+        hitches.mark('hazards')
+        
+        # Update enemies (awake ones only; sleeping drones catch up on wake)
+        for enemy, enemy_dt in self.activity.ticks('enemies'):
+            enemy.update(enemy_dt, self.collision_system)
             
             # Check collision with player
             if enemy.alive and enemy.rect.colliderect(self.player.rect):
@@ -471,6 +538,11 @@ class LevelState(GameState):
                             if previous_hp >= 2 and self.player.hp == 1:
                                 self.low_health_flash_timer = 0.35
         
+        # Collected pickups, finished blocks and defeated drones leave the live lists
+        self.entities.compact()
+        
+        hitches.mark('enemies')
+        
         # Update boss (only if boss exists)
         if self.boss:
             if self.player.rect.right > self.boss.rect.left - 200:
@@ -524,6 +596,7 @@ class LevelState(GameState):
             if self.boss_door_open and self.boss.defeated and self.player.rect.x > settings.WORLD_WIDTH - 100:
                 from game.ui.win import WinState
                 self.clear_conditions.set_completion_time(self.stopwatch.get_time())
+                self.end_run('win')
                 self.stack.replace_with_transition(WinState, 
                                  coins=self.player.coins, 
                                  time=self.stopwatch.get_time(),
@@ -535,6 +608,7 @@ class LevelState(GameState):
             if self.player.rect.x > settings.WORLD_WIDTH - 100:
                 from game.ui.win import WinState
                 self.clear_conditions.set_completion_time(self.stopwatch.get_time())
+                self.end_run('win')
                 self.stack.replace_with_transition(WinState, 
                                  coins=self.player.coins, 
                                  time=self.stopwatch.get_time(),
@@ -542,8 +616,11 @@ class LevelState(GameState):
                                  level_id=self.level_id)
                 return
         
+        hitches.mark('boss')
+        
         # Check lose condition
         if not self.player.alive:
+            self.run_deaths += 1
             # Show lose screen with transition
             from game.ui.lose import LoseState
             self.stack.push_with_transition(LoseState)  # Push with transition
@@ -554,33 +631,45 @@ class LevelState(GameState):
     
     def draw(self, screen):
         """Draw level"""
-        # Draw parallax background
-        self.background.draw(screen)
+        # Draw parallax background and tiles (the columns on screen)
+        first_col = max(0, int(self.camera.x) // settings.TILE_SIZE - 1)
+        last_col = first_col + settings.SCREEN_WIDTH // settings.TILE_SIZE + 3
+        world = self.world_surface
+        if world is None:
+            self.background.draw(screen)
+            for row in self.tile_map:
+                for tile in row[first_col:last_col]:
+                    if tile:
+                        tile.draw(screen, self.camera)
+        else:
+            self.background.draw(world)
+            scale = self.render_scale
+            for row in self.tile_map:
+                for tile in row[first_col:last_col]:
+                    if tile:
+                        tile.draw(world, self.camera, scale)
+            pygame.transform.scale(world, screen.get_size(), screen)
         
-        # Draw tiles
-        for row in self.tile_map:
-            for tile in row:
-                if tile:
-                    tile.draw(screen, self.camera)
+        hitches.mark('draw_world')
         
         # Draw checkpoints
         for checkpoint in self.checkpoints:
             checkpoint.draw(screen, self.camera)
         
         # Draw coins
-        for coin in self.coins:
+        for coin in self.entities.live('coins'):
             coin.draw(screen, self.camera)
         
         # Draw stars
-        for star in self.stars:
+        for star in self.entities.live('stars'):
             star.draw(screen, self.camera)
         
         # Draw power-ups
-        for powerup in self.powerups:
+        for powerup in self.entities.live('powerups'):
             powerup.draw(screen, self.camera)
         
         # Draw breakable blocks
-        for block in self.breakables:
+        for block in self.entities.live('breakables'):
             block.draw(screen, self.camera)
         
         # Draw spikes
@@ -596,7 +685,7 @@ class LevelState(GameState):
             button.draw(screen, self.camera)
         
         # Draw enemies
-        for enemy in self.enemies:
+        for enemy in self.entities.live('enemies'):
             enemy.draw(screen, self.camera)
             # Draw hitbox if debug mode
             if self.show_hitboxes:
@@ -627,7 +716,7 @@ class LevelState(GameState):
             pygame.draw.rect(screen, (0, 255, 0), debug_rect, 2)
         
         # Draw storms
-        for storm in self.storms:
+        for storm in self.entities.live('storms'):
             storm.draw(screen, self.camera)
         
         # Low-health flash overlay when HP just dropped to 1
@@ -647,16 +736,18 @@ class LevelState(GameState):
             flash_surf.fill((255, 255, 255, alpha))
             screen.blit(flash_surf, (0, 0))
         
+        hitches.mark('draw_entities')
+        
         # Draw HUD
         boss_to_draw = self.boss if self.boss_active else None
         # Prepare entities for minimap overlay
         minimap_entities = {
             'bullets': self.bullets,
-            'coins': self.coins,
-            'stars': self.stars,
-            'powerups': self.powerups,
-            'storms': self.storms,
-            'enemies': self.enemies,
+            'coins': self.entities.live('coins'),
+            'stars': self.entities.live('stars'),
+            'powerups': self.entities.live('powerups'),
+            'storms': self.entities.live('storms'),
+            'enemies': self.entities.live('enemies'),
         }
         
         self.hud.draw(screen, self.player, boss=boss_to_draw, show_fps=True, 
@@ -664,9 +755,109 @@ class LevelState(GameState):
                      clear_conditions=self.clear_conditions, game_time=self.stopwatch.get_time(), camera=self.camera,
                      minimap_entities=minimap_entities, audio_manager=self.audio)
     
+    def _spawn_block_contents(self, block, item):
+        """BreakableBlock.on_break: drop what was inside the block"""
+        if item == 'coin':
+            # Spawn coin above block
+            coin = Coin(block.rect.centerx - 8, block.rect.top - 20)
+            coin.entity_id = len(self.coins)  # IDs continue after the loaded ones
+            self.collectibles.add(coin, 'coin')
+            self.entities.spawn('coins', coin)
+        elif item == 'powerup':
+            # Spawn power-up above block
+            powerup = PowerUp(block.rect.centerx - 12, block.rect.top - 30)
+            powerup.entity_id = len(self.powerups)
+            self.collectibles.add(powerup, 'powerup')
+            self.entities.spawn('powerups', powerup)
+    
+    def diagnostics(self):
+        """Entity counts for hitch snapshots: (live, total) per group"""
+        counts = {name: list(live_total) for name, live_total in self.entities.counts().items()}
+        counts['bullets'] = len(self.bullets)
+        if self.boss:
+            counts['boss_spikes'] = len(self.boss.spike_pool)
+        return {'level_id': self.level_id, 'entities': counts, 'game_time': round(self.stopwatch.get_time(), 3)}
+    
+    def get_nav_graph(self):
+        """Navigation graph for the gates as they are now (see game.world.navigation)"""
+        from game.world.navigation import get_nav_graph
+        open_gates = [gate.entity_id for gate in self.gates if gate.open]
+        return get_nav_graph(self.level_path, LevelLoader.load_template(self.level_path), open_gates)
+    
+    def end_run(self, outcome):
+        """Record this attempt in the run history (once)"""
+        if self.run_recorded:
+            return
+        self.run_recorded = True
+        from game.core.run_history import RunHistory
+        RunHistory.record(self.level_id, outcome, self.stopwatch.get_time(),
+                          deaths=self.run_deaths, splits=self.run_splits, coins=self.player.coins)
+    
+    # Entity lists that restart() puts back to their starting state
+    PRISTINE_GROUPS = ('coins', 'stars', 'powerups', 'storms', 'spikes', 'gates',
+                       'buttons', 'breakables', 'checkpoints', 'enemies')
+    
+    def _capture_pristine(self):
+        """Snapshot the freshly built level (see restart)"""
+        return {
+            'groups': {group: [capture_state(entity) for entity in getattr(self, group)]
+                       for group in self.PRISTINE_GROUPS},
+            'player': capture_state(self.player),
+            'boss': capture_state(self.boss) if self.boss else None,
+            'camera': capture_state(self.camera),
+            'clear_conditions': capture_state(self.clear_conditions),
+            'collectibles': self.collectibles.snapshot(),
+            'activity': self.activity.snapshot()
+        }
+    
+    def restart(self):
+        """Start the level over in place from the pristine snapshot
+        
+        Nothing is re-parsed or re-created: entity lists are cut back to their
+        spawn length (dropping pickups that came out of breakables) and every
+        object gets its starting attributes back.
+        """
+        from game.core.save_system import SaveSystem
+        pristine = self.pristine
+        for group, states in pristine['groups'].items():
+            entities = getattr(self, group)
+            del entities[len(states):]
+            for entity, state in zip(entities, states):
+                restore_state(entity, state)
+        self.collectibles.restore(pristine['collectibles'])
+        self.activity.restore(pristine['activity'])
+        self.entities.refresh()
+        restore_state(self.player, pristine['player'])
+        if self.boss:
+            restore_state(self.boss, pristine['boss'])
+        restore_state(self.camera, pristine['camera'])
+        restore_state(self.clear_conditions, pristine['clear_conditions'])
+        
+        self.bullets.clear()
+        self.spike_contacts = []
+        self.checkpoint_data = None
+        self.boss_active = False
+        self.boss_door_open = False
+        if self.boss_music_playing and self.audio:
+            self.audio.play_music(self.audio.MUSIC_GAME)
+        self.boss_music_playing = False
+        self.low_health_flash_timer = 0.0
+        self.storm_flash_timer = 0.0
+        
+        # New attempt
+        SaveSystem.start_level(self.level_id)
+        self.level_stats = SaveSystem.get_level_stats(self.level_id)
+        self.stopwatch.reset()
+        self.stopwatch.start()
+        self.run_deaths = 0
+        self.run_splits = []
+        self.run_recorded = False
+        
+        self.input_handler.reset_movement_inputs()
+    
     def _reset_to_checkpoint(self):
         """Reset level state when respawning from checkpoint"""
-        print("DEBUG: Resetting to checkpoint...")
+        _log.debug("Resetting to checkpoint")
         # Respawn player
         self.player.respawn()
         
@@ -675,7 +866,7 @@ class LevelState(GameState):
         
         # Restore from checkpoint data if it exists
         if self.checkpoint_data:
-            print("DEBUG: Restoring from checkpoint data")
+            _log.debug("Restoring from checkpoint data")
             # Restore player state
             player_state = self.checkpoint_data['player']
             self.player.hp = settings.PLAYER_HP  # Always restore to max HP on respawn
@@ -687,80 +878,14 @@ class LevelState(GameState):
             self.player.last_hp_bonus_at = player_state['last_hp_bonus_at']
             
             # Restore enemy states - keep dead enemies dead
-            dead_enemy_positions = set(tuple(pos) if isinstance(pos, list) else pos
-                           for pos in self.checkpoint_data['dead_enemies'])
-
-            for enemy in self.enemies:
-                if enemy.initial_pos in dead_enemy_positions:
-                    enemy.alive = False
-                    enemy.hp = 0
-                else:
-                    enemy.alive = True
-                    enemy.hp = 1
+            self._apply_checkpoint_flags(('enemies',))
             
             # Restore enemies_defeated count
             if 'enemies_defeated' in self.checkpoint_data:
                 self.clear_conditions.enemies_defeated = self.checkpoint_data['enemies_defeated']
             
-            # Restore collected items - keep them collected
-            collected_coin_positions = set(tuple(pos) if isinstance(pos, list) else pos
-                               for pos in self.checkpoint_data['collected_coins'])
-            for coin in self.coins:
-                if hasattr(coin, 'initial_pos'):
-                    coin.collected = coin.initial_pos in collected_coin_positions
-
-            collected_star_positions = set(tuple(pos) if isinstance(pos, list) else pos
-                               for pos in self.checkpoint_data['collected_stars'])
-            for star in self.stars:
-                if hasattr(star, 'initial_pos'):
-                    star.collected = star.initial_pos in collected_star_positions
-
-            collected_powerup_positions = set(tuple(pos) if isinstance(pos, list) else pos
-                               for pos in self.checkpoint_data['collected_powerups'])
-            for powerup in self.powerups:
-                if hasattr(powerup, 'initial_pos'):
-                    powerup.collected = powerup.initial_pos in collected_powerup_positions
-
-            collected_storm_positions = set(tuple(pos) if isinstance(pos, list) else pos
-                               for pos in self.checkpoint_data['collected_storms'])
-            for storm in self.storms:
-                if hasattr(storm, 'initial_pos'):
-                    storm.collected = storm.initial_pos in collected_storm_positions
-            
-            # Restore broken blocks
-            broken_block_positions = set(tuple(pos) if isinstance(pos, list) else pos
-                           for pos in self.checkpoint_data['broken_blocks'])
-            for block in self.breakables:
-                block.broken = block.initial_pos in broken_block_positions
-            
-            # Restore button/gate states
-            button_states_raw = self.checkpoint_data['button_states']
-            button_states = {}
-            for key, value in button_states_raw.items():
-                if isinstance(key, str):
-                    import ast
-                    try:
-                        key = tuple(ast.literal_eval(key))
-                    except:
-                        pass
-                elif isinstance(key, list):
-                    key = tuple(key)
-                button_states[key] = value
-
-            
-            gate_states_raw = self.checkpoint_data['gate_states']
-            gate_states = {}
-            for key, value in gate_states_raw.items():
-                if isinstance(key, str):
-                    import ast
-                    try:
-                        key = tuple(ast.literal_eval(key))
-                    except:
-                        pass
-                elif isinstance(key, list):
-                    key = tuple(key)
-                gate_states[key] = value
-
+            # Restore collected items and broken blocks (buttons/gates keep their current state)
+            self._apply_checkpoint_flags(('coins', 'stars', 'powerups', 'storms', 'breakables'))
             
             # Restore boss state
             boss_state = self.checkpoint_data['boss_state']
@@ -776,19 +901,9 @@ class LevelState(GameState):
             # No checkpoint data - reset to fresh state (original behavior)
             for enemy in self.enemies:
                 enemy.alive = True
-                enemy.hp = 1
-            
-            for coin in self.coins:
-                coin.collected = False
-            
-            for star in self.stars:
-                star.collected = False
             
-            for powerup in self.powerups:
-                powerup.collected = False
-            
-            for storm in self.storms:
-                storm.collected = False
+            # Every pickup lives in the store: one bulk reset
+            self.collectibles.reset_collected()
             
             self.clear_conditions.enemies_defeated = 0
             self.player.coins = 0
@@ -804,10 +919,13 @@ class LevelState(GameState):
                 self.boss.phase_timer.stop()
                 self.boss.beam_rotation = 0
                 self.boss.spike_attack_timer = 0
-                self.boss.animated_spikes.clear()
+                self.boss.spike_pool.clear()
                 self.boss_door_open = False
                 self.boss_music_playing = False
         
+        # Bring back entities the restore revived
+        self.entities.refresh()
+        
         # Reset input states so keys aren't stuck
         self.input_handler.reset_movement_inputs()
         
@@ -820,7 +938,7 @@ class LevelState(GameState):
         if not self.checkpoint_data:
             return
         
-        print("DEBUG: Applying checkpoint data...")
+        _log.debug("Applying checkpoint data")
         
         # Restore player state
         player_state = self.checkpoint_data.get('player', {})
@@ -836,87 +954,19 @@ class LevelState(GameState):
             # Move player to checkpoint
             self.player.rect.x, self.player.rect.y = self.player.checkpoint_pos
         
-        # Restore enemy states (convert lists back to tuples for hashing)
-        dead_enemy_positions = set(tuple(pos) if isinstance(pos, list) else pos 
-                                   for pos in self.checkpoint_data.get('dead_enemies', []))
-        for enemy in self.enemies:
-            if hasattr(enemy, 'initial_pos'):
-                if enemy.initial_pos in dead_enemy_positions:
+        # Restore enemy states (only kills; everything spawned alive)
+        enemy_flags = self.checkpoint_data['flags'].get('enemies')
+        if enemy_flags is not None:
+            for enemy in self.enemies:
+                if enemy.entity_id < len(enemy_flags) and not enemy_flags[enemy.entity_id]:
                     enemy.alive = False
-                    enemy.hp = 0
         
         # Restore enemies_defeated count for clear conditions
         if 'enemies_defeated' in self.checkpoint_data:
             self.clear_conditions.enemies_defeated = self.checkpoint_data['enemies_defeated']
         
-        # Restore collected items (convert lists back to tuples for hashing)
-        collected_coin_positions = set(tuple(pos) if isinstance(pos, list) else pos 
-                                       for pos in self.checkpoint_data.get('collected_coins', []))
-        for coin in self.coins:
-            if hasattr(coin, 'initial_pos'):
-                coin.collected = coin.initial_pos in collected_coin_positions
-        
-        collected_star_positions = set(tuple(pos) if isinstance(pos, list) else pos 
-                                       for pos in self.checkpoint_data.get('collected_stars', []))
-        for star in self.stars:
-            if hasattr(star, 'initial_pos'):
-                star.collected = star.initial_pos in collected_star_positions
-        
-        collected_powerup_positions = set(tuple(pos) if isinstance(pos, list) else pos 
-                                          for pos in self.checkpoint_data.get('collected_powerups', []))
-        for powerup in self.powerups:
-            if hasattr(powerup, 'initial_pos'):
-                powerup.collected = powerup.initial_pos in collected_powerup_positions
-        
-        collected_storm_positions = set(tuple(pos) if isinstance(pos, list) else pos 
-                                        for pos in self.checkpoint_data.get('collected_storms', []))
-        for storm in self.storms:
-            if hasattr(storm, 'initial_pos'):
-                storm.collected = storm.initial_pos in collected_storm_positions
-        
-        # Restore broken blocks (convert lists back to tuples for hashing)
-        broken_block_positions = set(tuple(pos) if isinstance(pos, list) else pos 
-                                     for pos in self.checkpoint_data.get('broken_blocks', []))
-        for block in self.breakables:
-            if hasattr(block, 'initial_pos'):
-                block.broken = block.initial_pos in broken_block_positions
-        
-        # Restore button/gate states (convert string keys back to tuples if needed)
-        button_states_raw = self.checkpoint_data.get('button_states', {})
-        button_states = {}
-        for key, value in button_states_raw.items():
-            # Convert string representation back to tuple if needed
-            if isinstance(key, str):
-                # JSON converts tuple keys to strings like "[x, y]"
-                import ast
-                try:
-                    key = tuple(ast.literal_eval(key))
-                except:
-                    pass
-            elif isinstance(key, list):
-                key = tuple(key)
-            button_states[key] = value
-        
-        for button in self.buttons:
-            if hasattr(button, 'initial_pos') and button.initial_pos in button_states:
-                button.pressed = button_states[button.initial_pos]
-        
-        gate_states_raw = self.checkpoint_data.get('gate_states', {})
-        gate_states = {}
-        for key, value in gate_states_raw.items():
-            if isinstance(key, str):
-                import ast
-                try:
-                    key = tuple(ast.literal_eval(key))
-                except:
-                    pass
-            elif isinstance(key, list):
-                key = tuple(key)
-            gate_states[key] = value
-        
-        for gate in self.gates:
-            if hasattr(gate, 'initial_pos') and gate.initial_pos in gate_states:
-                gate.open = gate_states[gate.initial_pos]
+        # Restore collected items, broken blocks and button/gate states
+        self._apply_checkpoint_flags(('coins', 'stars', 'powerups', 'storms', 'breakables', 'buttons', 'gates'))
         
         # Restore boss state
         boss_state = self.checkpoint_data.get('boss_state')
@@ -927,34 +977,29 @@ class LevelState(GameState):
             self.boss.alive = boss_state.get('alive', True)
             self.boss_door_open = boss_state.get('defeated', False)
         
+        # Drop collected/dead entities from the live lists
+        self.entities.refresh()
+        
         # Restore game time if available
         if 'game_time' in self.checkpoint_data:
             # Note: Stopwatch doesn't have a direct set method, would need to add one
             pass
     
+    def _apply_checkpoint_flags(self, groups):
+        """Restore snapshot flags for the given entity groups (missing groups are left alone)"""
+        flags = self.checkpoint_data['flags']
+        for group in groups:
+            if group in flags:
+                restore_flags(getattr(self, group), SNAPSHOT_FLAGS[group], flags[group])
+    
     def _capture_checkpoint_state(self):
         """Capture current game state when checkpoint is activated"""
-        print("DEBUG: Capturing checkpoint state...")
-        # Capture dead enemies by their initial positions
-        dead_enemies = []
-        for enemy in self.enemies:
-            if not enemy.alive:
-                dead_enemies.append(enemy.initial_pos)
-        print(f"DEBUG: Dead enemies: {len(dead_enemies)}")
-        
-        # Capture collected items by their initial positions
-        collected_coins = [coin.initial_pos for coin in self.coins if coin.collected and hasattr(coin, 'initial_pos')]
-        collected_stars = [star.initial_pos for star in self.stars if star.collected and hasattr(star, 'initial_pos')]
-        collected_powerups = [powerup.initial_pos for powerup in self.powerups if powerup.collected and hasattr(powerup, 'initial_pos')]
-        collected_storms = [storm.initial_pos for storm in self.storms if storm.collected and hasattr(storm, 'initial_pos')]
-        print(f"DEBUG: Collected coins: {len(collected_coins)}, stars: {len(collected_stars)}, powerups: {len(collected_powerups)}, storms: {len(collected_storms)}")
-        
-        # Capture broken blocks
-        broken_blocks = [block.initial_pos for block in self.breakables if block.broken]
-        
-        # Capture button/gate states (convert tuple keys to strings for JSON compatibility)
-        button_states = {str(btn.initial_pos): btn.pressed for btn in self.buttons}
-        gate_states = {str(gate.initial_pos): gate.open for gate in self.gates}
+        # One flag byte per entity, indexed by entity_id
+        flags = {group: capture_flags(getattr(self, group), attr) for group, attr in SNAPSHOT_FLAGS.items()}
+        if _log.on_debug:
+            _log.debug("Checkpoint: dead enemies %d, collected coins %d, stars %d, powerups %d, storms %d",
+                       flags['enemies'].count(0), flags['coins'].count(1), flags['stars'].count(1),
+                       flags['powerups'].count(1), flags['storms'].count(1))
         
         # Capture boss state if exists
         boss_state = None
@@ -981,14 +1026,7 @@ class LevelState(GameState):
         # Store all state in checkpoint_data
         self.checkpoint_data = {
             'player': player_state,
-            'dead_enemies': dead_enemies,
-            'collected_coins': collected_coins,
-            'collected_stars': collected_stars,
-            'collected_powerups': collected_powerups,
-            'collected_storms': collected_storms,
-            'broken_blocks': broken_blocks,
-            'button_states': button_states,
-            'gate_states': gate_states,
+            'flags': flags,
             'boss_state': boss_state,
             'game_time': self.stopwatch.get_time(),
             'enemies_defeated': self.clear_conditions.enemies_defeated
@@ -996,31 +1034,20 @@ class LevelState(GameState):
     
     def _activate_storm_effect(self):
         """Activate storm effect - clear enemies in large radius"""
-        print("Storm effect activated!")  # Debug output
         
         # Add visual flash effect
         self.storm_flash_timer = 0.5  # Flash for 0.5 seconds
         
         # Calculate storm radius - INCREASED to 50% of screen height for better effect
         storm_radius = int(settings.SCREEN_HEIGHT * 0.5)  # 360 pixels (was 144)
-        print(f"Storm radius: {storm_radius} pixels")  # Debug output
         
         # Get player position
         player_center = self.player.rect.center
-        print(f"Player position: {player_center}")  # Debug output
-        
-        # Debug: Show all enemies and their distances
-        print(f"Total enemies: {len(self.enemies)}")
-        for i, enemy in enumerate(self.enemies):
-            if enemy.alive:
-                enemy_center = enemy.rect.center
-                distance = ((player_center[0] - enemy_center[0]) ** 2 + 
-                           (player_center[1] - enemy_center[1]) ** 2) ** 0.5
-                print(f"Enemy {i}: pos={enemy_center}, distance={distance:.1f}, within_radius={distance <= storm_radius}")
+        _log.debug("Storm effect at %s, radius %d px", player_center, storm_radius)
         
         # Clear enemies within storm radius
         enemies_cleared = 0
-        for enemy in self.enemies[:]:  # Use slice to avoid modification during iteration
+        for enemy in self.entities.live('enemies'):
             if enemy.alive:
                 # Calculate distance from player to enemy
                 enemy_center = enemy.rect.center
@@ -1029,10 +1056,11 @@ class LevelState(GameState):
                 
                 if distance <= storm_radius:
                     # Enemy is within storm radius - defeat it
-                    print(f"Clearing enemy at distance {distance:.1f}")  # Debug output
+                    if _log.on_debug:
+                        _log.debug("Clearing enemy at %s, distance %.1f", enemy_center, distance)
                     enemy.alive = False
                     enemies_cleared += 1
                     self.clear_conditions.defeat_enemy()
         
         # Visual feedback - could add screen flash or particles here
-        print(f"Storm cleared {enemies_cleared} enemies!")
+        _log.info("Storm cleared %d enemies", enemies_cleared)
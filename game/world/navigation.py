@@ -0,0 +1,400 @@
+"""
+Gravity-aware navigation graph and A* path queries
+
+Nodes are the tile cells the player can stand in: (col, row, gravity_dir)
+with ground under them, or over them when gravity is flipped. Edges come
+from simulating the player's own movement (same speeds, GRAVITY,
+PLAYER_JUMP_IMPULSE, fall cap, rounding and collision resolution as
+Player._move) for a fixed set of MOVES from every node: running off or
+along a ledge, jumping, flipping gravity and jumping with a flip at the
+top, holding a direction for the whole move or letting go early. Solidity
+follows Tile.is_solid_for_gravity (solid_up/solid_down), so one-way tiles
+work. Edge cost is the move's duration in seconds; moves that touch a
+hazard cost HAZARD_COST more.
+
+Closed gates are passed in as extra solids and spikes as hazards (see
+from_level_data), so a graph describes one gate setup. Intact breakable
+blocks are solid too, except that a simulated move that runs into one with
+more than BREAK_SPEED of vertical speed breaks it (BreakableBlock.on_contact)
+and may carry on through its cell. The player still stops against it on that
+frame, and a landing on a block it just broke keeps falling. Later moves see
+the block intact again, so a way up that needs a block broken from below
+first isn't in the graph.
+Building takes a few seconds, so graphs are cached in NAV_CACHE_DIR under a
+hash of everything they depend on (the solid cells, hazards, movement
+constants and MOVES); build_assets precomputes them for every level.
+Graphs never change once built, so queries can be repeated every frame:
+
+    graph = get_nav_graph(level_path, level_data)
+    path = graph.find_path(graph.node_at(player.rect, player.gravity_dir), graph.node_at(goal_rect, 1))
+    for node, move in path: ...  # MOVES[move] takes you to node
+"""
+import hashlib
+import heapq
+import json
+import math
+import os
+import pygame
+from game.core import settings
+from game.core.log import get_log
+
+_log = get_log('nav')
+
+PLAYER_SIZE = (24, 32)  # Player rect
+HAZARD_COST = 5.0  # Seconds added to moves that touch spikes
+MAX_AIR_TIME = 3.0  # Seconds a simulated move may spend in the air (stamina lasts STAMINA_MAX_TIME)
+PATH_CACHE_SIZE = 256  # Remembered find_path results
+NAV_CACHE_DIR = 'game/assets/build/nav'
+NAV_VERSION = 2  # Bump when the simulation changes
+BREAK_SPEED = 50  # px/s of vertical speed that breaks a block on contact (BreakableBlock.on_contact)
+
+# Values in NavGraph.solid
+SOLID = 1
+BREAKABLE = 2  # Solid until a move breaks it
+
+# (kind, jump, flip, direction, frames the direction is held or None for the whole move)
+MOVES = [('run', False, None, d, None) for d in (-1, 1)]
+for _kind, _jump, _flip in (('jump', True, None), ('flip', False, 'start'), ('jump_flip', True, 'apex')):
+    MOVES.append((_kind, _jump, _flip, 0, None))
+    for _d in (-1, 1):
+        MOVES += [(_kind, _jump, _flip, _d, hold) for hold in (None, 8, 16)]
+
+
+def _round(value):
+    """Rect coordinates round half away from zero"""
+    return int(value + 0.5) if value >= 0 else -int(0.5 - value)
+
+
+class NavGraph:
+    """Standable cells and the simulated moves between them (see module docstring)"""
+
+    def __init__(self, tile_map, solids=(), hazards=(), breakables=(), cache_dir=None):
+        self.rows = len(tile_map)
+        self.cols = len(tile_map[0]) if tile_map else 0
+
+        # Solid cells per gravity direction; extra solids block both ways
+        self.solid = {1: [bytearray(self.cols) for _ in range(self.rows)],
+                      -1: [bytearray(self.cols) for _ in range(self.rows)]}
+        for row, tiles in enumerate(tile_map):
+            for col, tile in enumerate(tiles):
+                if tile is not None:
+                    self.solid[1][row][col] = tile.is_solid_for_gravity(1)
+                    self.solid[-1][row][col] = tile.is_solid_for_gravity(-1)
+        for rect in solids:
+            for row, col in self._cells(rect):
+                self.solid[1][row][col] = self.solid[-1][row][col] = SOLID
+        for rect in breakables:
+            for row, col in self._cells(rect):
+                if not self.solid[1][row][col]:
+                    self.solid[1][row][col] = self.solid[-1][row][col] = BREAKABLE
+        self.hazard_cells = {cell for rect in hazards for cell in self._cells(rect)}
+        self._paths = {}
+        self.key = self._cache_key()
+        if cache_dir and self._load(cache_dir):
+            self._set_heuristic()
+            return
+
+        # Nodes
+        self.nodes = []  # (col, row, gravity_dir)
+        self.index = {}  # node -> index
+        for gravity in (1, -1):
+            solid = self.solid[gravity]
+            for row in range(self.rows):
+                support = row + gravity
+                if not 0 <= support < self.rows:
+                    continue
+                for col in range(self.cols):
+                    if solid[support][col] and not solid[row][col] and (row, col) not in self.hazard_cells:
+                        self.index[(col, row, gravity)] = len(self.nodes)
+                        self.nodes.append((col, row, gravity))
+
+        # Edges: the cheapest move to each neighbour
+        self.edges = []  # node index -> [(target index, cost, move index)]
+        for node, (col, row, gravity) in enumerate(self.nodes):
+            best = {}
+            for move_index, move in enumerate(MOVES):
+                landing = self._simulate(col, row, gravity, move)
+                if landing is not None and landing[0] != node:  # Not back where it started
+                    target, cost = landing
+                    if target not in best or cost < best[target][0]:
+                        best[target] = (cost, move_index)
+            self.edges.append([(target, cost, move) for target, (cost, move) in best.items()])
+        _log.debug("Navigation graph: %d nodes, %d edges", len(self.nodes), sum(map(len, self.edges)))
+        self._set_heuristic()
+        if cache_dir:
+            self._save(cache_dir)
+
+    def _set_heuristic(self):
+        """Fewest seconds any edge spends per column and per row, so A*'s estimate never overshoots"""
+        per_col = per_row = math.inf
+        nodes = self.nodes
+        for (col, row, _), edges in zip(nodes, self.edges):
+            for target, cost, _ in edges:
+                col_to, row_to, _ = nodes[target]
+                if col_to != col:
+                    per_col = min(per_col, cost / abs(col_to - col))
+                if row_to != row:
+                    per_row = min(per_row, cost / abs(row_to - row))
+        self.seconds_per_col = 0.0 if per_col == math.inf else per_col
+        self.seconds_per_row = 0.0 if per_row == math.inf else per_row
+
+    def _cache_key(self):
+        digest = hashlib.sha1()
+        constants = [NAV_VERSION, MOVES, PLAYER_SIZE, HAZARD_COST, MAX_AIR_TIME, settings.TILE_SIZE, settings.FPS,
+                     settings.GRAVITY, settings.PLAYER_RUN_SPEED, settings.PLAYER_JUMP_IMPULSE,
+                     settings.WORLD_WIDTH, settings.WORLD_HEIGHT, sorted(self.hazard_cells)]
+        digest.update(json.dumps(constants).encode())
+        for gravity in (1, -1):
+            for row in self.solid[gravity]:
+                digest.update(row)
+        return digest.hexdigest()
+
+    def _load(self, cache_dir):
+        path = os.path.join(cache_dir, f'{self.key}.json')
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            _log.warning("Ignoring navigation cache %s: %s", path, e)
+            return False
+        self.nodes = [tuple(node) for node in data['nodes']]
+        self.index = {node: index for index, node in enumerate(self.nodes)}
+        self.edges = [[tuple(edge) for edge in edges] for edges in data['edges']]
+        return True
+
+    def _save(self, cache_dir):
+        path = os.path.join(cache_dir, f'{self.key}.json')
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(f'{path}.tmp', 'w') as f:
+                json.dump({'nodes': self.nodes, 'edges': self.edges}, f, separators=(',', ':'))
+            os.replace(f'{path}.tmp', path)
+        except OSError as e:
+            _log.warning("Could not write navigation cache %s: %s", path, e)
+
+    def _cells(self, rect):
+        """(row, col) of the map cells a world rect overlaps"""
+        size = settings.TILE_SIZE
+        return [(row, col)
+                for row in range(max(0, rect.top // size), min(self.rows, (rect.bottom - 1) // size + 1))
+                for col in range(max(0, rect.left // size), min(self.cols, (rect.right - 1) // size + 1))]
+
+    def node_position(self, node):
+        """Top-left of the player rect standing on a node"""
+        col, row, gravity = self.nodes[node] if isinstance(node, int) else node
+        size = settings.TILE_SIZE
+        width, height = PLAYER_SIZE
+        return col * size + (size - width) // 2, (row + 1) * size - height if gravity == 1 else row * size
+
+    def _simulate(self, col, row, gravity, move, trace=None):
+        """Play a move from a node; (target node index, cost) where it lands, or None
+
+        trace, if given, gets (x, y, vel_y, gravity_dir) of the player rect every frame.
+        """
+        kind, jump, flip, direction, hold = move
+        size = settings.TILE_SIZE
+        width, height = PLAYER_SIZE
+        dt = 1.0 / settings.FPS
+        cols, rows = self.cols, self.rows
+        world_width, world_height = settings.WORLD_WIDTH, settings.WORLD_HEIGHT
+        speed = settings.PLAYER_RUN_SPEED
+        hazards = self.hazard_cells
+        x, y = self.node_position((col, row, gravity))
+        vel_y = 0.0
+        if jump:
+            vel_y = -settings.PLAYER_JUMP_IMPULSE * gravity
+        start = (col, row, gravity)
+        if flip == 'start':
+            gravity = -gravity
+        left_ground = flip is not None or jump
+        touched_hazard = False
+        broken = set()  # Breakable cells this move has broken
+
+        def blocks(r, c):
+            cell = solid[r][c]
+            return cell == SOLID or cell == BREAKABLE and (r, c) not in broken
+
+        def hit(r, c):
+            """Run into a blocking cell; True if that breaks it (it still stops the player this frame)"""
+            if solid[r][c] == BREAKABLE and abs(vel_y) > BREAK_SPEED:
+                broken.add((r, c))
+                return True
+            return False
+
+        for frame in range(1, int(MAX_AIR_TIME * settings.FPS) + 1):
+            solid = self.solid[gravity]
+            vel_x = direction * speed if hold is None or frame <= hold else 0
+            if flip == 'apex' and vel_y * gravity >= 0:
+                gravity = -gravity
+                vel_y *= 0.5
+                flip = None
+                solid = self.solid[gravity]
+            vel_y += settings.GRAVITY * gravity * dt
+            vel_y = min(vel_y, 600) if gravity == 1 else max(vel_y, -600)
+
+            # Horizontal
+            x = min(max(0, _round(x + vel_x * dt)), world_width - width)
+            top_row, bottom_row = max(0, y // size), min(rows - 1, (y + height - 1) // size)
+            left_col, right_col = max(0, x // size), min(cols - 1, (x + width - 1) // size)
+            if vel_x:
+                for r in range(top_row, bottom_row + 1):
+                    c = right_col if vel_x > 0 else left_col
+                    if not blocks(r, c):
+                        continue
+                    if vel_x > 0 and x + width > right_col * size:
+                        x = right_col * size - width
+                    elif vel_x < 0 and x < (left_col + 1) * size:
+                        x = (left_col + 1) * size
+                    else:
+                        continue
+                    hit(r, c)
+                left_col, right_col = max(0, x // size), min(cols - 1, (x + width - 1) // size)
+
+            # Vertical
+            y = min(max(0, _round(y + vel_y * dt)), world_height - height)
+            top_row, bottom_row = max(0, y // size), min(rows - 1, (y + height - 1) // size)
+            on_ground = False
+            if vel_y > 0 and y + height > bottom_row * size:
+                hits = [c for c in range(left_col, right_col + 1) if blocks(bottom_row, c)]
+                if hits:
+                    y = bottom_row * size - height
+                    # Standing only on blocks that just broke means falling through next frame
+                    kept = [c for c in hits if not hit(bottom_row, c)]
+                    on_ground = gravity == 1 and bool(kept)
+                    vel_y = 0.0
+            elif vel_y < 0 and y < (top_row + 1) * size:
+                hits = [c for c in range(left_col, right_col + 1) if blocks(top_row, c)]
+                if hits:
+                    y = (top_row + 1) * size
+                    kept = [c for c in hits if not hit(top_row, c)]
+                    on_ground = gravity == -1 and bool(kept)
+                    vel_y = 0.0
+
+            if hazards and not touched_hazard:
+                top_row, bottom_row = y // size, (y + height - 1) // size
+                left_col, right_col = x // size, (x + width - 1) // size
+                touched_hazard = any((r, c) in hazards for r in range(top_row, bottom_row + 1)
+                                     for c in range(left_col, right_col + 1))
+
+            if trace is not None:
+                trace.append((x, y, vel_y, gravity))
+
+            if not on_ground and not left_ground:
+                # Walking: standing on ground this frame's velocity didn't push into yet
+                support = (y + height) // size if gravity == 1 else y // size - 1
+                edge = y + height == support * size if gravity == 1 else y == (support + 1) * size
+                on_ground = edge and 0 <= support < rows and any(blocks(support, c) for c in range(left_col, right_col + 1))
+            if not on_ground:
+                left_ground = True
+                continue
+            landed_row = (y + height) // size - 1 if gravity == 1 else y // size
+            for landed_col in ((x + width // 2) // size, x // size, (x + width - 1) // size):
+                target = self.index.get((landed_col, landed_row, gravity))
+                if target is not None:
+                    break
+            if target is None:
+                return None
+            if self.nodes[target] == start and not left_ground:
+                continue  # Still walking across the start cell
+            return target, frame * dt + (HAZARD_COST if touched_hazard else 0.0)
+        return None
+
+    def trace_move(self, node, move):
+        """(node index it lands on or None, [(x, y, vel_y, gravity_dir) per frame]) for MOVES[move] from node"""
+        trace = []
+        landing = self._simulate(*self.nodes[node], MOVES[move], trace)
+        return (None if landing is None else landing[0]), trace
+
+    def node_at(self, rect, gravity_dir):
+        """Node the player (or anything that size) at rect is standing on or above, or None"""
+        size = settings.TILE_SIZE
+        col = rect.centerx // size
+        row = rect.bottom // size - 1 if gravity_dir == 1 else rect.top // size
+        row = min(max(row, 0), self.rows - 1)
+        # Airborne: the first node below (or above, flipped) in the same column
+        while 0 <= row < self.rows:
+            for c in (col, rect.left // size, (rect.right - 1) // size):
+                node = self.index.get((c, row, gravity_dir))
+                if node is not None:
+                    return node
+            row += gravity_dir
+        return None
+
+    def find_path(self, start, goal):
+        """[(node, move index), ...] from start to goal (both node indices), [] if already there, None if unreachable"""
+        if start is None or goal is None:
+            return None
+        key = (start, goal)
+        path = self._paths.get(key)
+        if path is not None or key in self._paths:
+            return path
+
+        nodes, edges = self.nodes, self.edges
+        col_goal, row_goal, _ = nodes[goal]
+        per_col, per_row = self.seconds_per_col, self.seconds_per_row
+        came_from = {start: None}
+        cost_so_far = {start: 0.0}
+        frontier = [(0.0, start)]
+        while frontier:
+            _, current = heapq.heappop(frontier)
+            if current == goal:
+                break
+            current_cost = cost_so_far[current]
+            for target, cost, move in edges[current]:
+                new_cost = current_cost + cost
+                if new_cost < cost_so_far.get(target, math.inf):
+                    cost_so_far[target] = new_cost
+                    came_from[target] = (current, move)
+                    col, row, _ = nodes[target]
+                    estimate = max(abs(col - col_goal) * per_col, abs(row - row_goal) * per_row)
+                    heapq.heappush(frontier, (new_cost + estimate, target))
+
+        if goal in came_from:
+            path = []
+            node = goal
+            while came_from[node] is not None:
+                previous, move = came_from[node]
+                path.append((node, move))
+                node = previous
+            path.reverse()
+        else:
+            path = None
+        if len(self._paths) >= PATH_CACHE_SIZE:
+            self._paths.clear()
+        self._paths[key] = path
+        return path
+
+    def reachable(self, start):
+        """Set of node indices reachable from start"""
+        seen = {start}
+        pending = [start]
+        while pending:
+            for target, _, _ in self.edges[pending.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+        return seen
+
+    @classmethod
+    def from_level_data(cls, level_data, open_gates=(), cache_dir=None):
+        """Graph for parsed level data; gates whose ids are in open_gates count as open, breakable blocks intact"""
+        size = settings.TILE_SIZE
+        solids = [pygame.Rect(gate['x'], gate['y'], size, gate['height'])
+                  for gate in level_data.get('gates', []) if gate['id'] not in open_gates]
+        hazards = [pygame.Rect(spike['x'], spike['y'], size, size) for spike in level_data.get('spikes', [])]
+        breakables = [pygame.Rect(block['x'], block['y'], size, size) for block in level_data.get('breakables', [])]
+        return cls(level_data['tile_map'], solids, hazards, breakables, cache_dir=cache_dir)
+
+
+_graphs = {}  # (level path, open gates) -> NavGraph
+
+
+def get_nav_graph(level_path, level_data, open_gates=()):
+    """Shared graph for a level template and gate setup, loaded or built on first use"""
+    key = (level_path, frozenset(open_gates))
+    graph = _graphs.get(key)
+    if graph is None:
+        graph = _graphs[key] = NavGraph.from_level_data(level_data, open_gates, NAV_CACHE_DIR)
+    return graph
@@ -1,6 +1,7 @@
 """
 Tile representation with solidity masks
 """
+import math
 import pygame
 from game.core import settings
 
@@ -8,6 +9,8 @@ from game.core import settings
 class Tile:
     """Individual tile with gravity-aware collision"""
     
+    __slots__ = ('tile_id', 'rect', 'solid_up', 'solid_down', 'breakable', 'charged_face', 'broken', 'color')
+    
     def __init__(self, tile_id, x, y, solid_up=True, solid_down=True, breakable=False, charged_face=None):
         self.tile_id = tile_id
         self.rect = pygame.Rect(x, y, settings.TILE_SIZE, settings.TILE_SIZE)
@@ -64,14 +67,19 @@ class Tile:
         self.solid_up = False
         self.solid_down = False
     
-    def draw(self, screen, camera):
-        """Draw tile"""
+    def draw(self, screen, camera, scale=1.0):
+        """Draw tile (scale: size of the target surface relative to the screen, see LevelState.render_scale)"""
         if self.broken or self.color is None:
             return
         
         draw_rect = self.rect.copy()
         draw_rect.x -= camera.x
         draw_rect.y -= camera.y
+        if scale != 1.0:
+            # Edges snap to the scaled pixel grid so neighbouring tiles don't leave gaps
+            left, top = math.floor(draw_rect.left * scale), math.floor(draw_rect.top * scale)
+            draw_rect = pygame.Rect(left, top, math.floor(draw_rect.right * scale) - left,
+                                    math.floor(draw_rect.bottom * scale) - top)
         
         pygame.draw.rect(screen, self.color, draw_rect)
         
@@ -80,12 +88,12 @@ class Tile:
         
         # Draw charged face indicator for breakable panels
         if self.breakable and self.charged_face:
-            self._draw_charged_indicator(screen, draw_rect)
+            self._draw_charged_indicator(screen, draw_rect, scale)
     
-    def _draw_charged_indicator(self, screen, draw_rect):
+    def _draw_charged_indicator(self, screen, draw_rect, scale=1.0):
         """Draw chevron showing charged face"""
         cx, cy = draw_rect.centerx, draw_rect.centery
-        size = 6
+        size = 6 * scale
         
         if self.charged_face == 'up':
             points = [(cx, cy - size), (cx - size, cy), (cx + size, cy)]